@@ -1,31 +1,111 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from database import get_database
 from models import UserInDB, TokenData
-from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from config import (
+    SECRET_KEY,
+    ALGORITHM,
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    AUTH_TRUST_TOKEN_CLAIMS,
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_WORKERS
+)
+from user_cache import user_cache
 import logging
 from bson import ObjectId
 
 logger = logging.getLogger(__name__)
 
-# 패스워드 해싱 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 패스워드 해싱 설정 (bcrypt 비용은 BCRYPT_ROUNDS로 조정, 기존 해시는 자체 비용으로 검증)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
 
 # JWT Bearer 토큰 스키마
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+class PasswordHasher:
+    """bcrypt 해싱/검증을 전용 스레드 풀에서 실행하여 이벤트 루프를 막지 않도록 함
+
+    bcrypt는 GIL을 해제하므로 스레드로 병렬 실행되며, 워커 수로 CPU 점유를 제한합니다.
+    OCR 실행기와 풀을 분리하여 로그인 폭주가 OCR 처리를, OCR 처리가 로그인을 막지 않습니다.
+    """
+
+    def __init__(self, max_workers: int = PASSWORD_HASH_WORKERS):
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # 지표
+        self._pending = 0
+        self._max_pending = 0
+        self._completed = 0
+        self._total_seconds = 0.0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def _run(self, func, *args):
+        self._pending += 1
+        self._max_pending = max(self._max_pending, self._pending)
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self._pending -= 1
+            self._completed += 1
+            self._total_seconds += time.perf_counter() - started
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "rounds": BCRYPT_ROUNDS,
+            "max_workers": self.max_workers,
+            "pending": self._pending,
+            "max_pending": self._max_pending,
+            "completed": self._completed,
+            "avg_ms": (self._total_seconds / self._completed * 1000) if self._completed else 0.0
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+password_hasher = PasswordHasher()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """패스워드 검증"""
+    """패스워드 검증 (동기 - 이벤트 루프에서는 verify_password_async 사용)"""
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    """패스워드 해싱"""
+    """패스워드 해싱 (동기 - 이벤트 루프에서는 get_password_hash_async 사용)"""
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """패스워드 검증 - 전용 해싱 풀에서 실행"""
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """패스워드 해싱 - 전용 해싱 풀에서 실행"""
+    return await password_hasher.hash(password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """JWT 액세스 토큰 생성"""
     to_encode = data.copy()
@@ -38,6 +118,40 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+# created_at은 naive UTC로 저장되므로 로컬 시간대와 무관하게 변환
+_EPOCH = datetime(1970, 1, 1)
+
+def user_token_claims(user: UserInDB) -> dict:
+    """액세스 토큰에 담는 사용자 클레임 (sub + 자주 바뀌지 않는 사용자 정보)"""
+    return {
+        "sub": user.username,
+        "uid": str(user.id),
+        "email": user.email,
+        "name": user.full_name,
+        "active": user.is_active,
+        "created": int((user.created_at - _EPOCH).total_seconds())
+    }
+
+def _user_from_claims(payload: dict) -> Optional[UserInDB]:
+    """토큰 클레임으로 사용자 구성 (클레임이 없는 이전 토큰이면 None)"""
+    if not payload.get("uid") or not payload.get("email") or "created" not in payload:
+        return None
+    created_at = _EPOCH + timedelta(seconds=payload["created"])
+    return UserInDB(
+        _id=ObjectId(payload["uid"]),
+        username=payload["sub"],
+        email=payload["email"],
+        full_name=payload.get("name"),
+        hashed_password="",  # 토큰 인증 경로에서는 사용하지 않음
+        is_active=payload.get("active", True),
+        created_at=created_at,
+        updated_at=created_at
+    )
+
+def invalidate_user_cache(username: str):
+    """사용자 정보 변경 시 인증 캐시 무효화"""
+    user_cache.invalidate(username)
+
 async def get_user_by_email(email: str) -> Optional[UserInDB]:
     """이메일로 사용자 조회"""
     try:
@@ -80,13 +194,32 @@ async def authenticate_user(username: str, password: str) -> Optional[UserInDB]:
     if not user:
         user = await get_user_by_email(username)  # 이메일로도 로그인 가능
     
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password_async(password, user.hashed_password):
         return None
     
     return user
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> UserInDB:
     """현재 로그인된 사용자 정보 가져오기"""
+    return await get_user_from_token(credentials.credentials)
+
+async def get_current_user_from_query(
+    token: Optional[str] = Query(None),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security)
+) -> UserInDB:
+    """Authorization 헤더 또는 token 쿼리 파라미터로 인증 (헤더를 지정할 수 없는 EventSource용)"""
+    if credentials is not None:
+        return await get_user_from_token(credentials.credentials)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 정보를 확인할 수 없습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return await get_user_from_token(token)
+
+async def get_user_from_token(token: str) -> UserInDB:
+    """액세스 토큰으로 사용자 조회 (캐시 → 토큰 클레임 → DB 순)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="인증 정보를 확인할 수 없습니다",
@@ -94,7 +227,6 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     )
     
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
@@ -103,10 +235,26 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except JWTError:
         raise credentials_exception
     
-    user = await get_user_by_username(token_data.username)
+    user = user_cache.get(token_data.username)
+    if user is not None:
+        return user
+    
+    if AUTH_TRUST_TOKEN_CLAIMS:
+        try:
+            user = _user_from_claims(payload)
+        except Exception:
+            user = None
+        if user is not None:
+            user_cache.record_claim_hit()
+    
     if user is None:
-        raise credentials_exception
+        # uid 클레임이 있으면 기본 키로 조회
+        uid = payload.get("uid")
+        user = await get_user_by_id(uid) if uid else await get_user_by_username(token_data.username)
+        if user is None or user.username != token_data.username:
+            raise credentials_exception
     
+    user_cache.set(token_data.username, user)
     return user
 
 async def get_current_active_user(current_user: UserInDB = Depends(get_current_user)) -> UserInDB:
@@ -144,7 +292,7 @@ async def create_user(username: str, email: str, password: str, full_name: Optio
                 )
         
         # 새 사용자 생성
-        hashed_password = get_password_hash(password)
+        hashed_password = await get_password_hash_async(password)
         user_data = {
             "username": username,
             "email": email,
@@ -159,6 +307,7 @@ async def create_user(username: str, email: str, password: str, full_name: Optio
         result = await db.users.insert_one(user_data)
         user_data["_id"] = result.inserted_id
         
+        invalidate_user_cache(username)
         logger.info(f"사용자 생성 완료: {username}, ID: {result.inserted_id}")
         return UserInDB(**user_data)
         
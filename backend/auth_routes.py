@@ -5,8 +5,11 @@ from auth import (
     authenticate_user, 
     create_access_token, 
     get_current_active_user,
-    create_user
+    create_user,
+    user_token_claims,
+    password_hasher
 )
+from user_cache import user_cache
 from models import Token, User, UserCreate, UserInDB
 from config import ACCESS_TOKEN_EXPIRE_MINUTES
 import logging
@@ -30,7 +33,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data=user_token_claims(user), expires_delta=access_token_expires
     )
     
     logger.info(f"로그인 성공: {user.username}")
@@ -53,7 +56,7 @@ async def register(user_data: UserCreate):
         # 자동 로그인을 위한 토큰 생성
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = create_access_token(
-            data={"sub": new_user.username}, expires_delta=access_token_expires
+            data=user_token_claims(new_user), expires_delta=access_token_expires
         )
         
         logger.info(f"회원가입 성공: {new_user.username}")
@@ -89,4 +92,9 @@ async def logout():
 @router.get("/verify")
 async def verify_token(current_user: UserInDB = Depends(get_current_active_user)):
     """토큰 유효성 검증"""
-    return {"valid": True, "username": current_user.username} 
\ No newline at end of file
+    return {"valid": True, "username": current_user.username}
+
+@router.get("/metrics")
+async def get_auth_metrics():
+    """인증 사용자 캐시 적중률 및 패스워드 해싱 풀 지표 조회"""
+    return {"user_cache": user_cache.metrics(), "password_hasher": password_hasher.metrics()}
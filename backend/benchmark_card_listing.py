@@ -0,0 +1,123 @@
+"""
+명함 목록 조회 벤치마크
+전체 필드 일괄 조회(기존 방식)와 ocr_raw_text 제외 프로젝션, 키셋 페이지네이션의
+응답 크기와 지연 시간을 비교합니다.
+
+사용법:
+    python benchmark_card_listing.py [--cards 5000] [--page-size 50] [--repeat 5]
+
+MONGODB_URL / DATABASE_NAME 설정의 데이터베이스에 임시 사용자 명함을 생성하고 측정 후 삭제합니다.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi import Response
+
+from database import get_database, connect_to_mongo, close_mongo_connection
+from business_card_routes import _card_projection, _decode_cursor, _list_cards
+
+
+def make_card(user_id: ObjectId, index: int, created_at: datetime, ocr_lines: int) -> dict:
+    raw_text = [f"샘플 OCR 텍스트 줄 {i} - 주식회사 벤치마크 서울특별시 강남구 테헤란로 {index}"
+                for i in range(ocr_lines)]
+    return {
+        "user_id": user_id,
+        "name": f"홍길동{index}",
+        "name_en": "Gildong Hong",
+        "email": f"user{index}@example.com",
+        "phone_number": "02-1234-5678",
+        "mobile_phone_number": f"010-{index % 10000:04d}-5678",
+        "fax_number": None,
+        "position": "팀장",
+        "department": "개발팀",
+        "company_name": f"주식회사 벤치마크{index % 50}",
+        "address": "서울특별시 강남구 테헤란로 123",
+        "postal_code": "06234",
+        "ocr_raw_text": json.dumps(raw_text, ensure_ascii=False),
+        "ocr_confidence": 80,
+        "processing_status": "completed",
+        "isFavorite": index % 5 == 0,
+        "created_at": created_at,
+        "updated_at": created_at
+    }
+
+
+async def measure(label: str, fetch, repeat: int):
+    timings = []
+    size = 0
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        cards = await fetch()
+        body = "[" + ",".join(card.model_dump_json() for card in cards) + "]"
+        timings.append(time.perf_counter() - started)
+        size = len(body.encode())
+        count = len(cards)
+    print(f"{label:<34}{count:>8}{size / 1024:>12.1f}{statistics.median(timings) * 1000:>12.1f}")
+
+
+async def run(args):
+    await connect_to_mongo()
+    db = get_database()
+    user_id = ObjectId()
+    base = datetime.utcnow()
+
+    try:
+        print(f"🧪 임시 명함 {args.cards}개 생성 중 (OCR 텍스트 {args.ocr_lines}줄)...")
+        cards = [make_card(user_id, i, base - timedelta(seconds=i // 3), args.ocr_lines)
+                 for i in range(args.cards)]
+        random.shuffle(cards)
+        for start in range(0, len(cards), 1000):
+            await db.business_cards.insert_many(cards[start:start + 1000])
+
+        query = {"user_id": user_id}
+        full = _card_projection("all")
+        default = _card_projection(None)
+
+        # 중간 페이지 커서 (목록의 절반 지점)
+        response = Response()
+        await _list_cards(query, "created_at", default, None, args.cards // 2, response)
+        middle_cursor = _decode_cursor(response.headers.get("X-Next-Cursor"))
+
+        print("\n" + "=" * 66)
+        print(f"{'방식':<34}{'명함 수':>8}{'크기(KB)':>12}{'p50(ms)':>12}")
+        await measure("전체 조회 + 모든 필드 (기존)",
+                      lambda: _list_cards(query, "created_at", full, None, None, Response()), args.repeat)
+        await measure("전체 조회 + ocr_raw_text 제외",
+                      lambda: _list_cards(query, "created_at", default, None, None, Response()), args.repeat)
+        await measure(f"첫 페이지 ({args.page_size}개)",
+                      lambda: _list_cards(query, "created_at", default, None, args.page_size, Response()),
+                      args.repeat)
+        await measure(f"중간 페이지 ({args.page_size}개, 키셋)",
+                      lambda: _list_cards(query, "created_at", default, middle_cursor, args.page_size,
+                                          Response()),
+                      args.repeat)
+        await measure("첫 페이지 (목록 필드만)",
+                      lambda: _list_cards(query, "created_at",
+                                          _card_projection("name,company_name,position,isFavorite"),
+                                          None, args.page_size, Response()),
+                      args.repeat)
+    finally:
+        result = await db.business_cards.delete_many({"user_id": user_id})
+        print(f"\n🧹 임시 명함 {result.deleted_count}개 삭제")
+        await close_mongo_connection()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명함 목록 조회 벤치마크")
+    parser.add_argument('--cards', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--ocr-lines', type=int, default=15, help="명함당 OCR 원문 줄 수")
+    parser.add_argument('--repeat', type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
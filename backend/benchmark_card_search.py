@@ -0,0 +1,134 @@
+"""
+명함 검색 벤치마크
+기존 $regex $or 검색과 검색 토큰 인덱스 검색의 지연 시간과 검사한 문서 수를 비교합니다.
+
+사용법:
+    python benchmark_card_search.py [--sizes 10000 100000] [--repeat 5]
+
+MONGODB_URL / DATABASE_NAME 설정의 데이터베이스에 임시 사용자 명함을 생성하고 측정 후 삭제합니다.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from database import get_database, connect_to_mongo, close_mongo_connection
+from card_search import SEARCH_INDEX_NAME, build_search_query, search_fields
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서준지현우예도하윤수영진성재경혜은태호"
+COMPANIES = ["한국소프트", "미래솔루션", "대한건설", "글로벌무역", "서울바이오", "스마트시스템",
+             "Global Trading", "Blue Ocean Tech", "Alpha Systems", "Nova Labs"]
+POSITIONS = ["대표", "이사", "부장", "과장", "대리", "팀장", "Manager", "Director"]
+DEPARTMENTS = ["개발팀", "영업본부", "인사팀", "마케팅실", "연구소", "Sales Division"]
+
+QUERIES = ["김", "김민", "한국소프트", "ㄱㅁㅅ", "1234", "010-5678", "global", "영업"]
+
+
+def make_card(rng: random.Random, user_id: ObjectId, created_at: datetime) -> dict:
+    name = rng.choice(SURNAMES) + ''.join(rng.choice(GIVEN) for _ in range(2))
+    company = rng.choice(COMPANIES) + str(rng.randint(1, 500))
+    card = {
+        "user_id": user_id,
+        "name": name,
+        "name_en": None,
+        "email": f"user{rng.randint(1, 10 ** 6)}@example{rng.randint(1, 300)}.com",
+        "phone_number": f"02-{rng.randint(100, 9999)}-{rng.randint(0, 9999):04d}",
+        "mobile_phone_number": f"010-{rng.randint(0, 9999):04d}-{rng.randint(0, 9999):04d}",
+        "fax_number": None,
+        "position": rng.choice(POSITIONS),
+        "department": rng.choice(DEPARTMENTS),
+        "company_name": f"주식회사 {company}",
+        "processing_status": "completed",
+        "isFavorite": False,
+        "created_at": created_at,
+        "updated_at": created_at
+    }
+    card.update(search_fields(card))
+    return card
+
+
+def legacy_query(user_id: ObjectId, query: str) -> dict:
+    """이전 search_cards의 조건 (인덱스를 쓰지 못하는 $regex $or)"""
+    return {
+        "user_id": user_id,
+        "$or": [{field: {"$regex": query, "$options": "i"}}
+                for field in ("name", "email", "phone_number", "company_name", "position", "department")]
+    }
+
+
+async def measure(collection, query: dict, hint, repeat: int):
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        cursor = collection.find(query, {"_id": 1}).sort([("created_at", -1), ("_id", -1)])
+        if hint:
+            cursor = cursor.hint(hint)
+        started = time.perf_counter()
+        count = len(await cursor.to_list(length=None))
+        timings.append(time.perf_counter() - started)
+
+    cursor = collection.find(query, {"_id": 1}).sort([("created_at", -1), ("_id", -1)])
+    if hint:
+        cursor = cursor.hint(hint)
+    explain = await cursor.explain()
+    examined = explain.get("executionStats", {}).get("totalDocsExamined")
+    return count, statistics.median(timings) * 1000, examined
+
+
+async def run_size(db, size: int, repeat: int):
+    rng = random.Random(size)
+    user_id = ObjectId()
+    base = datetime.utcnow()
+    collection = db.business_cards
+
+    print(f"\n🧪 임시 명함 {size}개 생성 중...")
+    try:
+        batch = []
+        for i in range(size):
+            batch.append(make_card(rng, user_id, base - timedelta(seconds=i)))
+            if len(batch) >= 2000:
+                await collection.insert_many(batch)
+                batch = []
+        if batch:
+            await collection.insert_many(batch)
+
+        print(f"{'검색어':<12}{'결과(기존)':>10}{'기존(ms)':>10}{'검사(기존)':>12}"
+              f"{'결과(토큰)':>10}{'토큰(ms)':>10}{'검사(토큰)':>12}")
+        for query in QUERIES:
+            legacy = await measure(collection, legacy_query(user_id, re.escape(query)), None, repeat)
+            search_filter = build_search_query(user_id, query)
+            hint = SEARCH_INDEX_NAME if "search_tokens" in search_filter else None
+            indexed = await measure(collection, search_filter, hint, repeat)
+            print(f"{query:<12}{legacy[0]:>10}{legacy[1]:>10.1f}{str(legacy[2]):>12}"
+                  f"{indexed[0]:>10}{indexed[1]:>10.1f}{str(indexed[2]):>12}")
+    finally:
+        await collection.delete_many({"user_id": user_id})
+
+
+async def run(args):
+    await connect_to_mongo()
+    db = get_database()
+    try:
+        print(f"🚀 명함 검색 벤치마크 (반복 {args.repeat}회, 중앙값)")
+        for size in args.sizes:
+            await run_size(db, size, args.repeat)
+    finally:
+        await close_mongo_connection()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명함 검색 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
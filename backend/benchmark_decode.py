@@ -0,0 +1,109 @@
+"""
+디코딩 해상도 벤치마크
+업로드 원본의 디코딩 + 축소 시간과, 긴 변 목표 길이(OCR_MAX_IMAGE_SIDE)별 OCR 정확도를 비교합니다.
+
+사용법:
+    python benchmark_decode.py <명함 사진 폴더> [--targets 1280 1600 2048 2560] [--repeat 3]
+
+기준 방식은 이전 load_image(전체 해상도 디코딩 → 4000px 초과 시 LANCZOS 축소)입니다.
+정확도는 원본 해상도 OCR 결과를 기준으로 한 문자 단위 유사도로 측정합니다 (정답 라벨 불필요).
+"""
+
+import argparse
+import difflib
+import io
+import os
+import statistics
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from ocr_processor import OCRProcessor
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.heic', '.heif')
+
+
+def legacy_load(data: bytes) -> np.ndarray:
+    """이전 load_image 방식 (전체 해상도 디코딩 후 4000px로 축소)"""
+    with Image.open(io.BytesIO(data)) as pil_img:
+        if pil_img.mode not in ['RGB', 'L']:
+            pil_img = pil_img.convert('RGB')
+        if max(pil_img.size) > 4000:
+            ratio = 4000 / max(pil_img.size)
+            new_size = tuple(int(dim * ratio) for dim in pil_img.size)
+            pil_img = pil_img.resize(new_size, Image.Resampling.LANCZOS)
+        img_array = np.array(pil_img)
+    if img_array.ndim == 2:
+        return cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR)
+    return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+
+
+def similarity(reference: list, texts: list) -> float:
+    return difflib.SequenceMatcher(None, ' '.join(reference), ' '.join(texts)).ratio()
+
+
+def measure(load, data: bytes, repeat: int):
+    timings = []
+    image = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        image = load(data)
+        timings.append(time.perf_counter() - started)
+    return image, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="디코딩 해상도 벤치마크")
+    parser.add_argument('folder', help="명함 사진 폴더")
+    parser.add_argument('--targets', type=int, nargs='+', default=[1280, 1600, 2048, 2560])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    files = [os.path.join(args.folder, name) for name in sorted(os.listdir(args.folder))
+             if name.lower().endswith(IMAGE_EXTENSIONS)]
+    if not files:
+        print("❌ 벤치마크할 이미지가 없습니다.")
+        return
+
+    processor = OCRProcessor('uploads')
+    cases = [('기존(4000px)', legacy_load)]
+    cases += [(f"목표 {target}px", lambda data, t=target: processor.load_image(data, max_side=t))
+              for target in args.targets]
+
+    stats = {label: {'decode': [], 'ocr': [], 'similarity': [], 'pixels': []} for label, _ in cases}
+    print(f"🚀 디코딩 벤치마크: 이미지 {len(files)}개, 목표 {args.targets}")
+
+    for path in files:
+        with open(path, 'rb') as f:
+            data = f.read()
+        # 기준 OCR: 원본 해상도 그대로
+        reference = [text for _, text, _ in processor.reader.readtext(processor.load_image(data, max_side=0))]
+        print(f"\n📄 {os.path.basename(path)} ({len(data) / 1024:.0f}KB, 기준 텍스트 {len(reference)}개)")
+
+        for label, load in cases:
+            image, decode_time = measure(load, data, args.repeat)
+            started = time.perf_counter()
+            texts = [text for _, text, _ in processor.reader.readtext(image)]
+            ocr_time = time.perf_counter() - started
+
+            entry = stats[label]
+            entry['decode'].append(decode_time)
+            entry['ocr'].append(ocr_time)
+            entry['similarity'].append(similarity(reference, texts))
+            entry['pixels'].append(image.shape[0] * image.shape[1])
+            print(f"   {label:<14} 디코딩 {decode_time * 1000:7.1f}ms  OCR {ocr_time * 1000:7.1f}ms  "
+                  f"유사도 {entry['similarity'][-1] * 100:5.1f}%  ({image.shape[1]}x{image.shape[0]})")
+
+    print("\n" + "=" * 76)
+    print(f"{'방식':<16}{'디코딩(ms)':>12}{'OCR(ms)':>12}{'유사도':>10}{'평균 MP':>10}")
+    for label, entry in stats.items():
+        print(f"{label:<16}{statistics.mean(entry['decode']) * 1000:>12.1f}"
+              f"{statistics.mean(entry['ocr']) * 1000:>12.1f}"
+              f"{statistics.mean(entry['similarity']) * 100:>9.1f}%"
+              f"{statistics.mean(entry['pixels']) / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
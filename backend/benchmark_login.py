@@ -0,0 +1,82 @@
+"""
+로그인(bcrypt 검증) 처리량 벤치마크
+이벤트 루프에서 직접 bcrypt를 실행하는 기존 방식과 전용 해싱 풀(PasswordHasher)을 비교합니다.
+동시 로그인 중 다른 요청(예: OCR 상태 폴링)이 얼마나 지연되는지 이벤트 루프 지연으로 측정합니다.
+
+사용법:
+    python benchmark_login.py [--logins 50] [--rounds 10 12] [--workers 1 2 4]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from passlib.context import CryptContext
+
+from auth import PasswordHasher
+import auth
+
+
+async def loop_lag_probe(stop: asyncio.Event, interval: float, lags: list):
+    """interval마다 깨어나 예정보다 늦어진 시간을 기록 (폴링 요청의 대기 시간에 해당)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_case(label: str, login, logins: int):
+    stop = asyncio.Event()
+    lags = []
+    probe = asyncio.create_task(loop_lag_probe(stop, 0.01, lags))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    assert all(results)
+    max_lag = max(lags) * 1000 if lags else 0.0
+    p50_lag = statistics.median(lags) * 1000 if lags else 0.0
+    print(f"{label:<28}{elapsed:>10.2f}{logins / elapsed:>12.1f}{p50_lag:>14.1f}{max_lag:>14.1f}")
+
+
+async def run(args):
+    print(f"🚀 로그인 벤치마크: 동시 로그인 {args.logins}회")
+    for rounds in args.rounds:
+        context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+        hashed = context.hash("benchmark-password")
+        # PasswordHasher가 같은 비용의 컨텍스트를 사용하도록 교체
+        auth.pwd_context = context
+
+        print(f"\n🔐 bcrypt rounds={rounds}")
+        print(f"{'방식':<28}{'총(s)':>10}{'로그인/초':>12}{'루프지연p50(ms)':>14}{'루프지연max(ms)':>14}")
+
+        async def blocking_login():
+            return context.verify("benchmark-password", hashed)
+
+        await run_case("이벤트 루프에서 직접 (기존)", blocking_login, args.logins)
+
+        for workers in args.workers:
+            hasher = PasswordHasher(max_workers=workers)
+            try:
+                await run_case(f"해싱 풀 workers={workers}",
+                               lambda: hasher.verify("benchmark-password", hashed), args.logins)
+            finally:
+                hasher.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 처리량 벤치마크")
+    parser.add_argument('--logins', type=int, default=50)
+    parser.add_argument('--rounds', type=int, nargs='+', default=[10, 12])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
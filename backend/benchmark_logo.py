@@ -0,0 +1,114 @@
+"""
+로고 탐지 백엔드 벤치마크
+torch(ultralytics) / onnx / onnx-int8 백엔드의 명함당 YOLO 지연 시간, 모델 로드 RSS 증가량,
+torch 대비 로고 후보 일치율을 비교합니다.
+
+사용법:
+    python benchmark_logo.py <명함 이미지 폴더> [--backends onnx-int8 onnx torch] [--repeat 5]
+
+ONNX 모델은 먼저 `python logo_detector.py export`로 생성해야 합니다.
+RSS는 한 프로세스에서 순서대로 측정하므로 torch를 마지막에 두어야 ONNX 측정에 torch 로드가 섞이지 않습니다.
+일치율은 torch 후보와 클래스가 같고 IoU 0.5 이상인 후보 쌍 기준의 정밀도/재현율입니다.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmark_orientation import load_fixtures
+from logo_extractor import LogoExtractor, letterbox
+from ocr_engine import _current_rss_bytes
+
+
+def iou(a, b) -> float:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    if w <= 0 or h <= 0:
+        return 0.0
+    inter = w * h
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def matched(candidates, reference) -> int:
+    """같은 클래스 + IoU 0.5 이상으로 1:1 매칭된 후보 수"""
+    remaining = list(reference)
+    count = 0
+    for candidate in candidates:
+        for other in remaining:
+            if other['class_name'] == candidate['class_name'] and iou(other['bbox'], candidate['bbox']) >= 0.5:
+                remaining.remove(other)
+                count += 1
+                break
+    return count
+
+
+def run_backend(backend: str, fixtures, repeat: int):
+    rss_before = _current_rss_bytes()
+    started = time.perf_counter()
+    extractor = LogoExtractor('uploads', backend=backend)
+    load_seconds = time.perf_counter() - started
+    rss_delta = (_current_rss_bytes() or 0) - (rss_before or 0)
+    if extractor.yolo is None:
+        print(f"❌ {backend} 백엔드를 로드할 수 없습니다.")
+        return None
+
+    timings = []
+    candidates = {}
+    for name, image in fixtures:
+        letterboxed = letterbox(image, extractor.inference_size)
+        extractor.detect_yolo_candidates(image, letterboxed)  # 워밍업
+        for _ in range(repeat):
+            began = time.perf_counter()
+            candidates[name] = extractor.detect_yolo_candidates(image, letterboxed)
+            timings.append(time.perf_counter() - began)
+
+    return {
+        'load': load_seconds,
+        'rss': rss_delta,
+        'p50': statistics.median(timings),
+        'p95': sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0],
+        'candidates': candidates
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로고 탐지 백엔드 벤치마크")
+    parser.add_argument('folder', help="명함 이미지 폴더")
+    parser.add_argument('--backends', nargs='+', default=['onnx-int8', 'onnx', 'torch'])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.folder)
+    if not fixtures:
+        print("❌ 벤치마크할 이미지가 없습니다.")
+        return
+
+    print(f"🚀 로고 탐지 벤치마크: 명함 {len(fixtures)}장, 반복 {args.repeat}회")
+    results = {}
+    for backend in args.backends:
+        print(f"⏳ {backend} 측정 중...")
+        result = run_backend(backend, fixtures, args.repeat)
+        if result:
+            results[backend] = result
+
+    reference = results.get('torch')
+    print("\n" + "=" * 84)
+    print(f"{'백엔드':<12}{'로드(s)':>10}{'RSS(MB)':>10}{'p50(ms)':>10}{'p95(ms)':>10}"
+          f"{'후보 수':>10}{'정밀도':>10}{'재현율':>10}")
+    for backend, result in results.items():
+        found = sum(len(c) for c in result['candidates'].values())
+        precision = recall = '-'
+        if reference:
+            hits = sum(matched(result['candidates'][name], reference['candidates'][name])
+                       for name, _ in fixtures)
+            expected = sum(len(c) for c in reference['candidates'].values())
+            precision = f"{hits / found * 100:.1f}%" if found else '-'
+            recall = f"{hits / expected * 100:.1f}%" if expected else '-'
+        print(f"{backend:<12}{result['load']:>10.2f}{result['rss'] / (1024 * 1024):>10.1f}"
+              f"{result['p50'] * 1000:>10.1f}{result['p95'] * 1000:>10.1f}"
+              f"{found:>10}{precision:>10}{recall:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+휴리스틱 로고 탐지 벤치마크
+영역마다 그레이스케일/Canny/윤곽선을 다시 계산하던 기존 방식과 상단 절반을 한 번만 처리하는
+단일 패스 방식의 명함당 휴리스틱 단계 시간과 후보 일치 여부를 비교합니다.
+
+사용법:
+    python benchmark_logo_heuristic.py <명함 이미지 폴더> [--repeat 10]
+
+일치율은 기존 방식의 각 후보에 대해 단일 패스 후보 중 IoU 0.5 이상인 것이 있는 비율입니다.
+"""
+
+import argparse
+import statistics
+import time
+
+import cv2
+
+from benchmark_orientation import load_fixtures
+from logo_extractor import LogoExtractor
+
+
+def legacy_heuristic(extractor: LogoExtractor, image):
+    """기존 방식: 겹치는 4개 영역마다 엣지/윤곽선을 따로 계산"""
+    candidates = []
+    height, width = image.shape[:2]
+    search_regions = [
+        (0, 0, width // 2, height // 3),
+        (width // 2, 0, width, height // 3),
+        (0, 0, width // 3, height // 2),
+        (width * 2 // 3, 0, width, height // 2),
+    ]
+    for i, (x1, y1, x2, y2) in enumerate(search_regions):
+        gray = cv2.cvtColor(image[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        large_contours = [c for c in contours if cv2.contourArea(c) > 500]
+        if not large_contours:
+            continue
+        x, y, w, h = cv2.boundingRect(max(large_contours, key=cv2.contourArea))
+        if w >= extractor.min_logo_size[0] and h >= extractor.min_logo_size[1]:
+            candidates.append({'bbox': [x1 + x, y1 + y, x1 + x + w, y1 + y + h],
+                               'method': f'heuristic_region_{i}'})
+    return candidates
+
+
+def iou(a, b) -> float:
+    w = min(a[2], b[2]) - max(a[0], b[0])
+    h = min(a[3], b[3]) - max(a[1], b[1])
+    if w <= 0 or h <= 0:
+        return 0.0
+    inter = w * h
+    return inter / ((a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter)
+
+
+def measure(detect, image, repeat: int):
+    timings = []
+    result = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = detect(image)
+        timings.append(time.perf_counter() - started)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="휴리스틱 로고 탐지 벤치마크")
+    parser.add_argument('folder', help="명함 이미지 폴더")
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.folder)
+    if not fixtures:
+        print("❌ 벤치마크할 이미지가 없습니다.")
+        return
+
+    extractor = LogoExtractor('uploads')
+    legacy_times, single_times = [], []
+    matched = total = 0
+    print(f"🚀 휴리스틱 로고 탐지 벤치마크: 명함 {len(fixtures)}장, 반복 {args.repeat}회")
+
+    for name, image in fixtures:
+        legacy, legacy_time = measure(lambda img: legacy_heuristic(extractor, img), image, args.repeat)
+        single, single_time = measure(extractor._detect_logo_heuristic, image, args.repeat)
+        legacy_times.append(legacy_time)
+        single_times.append(single_time)
+
+        total += len(legacy)
+        matched += sum(1 for c in legacy if any(iou(c['bbox'], s['bbox']) >= 0.5 for s in single))
+        print(f"📄 {name:<28} 기존 {legacy_time * 1000:7.2f}ms ({len(legacy)}개)  "
+              f"단일 패스 {single_time * 1000:7.2f}ms ({len(single)}개)  "
+              f"({image.shape[1]}x{image.shape[0]})")
+
+    print("\n" + "=" * 60)
+    print(f"기존 방식      평균 {statistics.mean(legacy_times) * 1000:7.2f}ms / 명함")
+    print(f"단일 패스      평균 {statistics.mean(single_times) * 1000:7.2f}ms / 명함")
+    print(f"속도 향상      {statistics.mean(legacy_times) / statistics.mean(single_times):.2f}x")
+    if total:
+        print(f"후보 일치율    {matched / total * 100:.1f}% ({matched}/{total})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+OCR 엔진 정확도/지연 시간 비교
+EasyOCR(PyTorch)와 ONNX / ONNX INT8 엔진의 명함당 OCR 시간, 모델 로드 RSS, 정답 대비 정확도를 비교합니다.
+
+사용법:
+    python benchmark_ocr_engine.py <라벨 명함 폴더> [--engines easyocr onnx onnx-int8] [--repeat 3]
+
+폴더에는 명함 이미지와 같은 이름의 .txt 정답 파일(한 줄에 텍스트 하나)이 있어야 합니다.
+    card01.jpg, card01.txt ...
+정확도는 공백을 제거한 전체 텍스트의 문자 오류율(CER)과 정답 줄이 OCR 결과에 그대로 포함된 비율로 측정합니다.
+ONNX 모델은 먼저 `python ocr_onnx.py export`로 생성해야 합니다.
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+from benchmark_orientation import load_fixtures
+from ocr_engine import OCREngineRegistry, _current_rss_bytes
+from ocr_processor import OCRProcessor
+
+
+def normalize(text: str) -> str:
+    return ''.join(text.split())
+
+
+def edit_distance(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def load_labels(folder: str, fixtures):
+    labels = {}
+    for name, _ in fixtures:
+        path = os.path.join(folder, os.path.splitext(name)[0] + '.txt')
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                labels[name] = [line.strip() for line in f if line.strip()]
+    return labels
+
+
+def run_engine(engine: str, fixtures, labels, repeat: int):
+    rss_before = _current_rss_bytes()
+    started = time.perf_counter()
+    processor = OCRProcessor('uploads', engine=OCREngineRegistry('uploads', ocr_engine=engine))
+    processor.engine.warmup()
+    load_seconds = time.perf_counter() - started
+    rss_delta = (_current_rss_bytes() or 0) - (rss_before or 0)
+
+    timings = []
+    errors = chars = lines_found = lines_total = 0
+    for name, image in fixtures:
+        texts = []
+        for _ in range(repeat):
+            began = time.perf_counter()
+            texts = processor.process_image_sync(image)
+            timings.append(time.perf_counter() - began)
+
+        expected = labels[name]
+        output = normalize(' '.join(texts))
+        reference = normalize(' '.join(expected))
+        errors += edit_distance(reference, output)
+        chars += len(reference)
+        lines_found += sum(1 for line in expected if normalize(line) in output)
+        lines_total += len(expected)
+
+    return {
+        'load': load_seconds,
+        'rss': rss_delta,
+        'p50': statistics.median(timings),
+        'p95': sorted(timings)[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0],
+        'cer': errors / chars if chars else 0.0,
+        'lines': lines_found / lines_total if lines_total else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCR 엔진 정확도/지연 시간 비교")
+    parser.add_argument('folder', help="명함 이미지 + .txt 정답 폴더")
+    parser.add_argument('--engines', nargs='+', default=['easyocr', 'onnx', 'onnx-int8'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.folder)
+    labels = load_labels(args.folder, fixtures)
+    fixtures = [(name, image) for name, image in fixtures if name in labels]
+    if not fixtures:
+        print("❌ 정답(.txt)이 있는 명함 이미지가 없습니다.")
+        return
+
+    print(f"🚀 OCR 엔진 비교: 명함 {len(fixtures)}장, 반복 {args.repeat}회")
+    results = {}
+    for engine in args.engines:
+        print(f"⏳ {engine} 측정 중...")
+        try:
+            results[engine] = run_engine(engine, fixtures, labels, args.repeat)
+        except Exception as e:
+            print(f"❌ {engine} 엔진 실행 실패: {e}")
+
+    print("\n" + "=" * 76)
+    print(f"{'엔진':<12}{'로드(s)':>10}{'RSS(MB)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'CER':>10}{'줄 일치':>10}")
+    for engine, result in results.items():
+        print(f"{engine:<12}{result['load']:>10.2f}{result['rss'] / (1024 * 1024):>10.1f}"
+              f"{result['p50'] * 1000:>10.1f}{result['p95'] * 1000:>10.1f}"
+              f"{result['cer'] * 100:>9.2f}%{result['lines'] * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+방향 감지 벤치마크
+full(4방향 전체 OCR)과 fast(검출기 통계 + 샘플 인식) 모드의 명함당 지연 시간과 정확도를 비교합니다.
+
+사용법:
+    python benchmark_orientation.py <명함 이미지 폴더> [--modes full fast] [--repeat 1]
+
+폴더의 이미지는 바르게 세워진 명함이어야 합니다. 각 이미지를 0/90/180/270도로 회전시킨 뒤
+각 모드가 올바른 보정 각도를 찾는지와 방향 감지 + 최종 OCR까지의 시간을 측정합니다.
+"""
+
+import argparse
+import os
+import statistics
+import time
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from ocr_processor import OCRProcessor
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.heic', '.heif')
+
+
+def load_fixtures(folder: str):
+    """폴더에서 명함 이미지를 BGR ndarray로 로드"""
+    fixtures = []
+    for name in sorted(os.listdir(folder)):
+        if not name.lower().endswith(IMAGE_EXTENSIONS):
+            continue
+        with Image.open(os.path.join(folder, name)) as img:
+            rgb = np.array(img.convert('RGB'))
+        fixtures.append((name, cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)))
+    return fixtures
+
+
+def run_mode(processor: OCRProcessor, fixtures, mode: str, repeat: int):
+    orientation_times = []
+    card_times = []
+    correct = 0
+    total = 0
+
+    for name, image in fixtures:
+        for applied in (0, 90, 180, 270):
+            rotated = OCRProcessor._rotate_right_angle(image, applied)
+            expected = (360 - applied) % 360
+
+            for _ in range(repeat):
+                started = time.perf_counter()
+                angle = processor.detect_orientation(rotated, mode)
+                oriented = OCRProcessor._rotate_right_angle(rotated, angle)
+                orientation_done = time.perf_counter()
+                processor.reader.readtext(oriented)
+                finished = time.perf_counter()
+
+                orientation_times.append(orientation_done - started)
+                card_times.append(finished - started)
+                total += 1
+                if angle == expected:
+                    correct += 1
+                else:
+                    print(f"   ⚠️ [{mode}] {name} 회전 {applied}도: 예상 {expected}도, 감지 {angle}도")
+
+    return {
+        'accuracy': correct / total if total else 0.0,
+        'orientation_ms': statistics.mean(orientation_times) * 1000 if orientation_times else 0.0,
+        'card_ms': statistics.mean(card_times) * 1000 if card_times else 0.0,
+        'card_p95_ms': (sorted(card_times)[int(len(card_times) * 0.95) - 1] * 1000
+                        if card_times else 0.0),
+        'samples': total
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="방향 감지 모드 벤치마크")
+    parser.add_argument('folder', help="바르게 세워진 명함 이미지 폴더")
+    parser.add_argument('--modes', nargs='+', default=['full', 'fast'])
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.folder)
+    if not fixtures:
+        print("❌ 벤치마크할 이미지가 없습니다.")
+        return
+
+    processor = OCRProcessor('uploads')
+    # 모델 로드 시간은 측정에서 제외
+    processor.reader.readtext(fixtures[0][1])
+
+    print(f"🚀 방향 감지 벤치마크: 이미지 {len(fixtures)}개 x 회전 4종")
+    results = {}
+    for mode in args.modes:
+        print(f"\n📐 모드: {mode}")
+        results[mode] = run_mode(processor, fixtures, mode, args.repeat)
+
+    print("\n" + "=" * 72)
+    print(f"{'모드':<8}{'정확도':>10}{'방향감지(ms)':>16}{'명함당(ms)':>14}{'p95(ms)':>12}{'샘플':>8}")
+    for mode, r in results.items():
+        print(f"{mode:<8}{r['accuracy'] * 100:>9.1f}%{r['orientation_ms']:>16.1f}"
+              f"{r['card_ms']:>14.1f}{r['card_p95_ms']:>12.1f}{r['samples']:>8}")
+
+    if 'full' in results and 'fast' in results and results['fast']['card_ms'] > 0:
+        speedup = results['full']['card_ms'] / results['fast']['card_ms']
+        print(f"\n⚡ fast 모드 명함당 속도 향상: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+OCR 파서 마이크로벤치마크
+OCRParser.parse의 처리량(명함/초)과 명함당 지연 시간을 측정합니다.
+
+사용법:
+    python benchmark_parser.py [--samples samples.json] [--cards 2000] [--repeat 3]
+
+--samples에는 OCR 텍스트 목록의 JSON 배열(예: 명함 문서의 ocr_raw_text 값 모음)을 지정합니다.
+지정하지 않으면 내장된 대표 명함 텍스트를 사용합니다.
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import time
+
+from ocr_parser import OCRParser
+
+SAMPLE_CARDS = [
+    ['㈜ 한국소프트', '대표이사', '김 철 수', 'Chulsoo Kim', '서울특별시 강남구 테헤란로 123',
+     '(역삼동, 한국빌딩 5층)', 'Tel. 02-1234-5678', 'Mobile 010-9876-5432',
+     'Fax. 02-1234-5679', 'chulsoo.kim@hansoft.co.kr', 'www.hansoft.co.kr'],
+    ['주식회사', '미래솔루션', '개발본부 플랫폼팀', '팀장', '이영희', 'Younghee Lee',
+     '경기도 성남시 분당구 판교역로 235', '13494', 'M. 010 2345 6789', 'T. 031-789-1234',
+     'yh.lee@mirae-sol.com'],
+    ['Global Trading Co., Ltd', 'Sales Manager', 'James Park', '박 정 민',
+     '부산광역시 해운대구 센텀중앙로 97', '1203호', '+82-10-5555-1234', 'james@gtrade.com'],
+    ['(주)', '대한건설', '상무', '최민호', '서울시 중구 세종대로 110', '02 777 8888',
+     '010-3333-4444', 'mh.choi@dhconst.kr']
+]
+
+
+def load_samples(path: str):
+    with open(path, encoding='utf-8') as f:
+        samples = json.load(f)
+    # ocr_raw_text 문자열(JSON 인코딩된 목록)도 허용
+    return [json.loads(s) if isinstance(s, str) else s for s in samples]
+
+
+def run(parser: OCRParser, cards, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for card in cards:
+            parser.parse(card)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="OCR 파서 처리량 벤치마크")
+    arg_parser.add_argument('--samples', help="OCR 텍스트 목록 JSON 파일")
+    arg_parser.add_argument('--cards', type=int, default=2000, help="반복당 파싱할 명함 수")
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    # 파서의 상세 로그는 측정 대상이 아니므로 끔
+    logging.getLogger('ocr_parser').setLevel(logging.ERROR)
+
+    samples = load_samples(args.samples) if args.samples else SAMPLE_CARDS
+    if not samples:
+        print("❌ 벤치마크할 샘플이 없습니다.")
+        return
+    cards = [samples[i % len(samples)] for i in range(args.cards)]
+    lines = sum(len(card) for card in cards)
+
+    started = time.perf_counter()
+    parser = OCRParser()
+    construct_ms = (time.perf_counter() - started) * 1000
+
+    # 워밍업
+    run(parser, cards[:min(len(cards), 50)], 1)
+
+    print(f"🚀 파서 벤치마크: 명함 {len(cards)}개 ({lines}줄) x {args.repeat}회")
+    timings = run(parser, cards, args.repeat)
+    best = min(timings)
+
+    print("\n" + "=" * 60)
+    print(f"🔧 파서 생성(규칙 컴파일): {construct_ms:.2f}ms")
+    print(f"⏱️  반복당 시간: 최소 {best * 1000:.1f}ms / 평균 {statistics.mean(timings) * 1000:.1f}ms")
+    print(f"📈 처리량: {len(cards) / best:,.0f} 명함/초, {lines / best:,.0f} 줄/초")
+    print(f"📊 명함당 지연: {best / len(cards) * 1e6:.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
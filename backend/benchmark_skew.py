@@ -0,0 +1,79 @@
+"""
+기울기 추정 벤치마크
+contour(원본 해상도 윤곽선 minAreaRect)와 projection(축소 이미지 투영 프로파일) 방식의
+각도 오차와 지연 시간을 비교합니다.
+
+사용법:
+    python benchmark_skew.py <명함 이미지 폴더> [--methods contour projection]
+                             [--angles -10 -5 -2 -1 0 1 2 5 10] [--repeat 3]
+
+폴더의 이미지는 기울어지지 않은 명함이어야 합니다. 각 이미지를 지정한 각도만큼 회전시킨 뒤
+추정한 각도와 실제 각도의 차이를 측정합니다.
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmark_orientation import load_fixtures
+from ocr_processor import OCRProcessor
+
+
+def run_method(processor: OCRProcessor, fixtures, method: str, angles, repeat: int):
+    errors = []
+    timings = []
+    for name, image in fixtures:
+        for applied in angles:
+            skewed = processor.rotate_image(image, applied)
+            for _ in range(repeat):
+                started = time.perf_counter()
+                detected = processor.detect_skew_angle(skewed, method)
+                timings.append(time.perf_counter() - started)
+            error = abs(detected - applied)
+            errors.append(error)
+            if error > 1.0:
+                print(f"   ⚠️ [{method}] {name} {applied:+.1f}도: 추정 {detected:+.2f}도")
+
+    return {
+        'mean_error': statistics.mean(errors) if errors else 0.0,
+        'max_error': max(errors) if errors else 0.0,
+        'within_half': sum(e <= 0.5 for e in errors) / len(errors) if errors else 0.0,
+        'latency_ms': statistics.mean(timings) * 1000 if timings else 0.0,
+        'p95_ms': sorted(timings)[int(len(timings) * 0.95) - 1] * 1000 if timings else 0.0,
+        'samples': len(errors)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기울기 추정 방식 벤치마크")
+    parser.add_argument('folder', help="기울어지지 않은 명함 이미지 폴더")
+    parser.add_argument('--methods', nargs='+', default=['contour', 'projection'])
+    parser.add_argument('--angles', type=float, nargs='+', default=[-10, -5, -2, -1, 0, 1, 2, 5, 10])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.folder)
+    if not fixtures:
+        print("❌ 벤치마크할 이미지가 없습니다.")
+        return
+
+    processor = OCRProcessor('uploads')
+    print(f"🚀 기울기 추정 벤치마크: 이미지 {len(fixtures)}개 x 각도 {len(args.angles)}종")
+    results = {}
+    for method in args.methods:
+        print(f"\n📐 방식: {method}")
+        results[method] = run_method(processor, fixtures, method, args.angles, args.repeat)
+
+    print("\n" + "=" * 78)
+    print(f"{'방식':<12}{'평균오차(도)':>14}{'최대오차(도)':>14}{'0.5도 이내':>12}{'평균(ms)':>12}{'p95(ms)':>10}")
+    for method, r in results.items():
+        print(f"{method:<12}{r['mean_error']:>14.2f}{r['max_error']:>14.2f}{r['within_half'] * 100:>11.1f}%"
+              f"{r['latency_ms']:>12.1f}{r['p95_ms']:>10.1f}")
+
+    if 'contour' in results and 'projection' in results and results['projection']['latency_ms'] > 0:
+        speedup = results['contour']['latency_ms'] / results['projection']['latency_ms']
+        print(f"\n⚡ projection 방식 속도 향상: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
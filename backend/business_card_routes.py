@@ -1,30 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, Request, Header
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from bson import ObjectId
 from database import get_database
-from auth import get_current_active_user
+from auth import get_current_active_user, get_current_user_from_query
 from models import (
     UserInDB, 
     BusinessCard, 
     BusinessCardCreate, 
     BusinessCardUpdate,
     BusinessCardInDB,
-    OCRResult
+    OCRResult,
+    BatchOCRItem,
+    BatchOCRResult
 )
 from ocr_processor import OCRProcessor
-from ocr_parser import parse_ocr_result
+from ocr_engine import get_ocr_processor
+from ocr_jobs import ocr_job_queue
+from ocr_events import ocr_event_bus, STAGE_QUEUED
+from upload_ingest import ReceivedUpload, UploadRejected, read_upload, receive_uploads, upload_openapi
+from card_search import SEARCH_INDEX_NAME, build_search_query, search_fields
+from config import OCR_BATCH_MAX_FILES, CARDS_MAX_PAGE_SIZE, OCR_EVENTS_KEEPALIVE_SECONDS
+import asyncio
 import os
-import shutil
+import json
+import base64
+import uuid
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/cards", tags=["business_cards"])
 
-# OCR 프로세서 초기화
-UPLOAD_FOLDER = 'uploads'
-ocr_processor = OCRProcessor(UPLOAD_FOLDER)
-
 @router.get("/stats")
 async def get_cards_stats(current_user: UserInDB = Depends(get_current_active_user)):
     """사용자의 명함 통계 조회"""
@@ -96,38 +103,68 @@ async def get_cards_stats(current_user: UserInDB = Depends(get_current_active_us
             detail="통계 조회 중 오류가 발생했습니다"
         )
 
+@router.get("/events")
+async def stream_card_events(
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user: UserInDB = Depends(get_current_user_from_query)
+):
+    """OCR 진행 상황 스트림 (Server-Sent Events)
+
+    연결 직후 처리 중인 명함 목록(snapshot)을 보내고, 이후 명함별 진행 단계
+    (queued → orientation → ocr → parse → done/failed)를 progress 이벤트로 전달합니다.
+    EventSource는 헤더를 지정할 수 없으므로 token 쿼리 파라미터로도 인증합니다.
+    """
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="비활성 사용자입니다")
+    
+    async def stream():
+        # 스냅샷 조회 중 발생한 이벤트를 놓치지 않도록 먼저 구독
+        queue = ocr_event_bus.subscribe(current_user.id)
+        try:
+            yield "retry: 3000\n\n"
+            if last_event_id:
+                for event in await ocr_event_bus.replay(current_user.id, last_event_id):
+                    yield _sse_progress(event)
+            
+            db = get_database()
+            processing = await db.business_cards.find(
+                {"user_id": current_user.id, "processing_status": "processing"}, {"_id": 1}
+            ).to_list(length=None)
+            snapshot = {"processing": [str(card["_id"]) for card in processing]}
+            yield f"event: snapshot\ndata: {json.dumps(snapshot)}\n\n"
+            
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=OCR_EVENTS_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse_progress(event)
+        finally:
+            ocr_event_bus.unsubscribe(current_user.id, queue)
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/", response_model=List[BusinessCard])
-async def get_user_cards(current_user: UserInDB = Depends(get_current_active_user)):
-    """현재 사용자의 모든 명함 조회"""
+async def get_user_cards(
+    response: Response,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, all=전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=CARDS_MAX_PAGE_SIZE, description="페이지 크기 (생략 시 전체)"),
+    current_user: UserInDB = Depends(get_current_active_user)
+):
+    """현재 사용자의 명함 목록 조회 (최신순, 커서 기반 페이지네이션)"""
+    projection = _card_projection(fields)
+    after = _decode_cursor(cursor)
     try:
-        db = get_database()
-        cards_cursor = db.business_cards.find(
-            {"user_id": current_user.id}
-        ).sort("created_at", -1)
-        
-        cards = []
-        async for card_data in cards_cursor:
-            cards.append(BusinessCard(
-                id=str(card_data["_id"]),
-                user_id=str(card_data["user_id"]),
-                name=card_data.get("name"),
-                name_en=card_data.get("name_en"),
-                email=card_data.get("email"),
-                phone_number=card_data.get("phone_number"),
-                mobile_phone_number=card_data.get("mobile_phone_number"),
-                fax_number=card_data.get("fax_number"),
-                position=card_data.get("position"),
-                department=card_data.get("department"),
-                company_name=card_data.get("company_name"),
-                address=card_data.get("address"),
-                postal_code=card_data.get("postal_code"),
-                ocr_raw_text=card_data.get("ocr_raw_text"),
-                ocr_confidence=card_data.get("ocr_confidence"),
-                processing_status=card_data.get("processing_status"),
-                isFavorite=card_data.get("isFavorite", False),
-                created_at=card_data["created_at"],
-                updated_at=card_data["updated_at"]
-            ))
+        cards = await _list_cards(
+            {"user_id": current_user.id}, "created_at", projection, after, limit, response
+        )
         
         logger.info(f"사용자 {current_user.username}의 명함 {len(cards)}개 조회")
         return cards
@@ -155,27 +192,7 @@ async def get_card(card_id: str, current_user: UserInDB = Depends(get_current_ac
                 detail="명함을 찾을 수 없습니다"
             )
         
-        return BusinessCard(
-            id=str(card_data["_id"]),
-            user_id=str(card_data["user_id"]),
-            name=card_data.get("name"),
-            name_en=card_data.get("name_en"),
-            email=card_data.get("email"),
-            phone_number=card_data.get("phone_number"),
-            mobile_phone_number=card_data.get("mobile_phone_number"),
-            fax_number=card_data.get("fax_number"),
-            position=card_data.get("position"),
-            department=card_data.get("department"),
-            company_name=card_data.get("company_name"),
-            address=card_data.get("address"),
-            postal_code=card_data.get("postal_code"),
-            ocr_raw_text=card_data.get("ocr_raw_text"),
-            ocr_confidence=card_data.get("ocr_confidence"),
-            processing_status=card_data.get("processing_status"),
-            isFavorite=card_data.get("isFavorite", False),
-            created_at=card_data["created_at"],
-            updated_at=card_data["updated_at"]
-        )
+        return _card_from_doc(card_data)
         
     except HTTPException:
         raise
@@ -212,21 +229,19 @@ async def create_card(
             "ocr_raw_text": card_data.ocr_raw_text,
             "ocr_confidence": card_data.ocr_confidence,
             "processing_status": "processing",
+            "logo_hash": card_data.logo_hash,
             "isFavorite": card_data.isFavorite,
             "created_at": now,
             "updated_at": now
         }
+        card_dict.update(search_fields(card_dict))
         
         result = await db.business_cards.insert_one(card_dict)
         card_dict["_id"] = result.inserted_id
         
         logger.info(f"새 명함 생성: {card_data.name} (사용자: {current_user.username})")
         
-        return BusinessCard(
-            id=str(result.inserted_id),
-            user_id=str(current_user.id),
-            **{k: v for k, v in card_dict.items() if k not in ["_id", "user_id"]}
-        )
+        return _card_from_doc(card_dict)
         
     except Exception as e:
         logger.error(f"명함 생성 실패: {e}")
@@ -263,12 +278,19 @@ async def update_card(
             if value is not None:
                 update_data[field] = value
         
+        # 사용자가 값을 바꾼 필드는 일괄 재파싱(reparse_cards.py)에서 덮어쓰지 않도록 기록
+        edited_fields = [field for field, value in update_data.items() if existing_card.get(field) != value]
+        
         update_data["updated_at"] = datetime.utcnow()
+        update_data.update(search_fields({**existing_card, **update_data}))
         
         # 명함 업데이트
+        update_operation: Dict[str, Any] = {"$set": update_data}
+        if edited_fields:
+            update_operation["$addToSet"] = {"edited_fields": {"$each": edited_fields}}
         await db.business_cards.update_one(
             {"_id": ObjectId(card_id)},
-            {"$set": update_data}
+            update_operation
         )
         
         # 업데이트된 명함 조회
@@ -276,27 +298,7 @@ async def update_card(
         
         logger.info(f"명함 수정: {card_id} (사용자: {current_user.username})")
         
-        return BusinessCard(
-            id=str(updated_card["_id"]),
-            user_id=str(updated_card["user_id"]),
-            name=updated_card.get("name"),
-            name_en=updated_card.get("name_en"),
-            email=updated_card.get("email"),
-            phone_number=updated_card.get("phone_number"),
-            mobile_phone_number=updated_card.get("mobile_phone_number"),
-            fax_number=updated_card.get("fax_number"),
-            position=updated_card.get("position"),
-            department=updated_card.get("department"),
-            company_name=updated_card.get("company_name"),
-            address=updated_card.get("address"),
-            postal_code=updated_card.get("postal_code"),
-            ocr_raw_text=updated_card.get("ocr_raw_text"),
-            ocr_confidence=updated_card.get("ocr_confidence"),
-            processing_status=updated_card.get("processing_status"),
-            isFavorite=updated_card.get("isFavorite", False),
-            created_at=updated_card["created_at"],
-            updated_at=updated_card["updated_at"]
-        )
+        return _card_from_doc(updated_card)
         
     except HTTPException:
         raise
@@ -378,40 +380,21 @@ async def toggle_favorite(card_id: str, current_user: UserInDB = Depends(get_cur
         )
 
 @router.get("/favorites/list", response_model=List[BusinessCard])
-async def get_favorite_cards(current_user: UserInDB = Depends(get_current_active_user)):
-    """즐겨찾기 명함 목록 조회"""
+async def get_favorite_cards(
+    response: Response,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, all=전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=CARDS_MAX_PAGE_SIZE, description="페이지 크기 (생략 시 전체)"),
+    current_user: UserInDB = Depends(get_current_active_user)
+):
+    """즐겨찾기 명함 목록 조회 (최근 수정순, 커서 기반 페이지네이션)"""
+    projection = _card_projection(fields)
+    after = _decode_cursor(cursor)
     try:
-        db = get_database()
-        cards_cursor = db.business_cards.find({
-            "user_id": current_user.id,
-            "isFavorite": True
-        }).sort("updated_at", -1)
-        
-        cards = []
-        async for card_data in cards_cursor:
-            cards.append(BusinessCard(
-                id=str(card_data["_id"]),
-                user_id=str(card_data["user_id"]),
-                name=card_data.get("name"),
-                name_en=card_data.get("name_en"),
-                email=card_data.get("email"),
-                phone_number=card_data.get("phone_number"),
-                mobile_phone_number=card_data.get("mobile_phone_number"),
-                fax_number=card_data.get("fax_number"),
-                position=card_data.get("position"),
-                department=card_data.get("department"),
-                company_name=card_data.get("company_name"),
-                address=card_data.get("address"),
-                postal_code=card_data.get("postal_code"),
-                ocr_raw_text=card_data.get("ocr_raw_text"),
-                ocr_confidence=card_data.get("ocr_confidence"),
-                processing_status=card_data.get("processing_status"),
-                isFavorite=card_data.get("isFavorite", False),
-                created_at=card_data["created_at"],
-                updated_at=card_data["updated_at"]
-            ))
-        
-        return cards
+        return await _list_cards(
+            {"user_id": current_user.id, "isFavorite": True},
+            "updated_at", projection, after, limit, response
+        )
         
     except Exception as e:
         logger.error(f"즐겨찾기 목록 조회 실패: {e}")
@@ -420,12 +403,13 @@ async def get_favorite_cards(current_user: UserInDB = Depends(get_current_active
             detail="즐겨찾기 목록 조회 중 오류가 발생했습니다"
         )
 
-@router.post("/ocr", response_model=OCRResult)
+@router.post("/ocr", response_model=OCRResult, openapi_extra=upload_openapi("files"))
 async def process_ocr_and_save(
-    files: List[UploadFile] = File(...),
-    current_user: UserInDB = Depends(get_current_active_user)
+    current_user: UserInDB = Depends(get_current_active_user),
+    files: List[ReceivedUpload] = Depends(receive_uploads("files")),
+    ocr_processor: OCRProcessor = Depends(get_ocr_processor)
 ):
-    """OCR 처리 및 명함 자동 저장"""
+    """OCR 처리 및 명함 자동 저장 (작업 큐에 등록 후 즉시 응답)"""
     try:
         file = files[0] if files else None
         if not file:
@@ -441,57 +425,38 @@ async def process_ocr_and_save(
             logger.warning(f"⚠️ 지원하지 않는 파일 형식: {file.filename}")
             return OCRResult(text=[], error="지원하지 않는 파일 형식입니다.")
 
-        # uploads 폴더가 없으면 생성
-        if not os.path.exists(UPLOAD_FOLDER):
-            os.makedirs(UPLOAD_FOLDER)
-
         # 고유한 파일명 생성 (사용자별 + 타임스탬프)
-        import uuid
-        file_extension = os.path.splitext(file.filename)[1]
-        unique_filename = f"{current_user.username}_{uuid.uuid4().hex[:8]}_{int(datetime.utcnow().timestamp())}{file_extension}"
-        file_path = os.path.join(UPLOAD_FOLDER, unique_filename)
+        unique_filename = _unique_filename(current_user, file.filename)
         
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            logger.info(f"📁 파일 저장: {file_path}")
+            upload = await read_upload(file)
+        except UploadRejected as e:
+            logger.warning(f"⚠️ 업로드 거절 {file.filename}: {str(e)}")
+            return OCRResult(text=[], error=str(e))
+        
+        try:
+            logger.info(f"📁 업로드 수신: {unique_filename} ({upload.size} bytes)")
             
             # 🚨 중요: 먼저 빈 명함을 생성하여 즉시 응답
             db = get_database()
             now = datetime.utcnow()
             
             # 임시 명함 생성 (처리 중 상태)
-            temp_card_dict = {
-                "user_id": current_user.id,
-                "name": None,
-                "name_en": None,
-                "email": None,
-                "phone_number": None,
-                "mobile_phone_number": None,
-                "fax_number": None,
-                "position": None,
-                "department": None,
-                "company_name": None,
-                "address": None,
-                "postal_code": None,
-                "ocr_raw_text": "처리 중...",
-                "ocr_confidence": None,
-                "original_filename": file.filename,
-                "stored_filename": unique_filename,
-                "file_path": file_path,
-                "processing_status": "processing",  # 처리 상태 추가
-                "isFavorite": False,
-                "created_at": now,
-                "updated_at": now
-            }
+            temp_card_dict = _new_processing_card(current_user, file.filename, unique_filename, now)
             
             result = await db.business_cards.insert_one(temp_card_dict)
             card_id = str(result.inserted_id)
             logger.info(f"💾 임시 명함 생성: {card_id}")
             
-            # 백그라운드에서 OCR 처리 시작
-            import asyncio
-            asyncio.create_task(process_ocr_background(file_path, card_id, file.filename))
+            # 영속 작업 큐에 등록 (워커가 임대하여 처리, 재시작 시에도 유실되지 않음)
+            try:
+                await ocr_job_queue.enqueue(
+                    result.inserted_id, current_user.id, file.filename, upload.data, upload.sha256
+                )
+            except Exception:
+                await db.business_cards.delete_one({"_id": result.inserted_id})
+                raise
+            await ocr_event_bus.publish(current_user.id, result.inserted_id, STAGE_QUEUED)
             
             # 즉시 응답 반환 (처리 중 상태)
             return OCRResult(
@@ -504,160 +469,301 @@ async def process_ocr_and_save(
             )
             
         except Exception as e:
-            logger.error(f"❌ 파일 저장 오류 {file.filename}: {str(e)}", exc_info=True)
-            # 파일 저장 실패 시 파일 삭제
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"🗑 실패한 파일 삭제: {file_path}")
-            except Exception as cleanup_error:
-                logger.error(f"파일 삭제 오류 {file_path}: {str(cleanup_error)}")
+            logger.error(f"❌ OCR 작업 등록 오류 {file.filename}: {str(e)}", exc_info=True)
             return OCRResult(text=[], error=f"파일 저장 중 오류가 발생했습니다: {str(e)}")
                 
     except Exception as e:
         logger.error(f"❌ OCR 엔드포인트 오류: {str(e)}", exc_info=True)
         return OCRResult(text=[], error=f"서버 오류가 발생했습니다: {str(e)}")
 
-async def process_ocr_background(file_path: str, card_id: str, original_filename: str):
-    """백그라운드에서 OCR 처리"""
-    try:
-        logger.info(f"🔄 백그라운드 OCR 시작: {original_filename}")
-        logger.info(f"📁 파일 경로: {file_path}")
-        logger.info(f"🆔 카드 ID: {card_id}")
-        
-        # 파일 존재 확인
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
-        
-        logger.info(f"📄 파일 크기: {os.path.getsize(file_path)} bytes")
-        
-        # OCR 처리
-        logger.info("🔄 OCR 프로세서 호출 중...")
-        ocr_result = await ocr_processor.process_image(file_path)
-        logger.info(f"✅ OCR 처리 완료: {len(ocr_result)}개 텍스트 추출")
-        
-        # OCR 결과 로깅 (처음 5개만)
-        if ocr_result:
-            logger.info("📋 추출된 텍스트 샘플:")
-            for i, text in enumerate(ocr_result[:5]):
-                logger.info(f"  {i+1}. {text}")
-        else:
-            logger.warning("⚠️ OCR 결과가 비어있습니다")
-        
-        # OCR 결과 파싱
-        logger.info("🔄 파싱 시작...")
-        parsed_result = parse_ocr_result(ocr_result, original_filename)
-        logger.info("✅ 파싱 완료")
-        
-        # 파싱 결과 로깅
-        logger.info("📊 파싱된 정보:")
-        logger.info(f"  📛 이름: {parsed_result.get('name')}")
-        logger.info(f"  🏢 회사: {parsed_result.get('company_name')}")
-        logger.info(f"  📧 이메일: {parsed_result.get('email')}")
-        logger.info(f"  📞 전화: {parsed_result.get('phone')}")
-        logger.info(f"  💼 직책: {parsed_result.get('position')}")
-        
-        # MongoDB 업데이트
-        logger.info("💾 데이터베이스 업데이트 시작...")
-        db = get_database()
-        now = datetime.utcnow()
-        
-        update_dict = {
-            "name": parsed_result.get('name'),
-            "name_en": parsed_result.get('name_en'),
-            "email": parsed_result.get('email'),
-            "phone_number": parsed_result.get('phone'),
-            "mobile_phone_number": parsed_result.get('mobile'),
-            "fax_number": parsed_result.get('fax'),
-            "position": parsed_result.get('position'),
-            "department": parsed_result.get('department'),
-            "company_name": parsed_result.get('company_name'),
-            "address": parsed_result.get('address'),
-            "postal_code": parsed_result.get('postal_code'),
-            "ocr_raw_text": parsed_result.get('ocr_raw_text'),
-            "processing_status": "completed",  # 처리 완료
-            "updated_at": now
-        }
-        
-        await db.business_cards.update_one(
-            {"_id": ObjectId(card_id)},
-            {"$set": update_dict}
+@router.post("/ocr/batch", response_model=BatchOCRResult, openapi_extra=upload_openapi("files"))
+async def process_ocr_batch(
+    current_user: UserInDB = Depends(get_current_active_user),
+    files: List[ReceivedUpload] = Depends(receive_uploads("files")),
+    ocr_processor: OCRProcessor = Depends(get_ocr_processor)
+):
+    """여러 명함 일괄 OCR 등록 (명함 일괄 생성 후 워커가 묶음 단위로 인식)"""
+    if len(files) > OCR_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {OCR_BATCH_MAX_FILES}개까지 업로드할 수 있습니다"
         )
+    
+    logger.info(f"📥 일괄 OCR 요청: {len(files)}개 (사용자: {current_user.username})")
+    
+    batch_id = uuid.uuid4().hex
+    now = datetime.utcnow()
+    items: List[BatchOCRItem] = []
+    accepted = []  # (items 인덱스, 명함 문서, 수신한 업로드)
+    
+    for file in files:
+        if not file.filename:
+            items.append(BatchOCRItem(processing_status="rejected", error="파일명이 없습니다."))
+            continue
+        if not ocr_processor.allowed_file(file.filename):
+            items.append(BatchOCRItem(
+                filename=file.filename,
+                processing_status="rejected",
+                error="지원하지 않는 파일 형식입니다."
+            ))
+            continue
         
-        logger.info(f"💾 명함 업데이트 완료: {card_id}")
-        
-    except Exception as e:
-        logger.error(f"❌ 백그라운드 OCR 처리 오류: {str(e)}", exc_info=True)
+        try:
+            upload = await read_upload(file)
+        except UploadRejected as e:
+            items.append(BatchOCRItem(
+                filename=file.filename,
+                processing_status="rejected",
+                error=str(e)
+            ))
+            continue
+        except Exception as e:
+            logger.error(f"❌ 업로드 읽기 오류 {file.filename}: {str(e)}")
+            items.append(BatchOCRItem(
+                filename=file.filename,
+                processing_status="rejected",
+                error=f"파일을 읽을 수 없습니다: {str(e)}"
+            ))
+            continue
         
-        # 오류 상태로 업데이트
+        card = _new_processing_card(
+            current_user, file.filename, _unique_filename(current_user, file.filename), now, batch_id
+        )
+        items.append(BatchOCRItem(filename=file.filename, processing_status="processing"))
+        accepted.append((len(items) - 1, card, upload))
+    
+    if accepted:
         try:
             db = get_database()
-            await db.business_cards.update_one(
-                {"_id": ObjectId(card_id)},
-                {"$set": {
-                    "processing_status": "failed",
-                    "ocr_raw_text": f"처리 실패: {str(e)}",
-                    "updated_at": datetime.utcnow()
-                }}
+            result = await db.business_cards.insert_many([card for _, card, _ in accepted])
+            entries = []
+            for (item_index, _, upload), card_id in zip(accepted, result.inserted_ids):
+                items[item_index].card_id = str(card_id)
+                entries.append({
+                    "card_id": card_id,
+                    "user_id": current_user.id,
+                    "filename": items[item_index].filename,
+                    "data": upload.data,
+                    "sha256": upload.sha256
+                })
+            await ocr_job_queue.enqueue_many(entries, batch_id)
+            await ocr_event_bus.publish_many(entries, STAGE_QUEUED)
+            logger.info(f"💾 일괄 명함 {len(entries)}개 생성 (배치: {batch_id})")
+        except Exception as e:
+            logger.error(f"❌ 일괄 OCR 등록 실패: {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="일괄 OCR 등록 중 오류가 발생했습니다"
             )
-            logger.info(f"💾 실패 상태 업데이트 완료: {card_id}")
-        except Exception as update_error:
-            logger.error(f"상태 업데이트 실패: {str(update_error)}")
     
-    finally:
-        # 임시 파일 정리
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"🗑 임시 파일 삭제: {file_path}")
-        except Exception as cleanup_error:
-            logger.error(f"파일 정리 오류: {str(cleanup_error)}")
+    return BatchOCRResult(
+        batch_id=batch_id,
+        total=len(files),
+        accepted=len(accepted),
+        rejected=len(files) - len(accepted),
+        items=items
+    )
 
-@router.get("/search/{query}", response_model=List[BusinessCard])
-async def search_cards(query: str, current_user: UserInDB = Depends(get_current_active_user)):
-    """명함 검색"""
+@router.get("/ocr/batch/{batch_id}", response_model=BatchOCRResult)
+async def get_ocr_batch_status(batch_id: str, current_user: UserInDB = Depends(get_current_active_user)):
+    """일괄 OCR 파일별 처리 상태 조회"""
     try:
         db = get_database()
+        cards_cursor = db.business_cards.find(
+            {"user_id": current_user.id, "batch_id": batch_id},
+            {"original_filename": 1, "processing_status": 1, "ocr_raw_text": 1}
+        ).sort("_id", 1)
         
-        # 텍스트 검색 쿼리
-        search_filter = {
-            "user_id": current_user.id,
-            "$or": [
-                {"name": {"$regex": query, "$options": "i"}},
-                {"email": {"$regex": query, "$options": "i"}},
-                {"phone_number": {"$regex": query, "$options": "i"}},
-                {"company_name": {"$regex": query, "$options": "i"}},
-                {"position": {"$regex": query, "$options": "i"}},
-                {"department": {"$regex": query, "$options": "i"}}
-            ]
-        }
-        
-        cards_cursor = db.business_cards.find(search_filter).sort("created_at", -1)
-        
-        cards = []
+        items = []
         async for card_data in cards_cursor:
-            cards.append(BusinessCard(
-                id=str(card_data["_id"]),
-                user_id=str(card_data["user_id"]),
-                name=card_data.get("name"),
-                name_en=card_data.get("name_en"),
-                email=card_data.get("email"),
-                phone_number=card_data.get("phone_number"),
-                mobile_phone_number=card_data.get("mobile_phone_number"),
-                fax_number=card_data.get("fax_number"),
-                position=card_data.get("position"),
-                department=card_data.get("department"),
-                company_name=card_data.get("company_name"),
-                address=card_data.get("address"),
-                postal_code=card_data.get("postal_code"),
-                ocr_raw_text=card_data.get("ocr_raw_text"),
-                ocr_confidence=card_data.get("ocr_confidence"),
+            failed = card_data.get("processing_status") == "failed"
+            items.append(BatchOCRItem(
+                filename=card_data.get("original_filename"),
+                card_id=str(card_data["_id"]),
                 processing_status=card_data.get("processing_status"),
-                isFavorite=card_data.get("isFavorite", False),
-                created_at=card_data["created_at"],
-                updated_at=card_data["updated_at"]
+                error=card_data.get("ocr_raw_text") if failed else None
             ))
         
+        if not items:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="일괄 처리 내역을 찾을 수 없습니다"
+            )
+        
+        return BatchOCRResult(batch_id=batch_id, total=len(items), accepted=len(items), items=items)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 처리 상태 조회 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="일괄 처리 상태 조회 중 오류가 발생했습니다"
+        )
+
+# 목록 응답에서 항상 포함하는 필드 (BusinessCard 필수 필드)
+_REQUIRED_CARD_FIELDS = ("user_id", "created_at", "updated_at")
+# 목록 조회 시 기본으로 제외하는 큰 필드
+_HEAVY_CARD_FIELDS = ("ocr_raw_text", "search_tokens", "search_initials", "search_digits")
+
+def _sse_progress(event: Dict[str, Any]) -> str:
+    """진행 이벤트를 SSE 메시지로 변환 (id는 재연결 시 Last-Event-ID로 사용)"""
+    data = {"card_id": event["card_id"], "stage": event["stage"]}
+    for key in ("error", "retry"):
+        if key in event:
+            data[key] = event[key]
+    return f"id: {event['_id']}\nevent: progress\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _card_from_doc(card_data: dict) -> BusinessCard:
+    """MongoDB 명함 문서를 응답 모델로 변환 (프로젝션으로 빠진 필드는 None)"""
+    return BusinessCard(
+        id=str(card_data["_id"]),
+        user_id=str(card_data["user_id"]),
+        name=card_data.get("name"),
+        name_en=card_data.get("name_en"),
+        email=card_data.get("email"),
+        phone_number=card_data.get("phone_number"),
+        mobile_phone_number=card_data.get("mobile_phone_number"),
+        fax_number=card_data.get("fax_number"),
+        position=card_data.get("position"),
+        department=card_data.get("department"),
+        company_name=card_data.get("company_name"),
+        address=card_data.get("address"),
+        postal_code=card_data.get("postal_code"),
+        ocr_raw_text=card_data.get("ocr_raw_text"),
+        ocr_confidence=card_data.get("ocr_confidence"),
+        processing_status=card_data.get("processing_status"),
+        logo_hash=card_data.get("logo_hash"),
+        isFavorite=card_data.get("isFavorite", False),
+        created_at=card_data["created_at"],
+        updated_at=card_data["updated_at"]
+    )
+
+def _card_projection(fields: Optional[str]) -> Optional[Dict[str, int]]:
+    """fields 파라미터를 MongoDB 프로젝션으로 변환
+
+    생략 시 ocr_raw_text 등 큰 필드를 제외한 전체, "all"이면 모든 필드(None)를 반환합니다.
+    """
+    if fields is None:
+        return {field: 0 for field in _HEAVY_CARD_FIELDS}
+    if fields.strip() == "all":
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    allowed = set(BusinessCard.model_fields) - {"id"}
+    unknown = requested - allowed
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}"
+        )
+    return {field: 1 for field in requested | set(_REQUIRED_CARD_FIELDS)}
+
+def _encode_cursor(sort_value: datetime, card_id: ObjectId) -> str:
+    """페이지 마지막 명함의 (정렬 값, _id)를 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps({"v": sort_value.isoformat(), "id": str(card_id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, ObjectId]]:
+    """커서 문자열 복원 (잘못된 커서는 400)"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(data["v"]), ObjectId(data["id"])
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 페이지 커서입니다"
+        )
+
+async def _list_cards(query: Dict[str, Any], sort_field: str,
+                      projection: Optional[Dict[str, int]],
+                      after: Optional[Tuple[datetime, ObjectId]],
+                      limit: Optional[int], response: Response,
+                      hint: Optional[str] = None) -> List[BusinessCard]:
+    """(sort_field, _id) 내림차순 키셋 페이지네이션으로 명함 목록 조회
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담습니다.
+    """
+    db = get_database()
+    if after is not None:
+        sort_value, last_id = after
+        query = {"$and": [query, {"$or": [
+            {sort_field: {"$lt": sort_value}},
+            {sort_field: sort_value, "_id": {"$lt": last_id}}
+        ]}]}
+
+    cards_cursor = db.business_cards.find(query, projection).sort(
+        [(sort_field, -1), ("_id", -1)]
+    )
+    if hint is not None:
+        cards_cursor = cards_cursor.hint(hint)
+    if limit is not None:
+        # 다음 페이지 존재 여부 확인용으로 하나 더 조회
+        cards_cursor = cards_cursor.limit(limit + 1)
+
+    docs = await cards_cursor.to_list(length=None)
+    if limit is not None and len(docs) > limit:
+        docs = docs[:limit]
+        last = docs[-1]
+        response.headers["X-Next-Cursor"] = _encode_cursor(last[sort_field], last["_id"])
+
+    return [_card_from_doc(card_data) for card_data in docs]
+
+def _unique_filename(user: UserInDB, filename: str) -> str:
+    """고유한 저장 파일명 생성 (사용자별 + 타임스탬프)"""
+    file_extension = os.path.splitext(filename)[1]
+    return f"{user.username}_{uuid.uuid4().hex[:8]}_{int(datetime.utcnow().timestamp())}{file_extension}"
+
+def _new_processing_card(user: UserInDB, filename: str, stored_filename: str,
+                         now: datetime, batch_id: Optional[str] = None) -> dict:
+    """OCR 처리 중 상태의 빈 명함 문서"""
+    return {
+        "user_id": user.id,
+        "name": None,
+        "name_en": None,
+        "email": None,
+        "phone_number": None,
+        "mobile_phone_number": None,
+        "fax_number": None,
+        "position": None,
+        "department": None,
+        "company_name": None,
+        "address": None,
+        "postal_code": None,
+        "ocr_raw_text": "처리 중...",
+        "ocr_confidence": None,
+        "original_filename": filename,
+        "stored_filename": stored_filename,
+        "file_path": None,
+        "batch_id": batch_id,
+        "processing_status": "processing",  # 처리 상태 추가
+        "isFavorite": False,
+        "created_at": now,
+        "updated_at": now
+    }
+
+@router.get("/search/{query}", response_model=List[BusinessCard])
+async def search_cards(
+    query: str,
+    response: Response,
+    fields: Optional[str] = Query(None, description="응답에 포함할 필드 (쉼표 구분, all=전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: Optional[int] = Query(None, ge=1, le=CARDS_MAX_PAGE_SIZE, description="페이지 크기 (생략 시 전체)"),
+    current_user: UserInDB = Depends(get_current_active_user)
+):
+    """명함 검색 (최신순, 커서 기반 페이지네이션)"""
+    projection = _card_projection(fields)
+    after = _decode_cursor(cursor)
+    try:
+        # 검색 토큰 인덱스로 후보를 찾고 부분 일치로 거름
+        search_filter = build_search_query(current_user.id, query)
+        hint = SEARCH_INDEX_NAME if "search_tokens" in search_filter else None
+        
+        cards = await _list_cards(search_filter, "created_at", projection, after, limit, response, hint)
+        
         logger.info(f"검색 완료: '{query}' -> {len(cards)}개 결과")
         return cards
         
@@ -0,0 +1,218 @@
+"""
+명함 검색 색인
+명함마다 정규화된 검색 토큰을 저장하고 (user_id, search_tokens) 복합 인덱스로 검색합니다.
+
+토큰 종류:
+    g:<2글자>   한글/영문/숫자 단어의 bigram (부분 문자열 검색)
+    u:<1글자>   한글 음절 unigram (한 글자 검색, 예: "김")
+    c:<2글자>   초성 bigram (초성 검색, 예: "ㄱㅊㅅ")
+    p:<4자리>   필드별로 숫자만 이어 붙인 값의 4-gram (하이픈 유무와 무관한 번호 검색,
+                전화번호 외에 이메일/회사명 등에 포함된 숫자도 같은 질의로 찾을 수 있도록 함)
+
+검색 질의도 같은 방식으로 토큰화하여 $all로 후보를 인덱스에서 찾고,
+search_initials / search_digits 및 원본 필드에 대한 부분 일치 조건으로 최종 결과를 거릅니다.
+
+기존 명함과 이전 버전(SEARCH_INDEX_VERSION)으로 색인된 명함은 API 시작 시 백그라운드로 채워지며,
+수동으로 실행할 수도 있습니다:
+    python card_search.py --backfill
+"""
+
+import argparse
+import asyncio
+import logging
+import re
+import sys
+import time
+import unicodedata
+from typing import Any, Dict, List
+
+from pymongo import UpdateOne
+
+from database import get_database, connect_to_mongo, close_mongo_connection
+
+logger = logging.getLogger(__name__)
+
+# 검색 대상 필드
+SEARCH_FIELDS = [
+    'name', 'name_en', 'email', 'phone_number', 'mobile_phone_number',
+    'company_name', 'position', 'department'
+]
+PHONE_FIELDS = ['phone_number', 'mobile_phone_number', 'fax_number']
+
+# (user_id, search_tokens) 인덱스 이름 (database.create_indexes에서 생성) - 검색 시 hint로 사용
+SEARCH_INDEX_NAME = "user_search_tokens"
+
+CHOSUNG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ'
+]
+_CHOSUNG_SET = frozenset(CHOSUNG)
+
+_WORD_RE = re.compile(r'[0-9a-z가-힣]+')
+_HANGUL_RE = re.compile(r'[가-힣]')
+_PHONE_QUERY_RE = re.compile(r'^[\d\s\-+().]+$')
+_DIGIT_GRAM = 4
+
+# 토큰 생성 규칙이 바뀌면 올려서 시작 시 백필이 기존 색인을 다시 만들도록 함
+SEARCH_INDEX_VERSION = 2
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def _is_hangul(char: str) -> bool:
+    return '가' <= char <= '힣'
+
+
+def _initials(text: str) -> str:
+    """한글 음절의 초성만 이어 붙인 문자열 (한글 이외의 문자는 제외)"""
+    return ''.join(CHOSUNG[(ord(ch) - 0xAC00) // 588] for ch in text if _is_hangul(ch))
+
+
+def _digits(text: str) -> str:
+    return ''.join(ch for ch in text if ch.isdigit())
+
+
+def _grams(text: str, size: int) -> List[str]:
+    return [text[i:i + size] for i in range(len(text) - size + 1)]
+
+
+def search_fields(card: Dict[str, Any]) -> Dict[str, Any]:
+    """명함 문서에 저장할 검색 색인 필드 계산"""
+    tokens = set()
+    initials = []
+    digits = []
+
+    for field in SEARCH_FIELDS:
+        value = card.get(field)
+        if not value:
+            continue
+        normalized = _normalize(str(value))
+        for word in _WORD_RE.findall(normalized):
+            tokens.update('g:' + gram for gram in _grams(word, 2))
+            tokens.update('u:' + ch for ch in word if _is_hangul(ch))
+        field_initials = _initials(normalized)
+        if field_initials:
+            initials.append(field_initials)
+            tokens.update('c:' + gram for gram in _grams(field_initials, 2))
+        # 숫자 검색은 모든 필드의 숫자에 대해 p: 토큰을 요구하므로 전화번호 외 필드도 색인
+        tokens.update('p:' + gram for gram in _grams(_digits(normalized), _DIGIT_GRAM))
+
+    for field in PHONE_FIELDS:
+        value = card.get(field)
+        if not value:
+            continue
+        phone_digits = _digits(str(value))
+        if phone_digits:
+            digits.append(phone_digits)
+            tokens.update('p:' + gram for gram in _grams(phone_digits, _DIGIT_GRAM))
+
+    return {
+        "search_tokens": sorted(tokens),
+        "search_initials": ' '.join(initials),
+        "search_digits": ' '.join(digits),
+        "search_version": SEARCH_INDEX_VERSION
+    }
+
+
+def _token_rank(token: str) -> int:
+    """인덱스 범위로 쓰일 첫 토큰을 고르기 위한 선택도 순위 (낮을수록 희귀)"""
+    if token.startswith('p:'):
+        return 0
+    if _HANGUL_RE.search(token):
+        return 1 if token.startswith('g:') else 2
+    if token.startswith('c:'):
+        return 3
+    return 4
+
+
+def build_search_query(user_id: Any, query: str) -> Dict[str, Any]:
+    """검색어를 MongoDB 조건으로 변환
+
+    토큰을 만들 수 있으면 search_tokens $all 조건(인덱스 조회)과 부분 일치 필터를 함께 반환하고,
+    토큰이 없는 한 글자 영문/초성 검색은 사용자 명함 범위에서 부분 일치 필터만 적용합니다.
+    """
+    stripped = query.strip()
+    normalized = _normalize(stripped)
+    # NFKC는 호환용 자모(ㄱ)를 조합용 자모로 바꾸므로 초성 판별은 NFC 기준
+    compact = re.sub(r'\s+', '', unicodedata.normalize('NFC', stripped))
+    tokens: List[str] = []
+
+    if compact and all(ch in _CHOSUNG_SET for ch in compact):
+        # 초성 검색
+        tokens = ['c:' + gram for gram in _grams(compact, 2)]
+        match = [{"search_initials": {"$regex": re.escape(compact)}}]
+    elif _PHONE_QUERY_RE.match(stripped) and len(_digits(stripped)) >= _DIGIT_GRAM:
+        # 전화번호 검색 (하이픈/공백 무시)
+        query_digits = _digits(stripped)
+        tokens = ['p:' + gram for gram in _grams(query_digits, _DIGIT_GRAM)]
+        match = [{"search_digits": {"$regex": re.escape(query_digits)}}]
+        match += [{field: {"$regex": re.escape(stripped), "$options": "i"}} for field in SEARCH_FIELDS]
+    else:
+        for word in _WORD_RE.findall(normalized):
+            if len(word) >= 2:
+                tokens.extend('g:' + gram for gram in _grams(word, 2))
+            elif _is_hangul(word):
+                tokens.append('u:' + word)
+        match = [{field: {"$regex": re.escape(stripped), "$options": "i"}} for field in SEARCH_FIELDS]
+
+    search_filter: Dict[str, Any] = {"user_id": user_id, "$or": match}
+    if tokens:
+        search_filter["search_tokens"] = {"$all": sorted(set(tokens), key=lambda t: (_token_rank(t), t))}
+    return search_filter
+
+
+async def backfill_search_fields(batch_size: int = 1000, only_missing: bool = True) -> int:
+    """기존 명함에 검색 색인 필드를 채움. 갱신한 명함 수 반환
+
+    only_missing=True이면 색인이 없거나 이전 버전(SEARCH_INDEX_VERSION)으로 만든 명함만 갱신합니다.
+    """
+    db = get_database()
+    query = {"search_version": {"$ne": SEARCH_INDEX_VERSION}} if only_missing else {}
+    projection = {field: 1 for field in set(SEARCH_FIELDS) | set(PHONE_FIELDS)}
+    cursor = db.business_cards.find(query, projection).batch_size(batch_size)
+
+    updated = 0
+    operations = []
+    async for card in cursor:
+        operations.append(UpdateOne({"_id": card["_id"]}, {"$set": search_fields(card)}))
+        if len(operations) >= batch_size:
+            await db.business_cards.bulk_write(operations, ordered=False)
+            updated += len(operations)
+            operations = []
+            logger.info(f"🔎 검색 색인 생성 중: {updated}개")
+    if operations:
+        await db.business_cards.bulk_write(operations, ordered=False)
+        updated += len(operations)
+    return updated
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="명함 검색 색인 관리")
+    parser.add_argument('--backfill', action='store_true', help="검색 색인이 없거나 오래된 명함에 색인 생성")
+    parser.add_argument('--rebuild', action='store_true', help="모든 명함의 검색 색인 재생성")
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    if not (args.backfill or args.rebuild):
+        parser.print_help()
+        return
+
+    # connect_to_mongo에서 검색 인덱스도 함께 생성됨
+    await connect_to_mongo()
+    try:
+        started = time.perf_counter()
+        updated = await backfill_search_fields(args.batch_size, only_missing=not args.rebuild)
+        print(f"✅ 검색 색인 {updated}개 갱신 ({time.perf_counter() - started:.1f}s)")
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    asyncio.run(main())
@@ -14,4 +14,98 @@ MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "cardlet_db")
 
 # 서버 설정
-DEBUG = os.getenv("DEBUG", "True").lower() == "true" 
\ No newline at end of file
+DEBUG = os.getenv("DEBUG", "True").lower() == "true"
+
+# OCR 엔진 설정
+UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "uploads")
+OCR_PRELOAD_MODELS = os.getenv("OCR_PRELOAD_MODELS", "True").lower() == "true"
+OCR_PRELOAD_LOGO_MODEL = os.getenv("OCR_PRELOAD_LOGO_MODEL", "False").lower() == "true"
+OCR_ENGINE = os.getenv("OCR_ENGINE", "easyocr")  # easyocr: PyTorch, onnx: ONNX Runtime, onnx-int8: INT8 동적 양자화 모델
+OCR_ONNX_MODEL_DIR = os.getenv("OCR_ONNX_MODEL_DIR", "models/easyocr")
+# ONNX intra-op 스레드 수 (0이면 ONNX Runtime 기본값, thread 실행기 워커 수 x 스레드 수가 코어 수를 넘지 않게 설정)
+OCR_ONNX_THREADS = int(os.getenv("OCR_ONNX_THREADS", "0"))
+OCR_MAX_IMAGE_SIDE = int(os.getenv("OCR_MAX_IMAGE_SIDE", "2048"))  # 디코딩 후 긴 변 최대 길이 (0이면 원본 유지)
+
+# 업로드 수신 설정
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))  # 파일당 최대 크기
+UPLOAD_MAX_PIXELS = int(os.getenv("UPLOAD_MAX_PIXELS", str(50_000_000)))  # 이미지당 최대 픽셀 수
+UPLOAD_MAX_REQUEST_BYTES = int(os.getenv("UPLOAD_MAX_REQUEST_BYTES", str(200 * 1024 * 1024)))  # multipart 요청 전체
+UPLOAD_READ_CHUNK_BYTES = int(os.getenv("UPLOAD_READ_CHUNK_BYTES", str(256 * 1024)))
+UPLOAD_RETAIN_ORIGINALS = os.getenv("UPLOAD_RETAIN_ORIGINALS", "False").lower() == "true"  # 원본을 UPLOAD_FOLDER에 보관
+
+# 방향 감지 설정 (full: 4방향 전체 OCR, fast: 검출기 통계 + 샘플 인식, off: 비활성화)
+ORIENTATION_MODE = os.getenv("ORIENTATION_MODE", "fast").lower()
+ORIENTATION_MAX_SIDE = int(os.getenv("ORIENTATION_MAX_SIDE", "960"))
+ORIENTATION_SAMPLE_CROPS = int(os.getenv("ORIENTATION_SAMPLE_CROPS", "5"))
+ORIENTATION_EARLY_EXIT_CONFIDENCE = float(os.getenv("ORIENTATION_EARLY_EXIT_CONFIDENCE", "0.75"))
+
+# 기울기 추정 설정 (contour: 원본 해상도 윤곽선, projection: 축소 이미지 투영 프로파일)
+SKEW_METHOD = os.getenv("SKEW_METHOD", "contour").lower()
+SKEW_MAX_SIDE = int(os.getenv("SKEW_MAX_SIDE", "1000"))  # projection 방식의 축소 긴 변 길이
+SKEW_MAX_ANGLE = float(os.getenv("SKEW_MAX_ANGLE", "15"))  # projection 방식의 탐색 범위 (±도)
+DESKEW_MODE = os.getenv("DESKEW_MODE", "image").lower()  # image: 이미지 회전 후 재검출, boxes: 검출 박스 각도로 영역별 보정
+
+# OCR 작업 실행기 설정 (thread: 모델 공유, process: 워커 프로세스마다 모델 별도 로드)
+OCR_EXECUTOR_KIND = os.getenv("OCR_EXECUTOR_KIND", "thread").lower()
+OCR_EXECUTOR_WORKERS = int(os.getenv("OCR_EXECUTOR_WORKERS", "2"))
+OCR_MAX_CONCURRENCY = int(os.getenv("OCR_MAX_CONCURRENCY", "2"))
+OCR_MAX_QUEUE = int(os.getenv("OCR_MAX_QUEUE", "0"))  # 0이면 대기열 제한 없음
+
+# OCR 작업 큐 설정
+OCR_EMBEDDED_WORKER = os.getenv("OCR_EMBEDDED_WORKER", "True").lower() == "true"  # API 프로세스에서 워커 실행 여부
+OCR_WORKER_CONCURRENCY = int(os.getenv("OCR_WORKER_CONCURRENCY", "2"))
+OCR_JOB_MAX_ATTEMPTS = int(os.getenv("OCR_JOB_MAX_ATTEMPTS", "3"))
+OCR_JOB_LEASE_SECONDS = int(os.getenv("OCR_JOB_LEASE_SECONDS", "300"))
+OCR_JOB_RETRY_BASE_SECONDS = int(os.getenv("OCR_JOB_RETRY_BASE_SECONDS", "10"))
+OCR_JOB_RETRY_MAX_SECONDS = int(os.getenv("OCR_JOB_RETRY_MAX_SECONDS", "600"))
+OCR_JOB_POLL_SECONDS = float(os.getenv("OCR_JOB_POLL_SECONDS", "1.0"))
+
+# 일괄 OCR 설정
+OCR_BATCH_MAX_FILES = int(os.getenv("OCR_BATCH_MAX_FILES", "200"))
+OCR_RECOGNITION_BATCH_SIZE = int(os.getenv("OCR_RECOGNITION_BATCH_SIZE", "32"))  # 인식 모델 1회 호출당 텍스트 영역 수
+OCR_WORKER_BATCH_SIZE = int(os.getenv("OCR_WORKER_BATCH_SIZE", "8"))  # 워커가 한 번에 묶어 처리하는 명함 수
+
+# PDF 처리 설정
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "20"))  # 처리할 최대 페이지 수 (0이면 제한 없음)
+PDF_MIN_TEXT_CHARS = int(os.getenv("PDF_MIN_TEXT_CHARS", "20"))  # 이 글자 수 이상이면 텍스트 레이어 사용 (OCR 생략)
+PDF_RENDER_MAX_ZOOM = float(os.getenv("PDF_RENDER_MAX_ZOOM", "4.0"))  # 작은 페이지 렌더링 최대 배율
+
+# 로고 추출 설정
+LOGO_INFERENCE_SIZE = int(os.getenv("LOGO_INFERENCE_SIZE", "320"))  # YOLO 입력 정사각형 한 변 (32의 배수)
+LOGO_BACKEND = os.getenv("LOGO_BACKEND", "torch")  # torch: ultralytics, onnx: ONNX Runtime, onnx-int8: INT8 양자화 모델
+LOGO_TORCH_WEIGHTS = os.getenv("LOGO_TORCH_WEIGHTS", "yolov8n.pt")
+LOGO_ONNX_MODEL_PATH = os.getenv("LOGO_ONNX_MODEL_PATH", "models/yolov8n.onnx")  # INT8은 같은 경로의 -int8.onnx
+LOGO_ONNX_THREADS = int(os.getenv("LOGO_ONNX_THREADS", "0"))  # intra-op 스레드 수 (0이면 ONNX Runtime 기본값)
+LOGO_ONNX_PROVIDER = os.getenv("LOGO_ONNX_PROVIDER", "CPUExecutionProvider")  # 예: OpenVINOExecutionProvider
+
+# 로고 저장소 설정 (지각 해시 기반 중복 제거 + 참조 없는 파일 정리)
+LOGO_STORE_HASH_DISTANCE = int(os.getenv("LOGO_STORE_HASH_DISTANCE", "4"))  # 이 해밍 거리 이하면 같은 로고 (0이면 완전 일치만)
+LOGO_STORE_WEBP_QUALITY = int(os.getenv("LOGO_STORE_WEBP_QUALITY", "90"))
+LOGO_STORE_GC_INTERVAL_SECONDS = float(os.getenv("LOGO_STORE_GC_INTERVAL_SECONDS", "3600"))  # 0이면 GC 비활성화
+LOGO_STORE_ORPHAN_GRACE_SECONDS = float(os.getenv("LOGO_STORE_ORPHAN_GRACE_SECONDS", "86400"))  # 명함 저장 전 로고 보존 시간
+
+# OCR 결과 캐시 설정 (업로드 바이트 해시 기준)
+OCR_CACHE_ENABLED = os.getenv("OCR_CACHE_ENABLED", "True").lower() == "true"
+OCR_CACHE_MAX_ENTRIES = int(os.getenv("OCR_CACHE_MAX_ENTRIES", "512"))  # 프로세스 내 LRU 크기
+OCR_CACHE_TTL_SECONDS = int(os.getenv("OCR_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+OCR_CACHE_MONGO_ENABLED = os.getenv("OCR_CACHE_MONGO_ENABLED", "True").lower() == "true"
+
+# 명함 목록 페이지네이션 설정
+CARDS_MAX_PAGE_SIZE = int(os.getenv("CARDS_MAX_PAGE_SIZE", "200"))
+
+# 인증 사용자 캐시 설정
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+# true이면 캐시 미스 시에도 토큰 클레임(uid, email 등)으로 사용자를 구성하여 DB 조회 생략
+# (비활성화/정보 변경이 토큰 만료 전까지 반영되지 않을 수 있음)
+AUTH_TRUST_TOKEN_CLAIMS = os.getenv("AUTH_TRUST_TOKEN_CLAIMS", "False").lower() == "true"
+
+# 패스워드 해싱 설정
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))  # 새 해시의 bcrypt 비용 (passlib 기본값 12)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # 동시 해싱 스레드 수
+
+# OCR 진행 이벤트(SSE) 설정
+OCR_EVENTS_BACKEND = os.getenv("OCR_EVENTS_BACKEND", "mongo")  # mongo: 레플리카 간 공유, memory: 단일 프로세스
+OCR_EVENTS_CAPPED_BYTES = int(os.getenv("OCR_EVENTS_CAPPED_BYTES", str(16 * 1024 * 1024)))
+OCR_EVENTS_SUBSCRIBER_QUEUE = int(os.getenv("OCR_EVENTS_SUBSCRIBER_QUEUE", "256"))
+OCR_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("OCR_EVENTS_KEEPALIVE_SECONDS", "15"))
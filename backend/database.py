@@ -5,6 +5,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 새 인덱스로 대체되어 더 이상 쓰지 않는 인덱스 (쓰기마다 비용이 들므로 시작 시 삭제)
+LEGACY_INDEXES = {
+    "business_cards": [
+        "user_id_1_created_at_-1",  # → (user_id, created_at, _id) 키셋 페이지네이션 인덱스
+        "user_id_1_company_name_text_name_text_email_text"  # → user_search_tokens 검색 토큰 인덱스
+    ]
+}
+
 class Database:
     client: AsyncIOMotorClient = None
     database = None
@@ -41,22 +49,42 @@ async def create_indexes():
         await Database.database.users.create_index("username", unique=True)
         
         # 명함 컬렉션 인덱스
+        # 목록 조회 키셋 페이지네이션 (created_at, _id) / 즐겨찾기 (updated_at, _id)
         await Database.database.business_cards.create_index([
             ("user_id", pymongo.ASCENDING),
-            ("created_at", pymongo.DESCENDING)
+            ("created_at", pymongo.DESCENDING),
+            ("_id", pymongo.DESCENDING)
         ])
         await Database.database.business_cards.create_index([
             ("user_id", pymongo.ASCENDING),
-            ("company_name", pymongo.TEXT),
-            ("name", pymongo.TEXT),
-            ("email", pymongo.TEXT)
+            ("isFavorite", pymongo.ASCENDING),
+            ("updated_at", pymongo.DESCENDING),
+            ("_id", pymongo.DESCENDING)
         ])
+        # 명함 검색 토큰 (card_search.SEARCH_INDEX_NAME)
+        await Database.database.business_cards.create_index([
+            ("user_id", pymongo.ASCENDING),
+            ("search_tokens", pymongo.ASCENDING)
+        ], name="user_search_tokens")
         
+        await drop_legacy_indexes()
         logger.info("✅ MongoDB 인덱스 생성 완료")
         
     except Exception as e:
         logger.error(f"❌ 인덱스 생성 실패: {e}")
 
+async def drop_legacy_indexes():
+    """대체된 이전 인덱스 삭제 (이미 없으면 무시)"""
+    for collection, names in LEGACY_INDEXES.items():
+        for name in names:
+            try:
+                await Database.database[collection].drop_index(name)
+                logger.info(f"🧹 이전 인덱스 삭제: {collection}.{name}")
+            except pymongo.errors.OperationFailure as e:
+                # IndexNotFound(27) / 컬렉션 없음(26)은 정상
+                if e.code not in (26, 27):
+                    logger.warning(f"이전 인덱스 삭제 실패 {collection}.{name}: {e}")
+
 def get_database():
     """데이터베이스 인스턴스 반환"""
     if Database.database is None:
@@ -0,0 +1,239 @@
+"""
+로고 탐지 추론 백엔드
+LogoExtractor가 사용하는 YOLO 객체 탐지기를 백엔드별로 제공합니다.
+
+- torch: ultralytics + PyTorch로 yolov8n.pt 실행 (기존 방식)
+- onnx: ONNX Runtime으로 로컬 .onnx 모델 실행 (ultralytics/torch 불필요)
+- onnx-int8: INT8 양자화된 .onnx 모델 실행
+
+ONNX 모델은 서버 시작 전에 한 번 내보내 둡니다 (ultralytics가 설치된 환경에서 실행):
+    python logo_detector.py export [--calibration <명함 이미지 폴더>]
+
+LOGO_ONNX_PROVIDER를 OpenVINOExecutionProvider로 지정하면 onnxruntime-openvino로 실행합니다.
+"""
+
+import argparse
+import ast
+import logging
+import os
+import shutil
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from config import (
+    LOGO_BACKEND,
+    LOGO_INFERENCE_SIZE,
+    LOGO_ONNX_MODEL_PATH,
+    LOGO_ONNX_PROVIDER,
+    LOGO_ONNX_THREADS,
+    LOGO_TORCH_WEIGHTS
+)
+from onnx_utils import int8_model_path
+
+logger = logging.getLogger(__name__)
+
+# ultralytics predict 기본값과 같은 기준 (백엔드 간 후보가 일치하도록)
+_CONF_THRESHOLD = 0.25
+_NMS_IOU = 0.7
+_MAX_DETECTIONS = 300
+
+# 탐지 결과: (클래스 이름, 신뢰도, letterbox 텐서 좌표 [x1, y1, x2, y2])
+Detection = Tuple[str, float, List[float]]
+
+
+class TorchYOLODetector:
+    """ultralytics + PyTorch YOLO 탐지기"""
+
+    backend = "torch"
+    input_size = None  # 32의 배수면 어떤 크기든 입력 가능
+
+    def __init__(self, weights: str = LOGO_TORCH_WEIGHTS):
+        import torch
+        from ultralytics import YOLO
+
+        self._torch = torch
+        self._yolo = YOLO(weights)
+        self.names: Dict[int, str] = self._yolo.names
+
+        # GPU 사용 가능 여부 확인
+        if torch.cuda.is_available():
+            logger.info("GPU 사용 가능 - CUDA 가속 활성화")
+        else:
+            logger.info("CPU 모드로 실행")
+
+    @property
+    def model(self):
+        """torch 모듈 (레지스트리의 파라미터 메모리 집계용)"""
+        return self._yolo.model
+
+    def detect(self, letterboxed) -> List[Detection]:
+        results = self._yolo(self._torch.from_numpy(letterboxed.tensor), verbose=False)
+        detections = []
+        for result in results:
+            if result.boxes is None:
+                continue
+            for box in result.boxes:
+                detections.append((self.names[int(box.cls[0])], float(box.conf[0]), box.xyxy[0].tolist()))
+        return detections
+
+
+class OnnxYOLODetector:
+    """ONNX Runtime YOLOv8 탐지기 (출력 디코딩과 NMS를 numpy/OpenCV로 처리)"""
+
+    backend = "onnx"
+    model = None  # torch 모듈 없음
+
+    def __init__(self, model_path: str = LOGO_ONNX_MODEL_PATH, threads: int = LOGO_ONNX_THREADS,
+                 provider: str = LOGO_ONNX_PROVIDER):
+        import onnxruntime as ort
+
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"ONNX 로고 모델이 없습니다: {model_path} (python logo_detector.py export 로 생성)"
+            )
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.inter_op_num_threads = 1
+        if threads:
+            options.intra_op_num_threads = threads
+        providers = [provider] if provider == "CPUExecutionProvider" else [provider, "CPUExecutionProvider"]
+
+        self.model_path = model_path
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        # 고정 크기로 내보낸 모델은 입력 크기를 모델에 맞춤
+        self.input_size = model_input.shape[2] if isinstance(model_input.shape[2], int) else None
+
+        # ultralytics export가 메타데이터에 클래스 이름을 기록
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.names: Dict[int, str] = ast.literal_eval(metadata["names"]) if "names" in metadata else {}
+        logger.info(f"ONNX 로고 모델 로드: {model_path} ({self.session.get_providers()[0]})")
+
+    def detect(self, letterboxed) -> List[Detection]:
+        # 출력 (1, 4 + 클래스 수, 앵커 수): cx, cy, w, h + 클래스별 점수
+        predictions = self.session.run(None, {self.input_name: letterboxed.tensor})[0][0].T
+        scores = predictions[:, 4:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(scores)), class_ids]
+
+        keep = confidences >= _CONF_THRESHOLD
+        if not keep.any():
+            return []
+        predictions, class_ids, confidences = predictions[keep], class_ids[keep], confidences[keep]
+
+        centers, sizes = predictions[:, :2], predictions[:, 2:4]
+        corners = centers - sizes / 2
+        indices = cv2.dnn.NMSBoxesBatched(
+            np.concatenate([corners, sizes], axis=1).tolist(),
+            confidences.tolist(), class_ids.tolist(), _CONF_THRESHOLD, _NMS_IOU
+        )
+
+        detections = []
+        for i in np.asarray(indices, dtype=np.int64).reshape(-1)[:_MAX_DETECTIONS]:
+            x1, y1 = corners[i]
+            x2, y2 = corners[i] + sizes[i]
+            class_id = int(class_ids[i])
+            detections.append((self.names.get(class_id, str(class_id)), float(confidences[i]),
+                               [float(x1), float(y1), float(x2), float(y2)]))
+        return detections
+
+
+def create_logo_detector(backend: str = LOGO_BACKEND):
+    """설정된 백엔드의 로고 탐지기 생성"""
+    backend = backend.lower()
+    if backend == "torch":
+        return TorchYOLODetector()
+    if backend == "onnx":
+        return OnnxYOLODetector(LOGO_ONNX_MODEL_PATH)
+    if backend == "onnx-int8":
+        detector = OnnxYOLODetector(int8_model_path(LOGO_ONNX_MODEL_PATH))
+        detector.backend = "onnx-int8"
+        return detector
+    raise ValueError(f"지원하지 않는 로고 탐지 백엔드입니다: {backend}")
+
+
+def _calibration_reader(input_name: str, folder: str, size: int, limit: int):
+    """정적 양자화용 보정 데이터 (명함 이미지를 추론과 같은 방식으로 letterbox)"""
+    from onnxruntime.quantization import CalibrationDataReader
+
+    from logo_extractor import letterbox
+
+    class CardCalibrationReader(CalibrationDataReader):
+        def __init__(self):
+            names = [name for name in sorted(os.listdir(folder))
+                     if name.lower().endswith(('.png', '.jpg', '.jpeg'))][:limit]
+            self._paths = iter(os.path.join(folder, name) for name in names)
+
+        def get_next(self) -> Optional[dict]:
+            for path in self._paths:
+                image = cv2.imread(path)
+                if image is not None:
+                    return {input_name: letterbox(image, size).tensor}
+            return None
+
+    return CardCalibrationReader()
+
+
+def export_onnx(weights: str = LOGO_TORCH_WEIGHTS, output: str = LOGO_ONNX_MODEL_PATH,
+                size: int = LOGO_INFERENCE_SIZE, int8: bool = True,
+                calibration_folder: Optional[str] = None, calibration_limit: int = 64) -> List[str]:
+    """YOLO 가중치를 고정 입력 크기 ONNX로 내보내고, 선택적으로 INT8 양자화 모델도 생성
+
+    보정 이미지 폴더가 주어지면 정적(QDQ) 양자화, 없으면 가중치만 양자화하는 동적 양자화를 사용합니다.
+    """
+    import onnx
+    from onnxruntime.quantization import QuantFormat, QuantType, quantize_dynamic, quantize_static
+    from ultralytics import YOLO
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    exported = YOLO(weights).export(format="onnx", imgsz=size, dynamic=False, simplify=True)
+    shutil.move(exported, output)
+    written = [output]
+    logger.info(f"ONNX 로고 모델 내보내기 완료: {output}")
+
+    if int8:
+        int8_output = int8_model_path(output)
+        if calibration_folder:
+            input_name = onnx.load(output).graph.input[0].name
+            quantize_static(
+                output, int8_output,
+                _calibration_reader(input_name, calibration_folder, size, calibration_limit),
+                quant_format=QuantFormat.QDQ, per_channel=True,
+                activation_type=QuantType.QUInt8, weight_type=QuantType.QInt8
+            )
+        else:
+            quantize_dynamic(output, int8_output, weight_type=QuantType.QUInt8)
+
+        # 양자화 과정에서 빠지는 클래스 이름 메타데이터 복사
+        source, quantized = onnx.load(output), onnx.load(int8_output)
+        del quantized.metadata_props[:]
+        quantized.metadata_props.extend(source.metadata_props)
+        onnx.save(quantized, int8_output)
+        written.append(int8_output)
+        logger.info(f"INT8 로고 모델 생성 완료: {int8_output}")
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로고 탐지 모델 ONNX 내보내기")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export = subparsers.add_parser("export", help="YOLO 가중치를 ONNX(+INT8)로 내보내기")
+    export.add_argument("--weights", default=LOGO_TORCH_WEIGHTS)
+    export.add_argument("--output", default=LOGO_ONNX_MODEL_PATH)
+    export.add_argument("--size", type=int, default=LOGO_INFERENCE_SIZE)
+    export.add_argument("--no-int8", action="store_true", help="INT8 모델 생성 생략")
+    export.add_argument("--calibration", help="정적 양자화 보정용 명함 이미지 폴더")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for path in export_onnx(args.weights, args.output, args.size, not args.no_int8, args.calibration):
+        print(f"✅ {path} ({os.path.getsize(path) / (1024 * 1024):.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,123 +6,225 @@ EasyOCR과 함께 사용하여 명함에서 회사 로고만 추출합니다.
 import cv2
 import numpy as np
 import os
-import time
 import logging
-from typing import Dict, List, Optional, Tuple
-from ultralytics import YOLO
-import torch
+from typing import Dict, List, Optional, Tuple, Union
+
+from config import LOGO_BACKEND, LOGO_INFERENCE_SIZE
+from logo_detector import create_logo_detector
+from logo_store import LogoStore, logo_store
 
 logger = logging.getLogger(__name__)
 
+# 휴리스틱 탐지용 엣지 맵의 최대 변 길이 (명함 상단 절반 기준)
+_HEURISTIC_MAX_SIDE = 640
+
+# 로고 추출 입력: 파일 경로, 업로드 바이트, 디코딩된 BGR ndarray
+LogoSource = Union[str, bytes, np.ndarray]
+
+
+class LetterboxedImage:
+    """YOLO 입력용으로 축소 + 패딩한 텐서와 원본 좌표 복원 정보"""
+
+    __slots__ = ("tensor", "scale", "pad", "shape")
+
+    def __init__(self, tensor: np.ndarray, scale: float, pad: Tuple[int, int], shape: Tuple[int, int]):
+        self.tensor = tensor  # (1, 3, size, size) float32 RGB, 0~1
+        self.scale = scale    # 원본 → 텐서 배율
+        self.pad = pad        # (x, y) 패딩
+        self.shape = shape    # 원본 (height, width)
+
+    def to_original(self, bbox: List[float]) -> List[float]:
+        """텐서 좌표의 [x1, y1, x2, y2]를 원본 이미지 좌표로 변환"""
+        height, width = self.shape
+        pad_x, pad_y = self.pad
+        x1, y1, x2, y2 = bbox
+        return [
+            min(max((x1 - pad_x) / self.scale, 0.0), float(width)),
+            min(max((y1 - pad_y) / self.scale, 0.0), float(height)),
+            min(max((x2 - pad_x) / self.scale, 0.0), float(width)),
+            min(max((y2 - pad_y) / self.scale, 0.0), float(height))
+        ]
+
+
+def letterbox(image: np.ndarray, size: int = LOGO_INFERENCE_SIZE) -> LetterboxedImage:
+    """BGR 이미지를 비율 유지로 size x size에 맞춰 축소하고 회색(114)으로 패딩"""
+    height, width = image.shape[:2]
+    scale = min(size / width, size / height)
+    new_w, new_h = max(1, round(width * scale)), max(1, round(height * scale))
+    interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+    resized = cv2.resize(image, (new_w, new_h), interpolation=interpolation)
+
+    pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+    canvas = np.full((size, size, 3), 114, dtype=np.uint8)
+    canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = resized
+
+    tensor = canvas[:, :, ::-1].transpose(2, 0, 1)[None].astype(np.float32) / 255.0
+    return LetterboxedImage(np.ascontiguousarray(tensor), scale, (pad_x, pad_y), (height, width))
+
+
 class LogoExtractor:
     """YOLO 기반 로고 추출기"""
     
-    def __init__(self, upload_folder: str):
+    def __init__(self, upload_folder: str, inference_size: int = LOGO_INFERENCE_SIZE,
+                 backend: str = LOGO_BACKEND):
         self.upload_folder = upload_folder
+        self.inference_size = inference_size
         self.logo_dir = os.path.join(upload_folder, 'logos')
-        os.makedirs(self.logo_dir, exist_ok=True)
+        self.store = logo_store if self.logo_dir == logo_store.root else LogoStore(self.logo_dir)
         
         # YOLO 모델 초기화
-        self._initialize_yolo()
+        self._initialize_yolo(backend)
         
         # 로고 후보 필터링을 위한 설정
         self.min_logo_size = (30, 30)  # 최소 로고 크기
         self.max_logo_ratio = 0.3      # 이미지 대비 최대 로고 비율
         self.confidence_threshold = 0.3 # 신뢰도 임계값
+        self.max_text_overlap = 0.5    # 텍스트 박스와 이 비율 이상 겹치면 로고 후보에서 제외
     
-    def _initialize_yolo(self):
-        """YOLO 모델 초기화"""
+    def _initialize_yolo(self, backend: str = LOGO_BACKEND):
+        """YOLO 탐지기 초기화 (torch / onnx / onnx-int8)"""
         try:
             # YOLOv8 nano 모델 사용 (가볍고 빠름)
-            self.yolo = YOLO('yolov8n.pt')
-            logger.info("YOLO 모델 로드 완료")
+            self.yolo = create_logo_detector(backend)
+            logger.info(f"YOLO 모델 로드 완료 (백엔드: {self.yolo.backend})")
             
-            # GPU 사용 가능 여부 확인
-            if torch.cuda.is_available():
-                logger.info("GPU 사용 가능 - CUDA 가속 활성화")
-            else:
-                logger.info("CPU 모드로 실행")
+            # 고정 입력 크기로 내보낸 ONNX 모델은 모델 크기에 맞춤
+            if self.yolo.input_size and self.yolo.input_size != self.inference_size:
+                logger.warning(f"로고 입력 크기를 모델에 맞춤: {self.inference_size} → {self.yolo.input_size}")
+                self.inference_size = self.yolo.input_size
                 
         except Exception as e:
             logger.error(f"YOLO 모델 초기화 실패: {str(e)}")
             self.yolo = None
     
-    def extract_logo(self, image_path: str) -> Optional[Dict]:
-        """명함에서 로고 추출"""
+    def extract_logo(self, image: LogoSource) -> Optional[Dict]:
+        """명함에서 로고 추출 (경로, 업로드 바이트, 디코딩된 ndarray 지원)"""
         if not self.yolo:
             logger.error("YOLO 모델이 초기화되지 않았습니다")
             return None
         
         try:
-            logger.info(f"로고 추출 시작: {image_path}")
+            logger.info(f"로고 추출 시작: {self._describe(image)}")
             
-            # 이미지 로드
-            image = cv2.imread(image_path)
+            # 이미지 로드 (1회 디코딩)
+            image = self._load(image)
             if image is None:
-                logger.error(f"이미지 로드 실패: {image_path}")
                 return None
             
-            height, width = image.shape[:2]
-            
-            # 1. YOLO로 객체 탐지
-            logo_candidates = self._detect_logo_candidates(image_path, image)
-            
-            # 2. 휴리스틱 기반 로고 후보 추가
-            heuristic_candidates = self._detect_logo_heuristic(image)
-            
-            # 3. 후보들 통합 및 필터링
-            all_candidates = logo_candidates + heuristic_candidates
-            best_logo = self._select_best_logo(all_candidates, width, height)
-            
-            if best_logo:
-                # 4. 로고 이미지 저장
-                logo_path = self._save_logo_image(image, best_logo['bbox'])
-                
-                result = {
-                    'bbox': best_logo['bbox'],
-                    'confidence': best_logo['confidence'],
-                    'method': best_logo['method'],
-                    'logo_path': logo_path,
-                    'logo_size': (best_logo['bbox'][2] - best_logo['bbox'][0], 
-                                best_logo['bbox'][3] - best_logo['bbox'][1])
-                }
-                
-                logger.info(f"로고 추출 성공: {result}")
-                return result
-            else:
-                logger.info("로고를 찾을 수 없습니다")
-                return None
+            # 1. YOLO로 객체 탐지 → 2. 휴리스틱 후보 추가 → 3. 통합 및 선택
+            return self.select_logo(image, self.detect_yolo_candidates(image))
                 
         except Exception as e:
             logger.error(f"로고 추출 중 오류: {str(e)}")
             return None
     
-    def _detect_logo_candidates(self, image_path: str, image: np.ndarray) -> List[Dict]:
-        """YOLO로 로고 후보 탐지"""
+    @staticmethod
+    def _describe(image: LogoSource) -> str:
+        if isinstance(image, str):
+            return image
+        if isinstance(image, np.ndarray):
+            return f"<ndarray {image.shape[1]}x{image.shape[0]}>"
+        return f"<{len(image)} bytes>"
+    
+    def _load(self, image: LogoSource) -> Optional[np.ndarray]:
+        """입력을 BGR ndarray로 변환 (이미 디코딩된 경우 그대로 사용)"""
+        if isinstance(image, np.ndarray):
+            return image
+        if isinstance(image, str):
+            decoded = cv2.imread(image)
+        else:
+            decoded = cv2.imdecode(np.frombuffer(image, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if decoded is None:
+            logger.error(f"이미지 로드 실패: {self._describe(image)}")
+        return decoded
+    
+    def detect_yolo_candidates(self, image: np.ndarray,
+                               letterboxed: Optional[LetterboxedImage] = None) -> List[Dict]:
+        """디코딩된 이미지에서 YOLO 로고 후보 탐지 (OCR과 동시에 실행 가능)
+        
+        letterboxed를 넘기면 미리 만든 입력 텐서를 그대로 사용합니다.
+        """
+        if not self.yolo:
+            return []
+        return self._detect_logo_candidates(image, letterboxed)
+    
+    def select_logo(self, image: np.ndarray, candidates: List[Dict],
+                    text_boxes: Optional[List[List[float]]] = None) -> Optional[Dict]:
+        """YOLO 후보와 휴리스틱 후보 중 최적 로고를 선택하여 저장
+        
+        text_boxes([x1, y1, x2, y2] 목록)가 주어지면 텍스트와 많이 겹치는 후보를 제외하고,
+        휴리스틱 탐지는 텍스트 영역을 배경색으로 가린 이미지에서 수행합니다.
+        """
+        height, width = image.shape[:2]
+        search_image = image
+        if text_boxes:
+            candidates = [c for c in candidates
+                          if self._text_overlap(c['bbox'], text_boxes) < self.max_text_overlap]
+            search_image = self._mask_text(image, text_boxes)
+        
+        all_candidates = candidates + self._detect_logo_heuristic(search_image)
+        best_logo = self._select_best_logo(all_candidates, width, height)
+        if not best_logo:
+            logger.info("로고를 찾을 수 없습니다")
+            return None
+        
+        # 로고 이미지 저장
+        logo_hash, logo_path = self._save_logo_image(image, best_logo['bbox'])
+        result = {
+            'bbox': best_logo['bbox'],
+            'confidence': best_logo['confidence'],
+            'method': best_logo['method'],
+            'logo_hash': logo_hash,
+            'logo_path': logo_path,
+            'logo_size': (best_logo['bbox'][2] - best_logo['bbox'][0], 
+                        best_logo['bbox'][3] - best_logo['bbox'][1])
+        }
+        logger.info(f"로고 추출 성공: {result}")
+        return result
+    
+    @staticmethod
+    def _text_overlap(bbox: List[float], text_boxes: List[List[float]]) -> float:
+        """후보 영역 중 텍스트 박스와 겹치는 비율 (겹침 합계 기준 근사, 최대 1)"""
+        x1, y1, x2, y2 = bbox
+        area = max((x2 - x1) * (y2 - y1), 1.0)
+        covered = 0.0
+        for tx1, ty1, tx2, ty2 in text_boxes:
+            w = min(x2, tx2) - max(x1, tx1)
+            h = min(y2, ty2) - max(y1, ty1)
+            if w > 0 and h > 0:
+                covered += w * h
+        return min(covered / area, 1.0)
+    
+    @staticmethod
+    def _mask_text(image: np.ndarray, text_boxes: List[List[float]]) -> np.ndarray:
+        """텍스트 영역을 명함 배경색(축소 샘플 중앙값)으로 채운 사본"""
+        masked = image.copy()
+        fill = np.median(image[::8, ::8].reshape(-1, image.shape[2]), axis=0)
+        fill = tuple(int(c) for c in fill)
+        for x1, y1, x2, y2 in text_boxes:
+            cv2.rectangle(masked, (int(x1), int(y1)), (int(x2), int(y2)), fill, thickness=-1)
+        return masked
+    
+    def _detect_logo_candidates(self, image: np.ndarray,
+                                letterboxed: Optional[LetterboxedImage] = None) -> List[Dict]:
+        """YOLO로 로고 후보 탐지 (고정 크기 letterbox 텐서 입력, 박스는 원본 좌표로 복원)"""
         candidates = []
         
         try:
-            # YOLO 추론 실행
-            results = self.yolo(image_path, verbose=False)
-            
-            for result in results:
-                boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        class_id = int(box.cls[0])
-                        class_name = self.yolo.names[class_id]
-                        confidence = float(box.conf[0])
-                        bbox = box.xyxy[0].tolist()
-                        
-                        # 로고 가능성이 있는 객체들 필터링
-                        if self._is_potential_logo_object(class_name, confidence, bbox, image.shape):
-                            candidates.append({
-                                'bbox': bbox,
-                                'confidence': confidence,
-                                'method': 'yolo',
-                                'class_name': class_name
-                            })
-                            logger.info(f"YOLO 로고 후보: {class_name} (신뢰도: {confidence:.2f})")
+            # 명함 썸네일 크기로 한 번만 축소하여 추론 (원본 해상도 재디코딩/재축소 없음)
+            letterboxed = letterboxed or letterbox(image, self.inference_size)
+            for class_name, confidence, tensor_bbox in self.yolo.detect(letterboxed):
+                bbox = letterboxed.to_original(tensor_bbox)
+                
+                # 로고 가능성이 있는 객체들 필터링
+                if self._is_potential_logo_object(class_name, confidence, bbox, image.shape):
+                    candidates.append({
+                        'bbox': bbox,
+                        'confidence': confidence,
+                        'method': 'yolo',
+                        'class_name': class_name
+                    })
+                    logger.info(f"YOLO 로고 후보: {class_name} (신뢰도: {confidence:.2f})")
             
         except Exception as e:
             logger.error(f"YOLO 탐지 오류: {str(e)}")
@@ -130,7 +232,13 @@ class LogoExtractor:
         return candidates
     
     def _detect_logo_heuristic(self, image: np.ndarray) -> List[Dict]:
-        """휴리스틱 기반 로고 탐지"""
+        """휴리스틱 기반 로고 탐지 (상단 절반에서 엣지/윤곽선을 한 번만 계산)
+        
+        축소한 상단 절반의 엣지 맵과 윤곽선 집합을 한 번 구한 뒤, 각 윤곽선의 외접 사각형을
+        검색 영역(좌상단, 우상단, 좌/우측 확장)으로 잘라 영역별 최대 윤곽선을 후보로 삼습니다.
+        영역 경계(x=w/2, y=h/3)에 걸친 로고도 영역마다 따로 자르던 기존 방식처럼 잘린 부분으로 남습니다.
+        겹치는 영역이 같은 윤곽선을 고른 경우는 NMS로 하나만 남깁니다.
+        """
         candidates = []
         height, width = image.shape[:2]
         
@@ -143,64 +251,78 @@ class LogoExtractor:
                 (width*2//3, 0, width, height//2),     # 우측 상단 확장
             ]
             
-            for i, (x1, y1, x2, y2) in enumerate(search_regions):
-                roi = image[y1:y2, x1:x2]
-                logo_bbox = self._find_logo_in_region(roi, x1, y1)
-                
-                if logo_bbox:
-                    candidates.append({
-                        'bbox': logo_bbox,
-                        'confidence': 0.6,  # 휴리스틱 기본 신뢰도
-                        'method': f'heuristic_region_{i}',
-                        'class_name': 'logo_candidate'
-                    })
-                    logger.info(f"휴리스틱 로고 후보 발견: 영역 {i}")
-            
-        except Exception as e:
-            logger.error(f"휴리스틱 탐지 오류: {str(e)}")
-        
-        return candidates
-    
-    def _find_logo_in_region(self, roi: np.ndarray, offset_x: int, offset_y: int) -> Optional[List[float]]:
-        """특정 영역에서 로고 후보 찾기"""
-        try:
-            # 그레이스케일 변환
-            gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-            
-            # 엣지 검출
+            # 상단 절반만 축소하여 엣지/윤곽선 1회 계산 (크기 기준은 축소 배율로 환산)
+            top = image[:height//2]
+            scale = min(1.0, _HEURISTIC_MAX_SIDE / max(top.shape[:2]))
+            gray = cv2.cvtColor(top, cv2.COLOR_BGR2GRAY)
+            if scale < 1.0:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
             edges = cv2.Canny(gray, 50, 150)
-            
-            # 윤곽선 검출
             contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
-            if not contours:
-                return None
-            
-            # 가장 큰 윤곽선들 중에서 로고 후보 선택
-            large_contours = [c for c in contours if cv2.contourArea(c) > 500]
-            
-            if not large_contours:
-                return None
-            
-            # 가장 큰 윤곽선 선택
-            largest_contour = max(large_contours, key=cv2.contourArea)
-            x, y, w, h = cv2.boundingRect(largest_contour)
+            # 윤곽선별 면적/외접 사각형도 한 번만 계산 (원본 좌표로 환산)
+            min_area = 500 * scale * scale
+            shapes = []
+            for contour in contours:
+                area = cv2.contourArea(contour)
+                if area > min_area:
+                    x, y, w, h = cv2.boundingRect(contour)
+                    shapes.append((area, [x / scale, y / scale, (x + w) / scale, (y + h) / scale]))
             
-            # 로고 크기 조건 확인
-            if w >= self.min_logo_size[0] and h >= self.min_logo_size[1]:
-                # 절대 좌표로 변환
-                abs_bbox = [
-                    offset_x + x,
-                    offset_y + y, 
-                    offset_x + x + w,
-                    offset_y + y + h
-                ]
-                return abs_bbox
+            for i, (x1, y1, x2, y2) in enumerate(search_regions):
+                # 영역과 겹치는 윤곽선을 영역으로 자르고, 면적은 잘린 비율만큼 환산
+                inside = []
+                for area, (bx1, by1, bx2, by2) in shapes:
+                    clipped = [max(bx1, x1), max(by1, y1), min(bx2, x2), min(by2, y2)]
+                    if clipped[2] <= clipped[0] or clipped[3] <= clipped[1]:
+                        continue
+                    ratio = ((clipped[2] - clipped[0]) * (clipped[3] - clipped[1]) /
+                             max((bx2 - bx1) * (by2 - by1), 1e-6))
+                    if area * ratio > min_area:
+                        inside.append((area * ratio, clipped))
+                if not inside:
+                    continue
+                _, logo_bbox = max(inside, key=lambda item: item[0])
+                
+                # 로고 크기 조건 확인
+                if (logo_bbox[2] - logo_bbox[0] < self.min_logo_size[0] or
+                        logo_bbox[3] - logo_bbox[1] < self.min_logo_size[1]):
+                    continue
+                
+                candidates.append({
+                    'bbox': logo_bbox,
+                    'confidence': 0.6,  # 휴리스틱 기본 신뢰도
+                    'method': f'heuristic_region_{i}',
+                    'class_name': 'logo_candidate'
+                })
+                logger.info(f"휴리스틱 로고 후보 발견: 영역 {i}")
             
         except Exception as e:
-            logger.error(f"영역 내 로고 탐지 오류: {str(e)}")
+            logger.error(f"휴리스틱 탐지 오류: {str(e)}")
         
-        return None
+        return self._suppress_overlaps(candidates)
+    
+    @staticmethod
+    def _suppress_overlaps(candidates: List[Dict], iou_threshold: float = 0.5) -> List[Dict]:
+        """겹치는 후보 중 먼저 나온 것만 남김 (휴리스틱 후보는 신뢰도가 같아 영역 순서 기준)"""
+        kept = []
+        for candidate in candidates:
+            x1, y1, x2, y2 = candidate['bbox']
+            area = (x2 - x1) * (y2 - y1)
+            duplicate = False
+            for other in kept:
+                ox1, oy1, ox2, oy2 = other['bbox']
+                w = min(x2, ox2) - max(x1, ox1)
+                h = min(y2, oy2) - max(y1, oy1)
+                if w > 0 and h > 0:
+                    inter = w * h
+                    union = area + (ox2 - ox1) * (oy2 - oy1) - inter
+                    if union > 0 and inter / union > iou_threshold:
+                        duplicate = True
+                        break
+            if not duplicate:
+                kept.append(candidate)
+        return kept
     
     def _is_potential_logo_object(self, class_name: str, confidence: float, bbox: List[float], image_shape: Tuple) -> bool:
         """YOLO 탐지 객체가 로고 가능성이 있는지 판단"""
@@ -298,8 +420,8 @@ class LogoExtractor:
         
         return best_candidate
     
-    def _save_logo_image(self, image: np.ndarray, bbox: List[float]) -> str:
-        """로고 이미지를 별도 파일로 저장"""
+    def _save_logo_image(self, image: np.ndarray, bbox: List[float]) -> Tuple[Optional[str], Optional[str]]:
+        """로고 영역을 로고 저장소에 저장하고 (지각 해시, 경로) 반환"""
         try:
             # 바운딩 박스 좌표
             x1, y1, x2, y2 = map(int, bbox)
@@ -307,35 +429,30 @@ class LogoExtractor:
             # 로고 영역 추출
             logo_roi = image[y1:y2, x1:x2]
             
-            # 파일명 생성
-            timestamp = int(time.time() * 1000)
-            logo_filename = f"logo_{timestamp}.png"
-            logo_path = os.path.join(self.logo_dir, logo_filename)
-            
-            # 이미지 저장
-            cv2.imwrite(logo_path, logo_roi)
+            # 같거나 비슷한 로고가 이미 있으면 기존 파일 재사용
+            logo_hash, logo_path = self.store.put(logo_roi)
             logger.info(f"로고 이미지 저장: {logo_path}")
             
-            return logo_path
+            return logo_hash, logo_path
             
         except Exception as e:
             logger.error(f"로고 이미지 저장 오류: {str(e)}")
-            return None
+            return None, None
     
-    def extract_multiple_logos(self, image_path: str, max_logos: int = 3) -> List[Dict]:
-        """여러 로고 후보 추출 (최대 3개)"""
+    def extract_multiple_logos(self, image: LogoSource, max_logos: int = 3) -> List[Dict]:
+        """여러 로고 후보 추출 (최대 3개, 경로/바이트/ndarray 지원)"""
         if not self.yolo:
             return []
         
         try:
-            image = cv2.imread(image_path)
+            image = self._load(image)
             if image is None:
                 return []
             
             height, width = image.shape[:2]
             
             # 모든 후보 수집
-            logo_candidates = self._detect_logo_candidates(image_path, image)
+            logo_candidates = self._detect_logo_candidates(image)
             heuristic_candidates = self._detect_logo_heuristic(image)
             all_candidates = logo_candidates + heuristic_candidates
             
@@ -355,11 +472,12 @@ class LogoExtractor:
             # 결과 생성
             results = []
             for score, candidate in top_candidates:
-                logo_path = self._save_logo_image(image, candidate['bbox'])
+                logo_hash, logo_path = self._save_logo_image(image, candidate['bbox'])
                 result = {
                     'bbox': candidate['bbox'],
                     'confidence': candidate['confidence'],
                     'method': candidate['method'],
+                    'logo_hash': logo_hash,
                     'logo_path': logo_path,
                     'score': score
                 }
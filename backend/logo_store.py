@@ -0,0 +1,243 @@
+"""
+로고 저장소
+추출한 로고를 지각 해시(dHash) 기준 파일명의 WebP로 저장합니다.
+같은 회사 로고는 사용자와 관계없이 한 파일만 남기고(해밍 거리 LOGO_STORE_HASH_DISTANCE 이하면 동일 로고),
+명함(business_cards.logo_hash)에서 참조하지 않는 파일은 주기적인 GC로 삭제합니다.
+
+저장 경로: uploads/logos/<해시 앞 2자리>/<해시 16자리>.webp
+GC는 유예 시간(LOGO_STORE_ORPHAN_GRACE_SECONDS)이 지난 파일만 삭제하므로 /api/ocr로 추출한 뒤
+명함 저장 전인 로고는 남아 있고, 이전 방식의 logo_<timestamp>.png 파일도 같은 기준으로 정리됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from database import get_database
+from config import (
+    UPLOAD_FOLDER,
+    LOGO_STORE_HASH_DISTANCE,
+    LOGO_STORE_WEBP_QUALITY,
+    LOGO_STORE_GC_INTERVAL_SECONDS,
+    LOGO_STORE_ORPHAN_GRACE_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+_HASH_PATTERN = re.compile(r"^[0-9a-f]{16}$")
+
+
+def perceptual_hash(image: np.ndarray) -> str:
+    """64비트 difference hash (9x8 축소 그레이스케일의 가로 인접 픽셀 밝기 비교)"""
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    return f"{value:016x}"
+
+
+def is_logo_hash(value: str) -> bool:
+    return bool(value) and bool(_HASH_PATTERN.match(value))
+
+
+class LogoStore:
+    """지각 해시 기반 로고 파일 저장소 (중복 제거 + 참조 없는 파일 GC)"""
+
+    def __init__(self, root: str = os.path.join(UPLOAD_FOLDER, "logos"),
+                 hash_distance: int = LOGO_STORE_HASH_DISTANCE,
+                 webp_quality: int = LOGO_STORE_WEBP_QUALITY,
+                 gc_interval: float = LOGO_STORE_GC_INTERVAL_SECONDS,
+                 orphan_grace: float = LOGO_STORE_ORPHAN_GRACE_SECONDS):
+        self.root = root
+        self.hash_distance = hash_distance
+        self.webp_quality = webp_quality
+        self.gc_interval = gc_interval
+        self.orphan_grace = orphan_grace
+        # 근사 중복 검색용 해시 목록 (OCR 워커 스레드에서 접근)
+        self._lock = threading.Lock()
+        self._known: Optional[Dict[int, str]] = None
+        self._gc_task: Optional[asyncio.Task] = None
+
+        # 지표
+        self._stored = 0
+        self._exact_hits = 0
+        self._near_hits = 0
+        self._bytes_written = 0
+        self._gc_runs = 0
+        self._gc_removed = 0
+        self._gc_removed_bytes = 0
+        self._last_gc_at: Optional[datetime] = None
+        self._disk_files: Optional[int] = None
+        self._disk_bytes: Optional[int] = None
+
+    def path_for(self, logo_hash: str) -> str:
+        return os.path.join(self.root, logo_hash[:2], f"{logo_hash}.webp")
+
+    def _scan(self):
+        """저장소 파일 목록 [(경로, 해시 또는 None, 크기, 수정 시각)]"""
+        entries = []
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                stem, extension = os.path.splitext(name)
+                logo_hash = stem if extension == ".webp" and is_logo_hash(stem) else None
+                entries.append((path, logo_hash, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _known_hashes(self) -> Dict[int, str]:
+        if self._known is None:
+            self._known = {int(h, 16): h for _, h, _, _ in self._scan() if h}
+        return self._known
+
+    def _find_similar(self, value: int) -> Optional[str]:
+        if self.hash_distance <= 0:
+            return None
+        for known, logo_hash in self._known_hashes().items():
+            if bin(known ^ value).count("1") <= self.hash_distance:
+                return logo_hash
+        return None
+
+    def put(self, image: np.ndarray) -> Tuple[str, str]:
+        """로고 이미지 저장 후 (해시, 경로) 반환. 같거나 비슷한 로고가 있으면 기존 파일 재사용"""
+        logo_hash = perceptual_hash(image)
+        value = int(logo_hash, 16)
+
+        with self._lock:
+            path = self.path_for(logo_hash)
+            if os.path.exists(path):
+                self._exact_hits += 1
+                self._touch(path)
+                self._known_hashes()[value] = logo_hash
+                return logo_hash, path
+
+            similar = self._find_similar(value)
+            if similar and os.path.exists(self.path_for(similar)):
+                self._near_hits += 1
+                self._touch(self.path_for(similar))
+                return similar, self.path_for(similar)
+
+            ok, encoded = cv2.imencode(".webp", image, [cv2.IMWRITE_WEBP_QUALITY, self.webp_quality])
+            if not ok:
+                raise ValueError("로고 이미지 WebP 인코딩 실패")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(encoded.tobytes())
+            os.replace(temp_path, path)
+
+            self._known_hashes()[value] = logo_hash
+            self._stored += 1
+            self._bytes_written += len(encoded)
+            return logo_hash, path
+
+    @staticmethod
+    def _touch(path: str):
+        """재사용된 로고는 GC 유예 시간을 다시 시작"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    async def create_indexes(self):
+        """GC의 참조 조회(distinct logo_hash)용 인덱스"""
+        await get_database().business_cards.create_index("logo_hash", sparse=True)
+
+    async def collect_garbage(self) -> Dict[str, Any]:
+        """명함에서 참조하지 않고 유예 시간이 지난 로고 파일 삭제"""
+        referenced = set(await get_database().business_cards.distinct("logo_hash"))
+        # 로고 없는 명함의 logo_hash: null도 distinct 결과에 포함되므로 제외 (해시 없는 파일이 남지 않도록)
+        referenced.discard(None)
+        result = await asyncio.to_thread(self._collect_sync, referenced)
+        self._gc_runs += 1
+        self._gc_removed += result["removed"]
+        self._gc_removed_bytes += result["removed_bytes"]
+        self._last_gc_at = datetime.utcnow()
+        if result["removed"]:
+            logger.info(f"🧹 로고 GC: {result['removed']}개 삭제 ({result['removed_bytes'] / 1024:.0f}KB), "
+                        f"남은 파일 {result['files']}개")
+        return result
+
+    def _collect_sync(self, referenced: set) -> Dict[str, Any]:
+        cutoff = time.time() - self.orphan_grace
+        removed = removed_bytes = files = total_bytes = 0
+        known = {}
+
+        for path, logo_hash, size, mtime in self._scan():
+            if logo_hash not in referenced and mtime < cutoff:
+                with self._lock:
+                    try:
+                        # 스캔 이후 재사용(touch)된 파일은 남김
+                        if os.stat(path).st_mtime < cutoff:
+                            os.remove(path)
+                            removed += 1
+                            removed_bytes += size
+                            continue
+                    except OSError:
+                        continue
+            files += 1
+            total_bytes += size
+            if logo_hash:
+                known[int(logo_hash, 16)] = logo_hash
+
+        # 다른 레플리카가 저장한 로고까지 반영하여 근사 중복 검색 목록 갱신
+        with self._lock:
+            self._known = known
+        self._disk_files, self._disk_bytes = files, total_bytes
+        return {"removed": removed, "removed_bytes": removed_bytes, "files": files, "bytes": total_bytes}
+
+    def start(self):
+        """주기적 GC 시작 (LOGO_STORE_GC_INTERVAL_SECONDS가 0이면 비활성화)"""
+        if self.gc_interval > 0 and self._gc_task is None:
+            self._gc_task = asyncio.create_task(self._gc_loop())
+
+    async def stop(self):
+        if self._gc_task is not None:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except asyncio.CancelledError:
+                pass
+            self._gc_task = None
+
+    async def _gc_loop(self):
+        while True:
+            try:
+                await self.collect_garbage()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"로고 GC 실패: {e}")
+            await asyncio.sleep(self.gc_interval)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "stored": self._stored,
+            "exact_hits": self._exact_hits,
+            "near_hits": self._near_hits,
+            "bytes_written": self._bytes_written,
+            "known_hashes": len(self._known) if self._known is not None else None,
+            "disk_files": self._disk_files,
+            "disk_bytes": self._disk_bytes,
+            "gc_runs": self._gc_runs,
+            "gc_removed": self._gc_removed,
+            "gc_removed_bytes": self._gc_removed_bytes,
+            "last_gc_at": self._last_gc_at.isoformat() if self._last_gc_at else None
+        }
+
+
+# 프로세스 전역 로고 저장소
+logo_store = LogoStore()
@@ -1,13 +1,13 @@
-from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 from typing import List, Optional, Dict, Any, Tuple
-import os
-import shutil
 from pydantic import BaseModel
 from ocr_processor import OCRProcessor
-from ocr_parser import parse_ocr_result
 import logging
+import os
 import sys
+import asyncio
 from datetime import datetime
 from contextlib import asynccontextmanager
 
@@ -15,6 +15,19 @@ from contextlib import asynccontextmanager
 from database import connect_to_mongo, close_mongo_connection
 from auth_routes import router as auth_router
 from business_card_routes import router as cards_router
+from ocr_engine import engine_registry, get_ocr_processor
+from ocr_executor import ocr_executor
+from ocr_jobs import ocr_job_queue
+from ocr_cache import ocr_cache, ocr_many_with_cache, ocr_with_logo_cache
+from ocr_worker import OCRWorker
+from ocr_events import ocr_event_bus
+from logo_store import logo_store, is_logo_hash
+from card_search import backfill_search_fields
+from auth import password_hasher
+from upload_ingest import (
+    ReceivedUpload, UploadLimitMiddleware, UploadRejected, read_upload, receive_uploads, upload_openapi
+)
+from config import OCR_PRELOAD_MODELS, OCR_PRELOAD_LOGO_MODEL, OCR_EMBEDDED_WORKER
 
 # 로깅 설정
 logging.basicConfig(
@@ -27,6 +40,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def _backfill_search_index():
+    """시작 시 검색 색인 백필 (여러 레플리카가 동시에 실행해도 같은 값을 기록)"""
+    try:
+        updated = await backfill_search_fields(only_missing=True)
+        if updated:
+            logger.info(f"✅ 검색 색인 백필 완료: {updated}개")
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"❌ 검색 색인 백필 실패: {e}")
+
 # 애플리케이션 수명주기 관리
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -41,10 +65,46 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ MongoDB 연결 실패: {e}")
         raise
     
+    # OCR 모델 사전 로드 (프로세스당 한 번, process 실행기는 워커 프로세스에서 로드)
+    if OCR_PRELOAD_MODELS and ocr_executor.kind == "thread":
+        await asyncio.to_thread(engine_registry.warmup, OCR_PRELOAD_LOGO_MODEL)
+        logger.info("✅ OCR 모델 로드 완료")
+    
+    # OCR 작업 큐 준비 및 유실된 작업 복구
+    await ocr_job_queue.create_indexes()
+    await ocr_cache.create_indexes()
+    await ocr_event_bus.setup()
+    await logo_store.create_indexes()
+    await ocr_job_queue.recover_orphans()
+    
+    # OCR 진행 이벤트 전달 (다른 레플리카/워커가 발행한 이벤트를 SSE 구독자에게 전달)
+    ocr_event_bus.start()
+    
+    # 참조 없는 로고 파일 주기적 정리
+    logo_store.start()
+    
+    # 검색 색인이 없거나 오래된 명함 색인 생성 (대량일 수 있어 시작을 막지 않도록 백그라운드 실행)
+    backfill_task = asyncio.create_task(_backfill_search_index())
+    
+    # API 프로세스 내장 워커 (별도 ocr_worker 배포 시 OCR_EMBEDDED_WORKER=false)
+    worker = None
+    worker_task = None
+    if OCR_EMBEDDED_WORKER:
+        worker = OCRWorker()
+        worker_task = asyncio.create_task(worker.run())
+    
     yield
     
     # 종료 시 실행
     logger.info("🔌 FastAPI 애플리케이션 종료")
+    if worker is not None:
+        worker.stop()
+        await worker_task
+    backfill_task.cancel()
+    await ocr_event_bus.stop()
+    await logo_store.stop()
+    ocr_executor.shutdown(wait=False)
+    password_hasher.shutdown(wait=False)
     await close_mongo_connection()
 
 # FastAPI 앱 생성
@@ -56,6 +116,9 @@ app = FastAPI(
 )
 
 # CORS 설정
+# 업로드 요청 크기 제한 (CORS 헤더가 붙도록 CORS 미들웨어 안쪽에 등록)
+app.add_middleware(UploadLimitMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # 개발 환경에서는 모든 origin 허용
@@ -69,10 +132,6 @@ app.add_middleware(
 app.include_router(auth_router)
 app.include_router(cards_router)
 
-# OCR 프로세서 초기화
-UPLOAD_FOLDER = 'uploads'
-ocr_processor = OCRProcessor(UPLOAD_FOLDER)
-
 # 기존 모델들 (하위 호환성을 위해 유지)
 class ProcessingResult(BaseModel):
     filename: str
@@ -83,6 +142,7 @@ class LogoResult(BaseModel):
     bbox: Optional[List[float]] = None
     confidence: Optional[float] = None
     method: Optional[str] = None
+    logo_hash: Optional[str] = None
     logo_path: Optional[str] = None
     logo_size: Optional[Tuple[int, int]] = None
 
@@ -122,14 +182,18 @@ async def root():
             "/api/auth/me (GET) - 사용자 정보",
             "/api/cards/ (GET) - 명함 목록 조회",
             "/api/cards/ocr (POST) - OCR 처리 및 저장",
+            "/api/cards/ocr/batch (POST) - 여러 명함 일괄 OCR",
             "/api/ocr (POST) - 레거시 OCR 처리",
             "/docs - API 문서"
         ]
     }
 
 # 하위 호환성을 위한 레거시 엔드포인트들
-@app.post("/api/ocr", response_model=OCRResult)
-async def process_ocr_legacy(files: List[UploadFile] = File(...)):
+@app.post("/api/ocr", response_model=OCRResult, openapi_extra=upload_openapi("files"))
+async def process_ocr_legacy(
+    files: List[ReceivedUpload] = Depends(receive_uploads("files")),
+    ocr_processor: OCRProcessor = Depends(get_ocr_processor)
+):
     """레거시 OCR 엔드포인트 - 인증 없이 OCR만 처리 (하위 호환성)"""
     try:
         # 첫 번째 파일만 처리 (단일 파일 OCR용)
@@ -147,27 +211,19 @@ async def process_ocr_legacy(files: List[UploadFile] = File(...)):
             logger.warning(f"⚠️ 지원하지 않는 파일 형식: {file.filename}")
             return OCRResult(text=[], error="지원하지 않는 파일 형식입니다.")
 
-        # uploads 폴더가 없으면 생성
-        if not os.path.exists(UPLOAD_FOLDER):
-            os.makedirs(UPLOAD_FOLDER)
-
-        # 파일 저장
-        file_path = os.path.join(UPLOAD_FOLDER, file.filename)
+        # 업로드 수신 (디스크에 복사하지 않고 메모리에서 바로 OCR)
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            logger.info(f"📁 파일 저장: {file_path}")
-            
-            # OCR + 로고 처리
-            enhanced_result = await ocr_processor.process_image_with_logo(file_path)
-            ocr_result = enhanced_result['text']
-            logo_result = enhanced_result.get('logo')
-            
-            logger.info(f"✅ OCR + 로고 처리 완료: {file.filename}")
-            
-            # OCR 결과 파싱
-            parsed_result = parse_ocr_result(ocr_result, file.filename)
-            logger.info(f"✅ 파싱 완료: {file.filename}")
+            upload = await read_upload(file)
+        except UploadRejected as e:
+            logger.warning(f"⚠️ 업로드 거절 {file.filename}: {str(e)}")
+            return OCRResult(text=[], error=str(e))
+        
+        try:
+            # OCR + 로고 처리 (같은 원본의 OCR/파싱 결과는 캐시에서 재사용)
+            ocr_result, parsed_result, logo_result = await ocr_with_logo_cache(
+                ocr_processor, upload.data, file.filename, digest=upload.sha256
+            )
+            logger.info(f"✅ OCR + 로고 처리 및 파싱 완료: {file.filename}")
             
             # 로고 결과 처리
             logo_data = None
@@ -176,6 +232,7 @@ async def process_ocr_legacy(files: List[UploadFile] = File(...)):
                     bbox=logo_result.get('bbox'),
                     confidence=logo_result.get('confidence'),
                     method=logo_result.get('method'),
+                    logo_hash=logo_result.get('logo_hash'),
                     logo_path=logo_result.get('logo_path'),
                     logo_size=logo_result.get('logo_size')
                 )
@@ -186,12 +243,12 @@ async def process_ocr_legacy(files: List[UploadFile] = File(...)):
                 name=parsed_result.get('name'),
                 name_en=parsed_result.get('name_en'),
                 email=parsed_result.get('email'),
-                phone_number=parsed_result.get('phone'),
+                phone_number=parsed_result.get('phone_number'),
                 position=parsed_result.get('position'),
                 company_name=parsed_result.get('company_name'),
                 address=parsed_result.get('address'),
-                mobile_phone_number=parsed_result.get('mobile'),
-                fax_number=parsed_result.get('fax'),
+                mobile_phone_number=parsed_result.get('mobile_phone_number'),
+                fax_number=parsed_result.get('fax_number'),
                 department=parsed_result.get('department'),
                 postal_code=parsed_result.get('postal_code'),
                 ocr_raw_text=parsed_result.get('ocr_raw_text'),
@@ -202,30 +259,21 @@ async def process_ocr_legacy(files: List[UploadFile] = File(...)):
         except Exception as e:
             logger.error(f"❌ OCR 처리 오류 {file.filename}: {str(e)}", exc_info=True)
             return OCRResult(text=[], error=f"OCR 처리 중 오류가 발생했습니다: {str(e)}")
-            
-        finally:
-            # 임시 파일 삭제
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"🗑 임시 파일 삭제: {file_path}")
-            except Exception as e:
-                logger.error(f"임시 파일 삭제 오류 {file_path}: {str(e)}")
                 
     except Exception as e:
         logger.error(f"❌ 레거시 OCR 엔드포인트 오류: {str(e)}", exc_info=True)
         return OCRResult(text=[], error=f"서버 오류가 발생했습니다: {str(e)}")
 
-@app.post("/api/upload", response_model=List[ProcessingResult])
-async def upload_files_legacy(files: List[UploadFile] = File(...)):
-    """레거시 업로드 엔드포인트 - 하위 호환성"""
-    logger.warning("⚠️ 레거시 업로드 엔드포인트 사용됨. /api/cards/ocr 사용을 권장합니다.")
-    
-    results = []
+@app.post("/api/upload", response_model=List[ProcessingResult], openapi_extra=upload_openapi("files"))
+async def upload_files_legacy(
+    files: List[ReceivedUpload] = Depends(receive_uploads("files")),
+    ocr_processor: OCRProcessor = Depends(get_ocr_processor)
+):
+    """레거시 업로드 엔드포인트 - 하위 호환성 (여러 파일을 한 번에 일괄 인식)"""
+    logger.warning("⚠️ 레거시 업로드 엔드포인트 사용됨. /api/cards/ocr/batch 사용을 권장합니다.")
     
-    # uploads 폴더가 없으면 생성
-    if not os.path.exists(UPLOAD_FOLDER):
-        os.makedirs(UPLOAD_FOLDER)
+    results: List[Optional[ProcessingResult]] = []
+    pending = []  # (결과 인덱스, 파일명, 수신한 업로드)
     
     for file in files:
         logger.info(f"📥 레거시 업로드: {file.filename}")
@@ -242,62 +290,70 @@ async def upload_files_legacy(files: List[UploadFile] = File(...)):
             ))
             continue
 
-        # 파일 저장
-        file_path = os.path.join(UPLOAD_FOLDER, file.filename)
         try:
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            logger.info(f"📁 파일 저장: {file_path}")
-            
-            # OCR 처리
-            ocr_result = await ocr_processor.process_image(file_path)
-            logger.info(f"✅ OCR 처리 완료: {file.filename}")
-            
-            # OCR 결과 파싱
-            parsed_result = parse_ocr_result(ocr_result)
-            logger.info(f"✅ 파싱 완료: {file.filename}")
-            
-            results.append(ProcessingResult(
-                filename=file.filename,
-                parsed=parsed_result
-            ))
-            
+            upload = await read_upload(file)
+            results.append(None)
+            pending.append((len(results) - 1, file.filename, upload))
+        except UploadRejected as e:
+            logger.warning(f"⚠️ 업로드 거절 {file.filename}: {str(e)}")
+            results.append(ProcessingResult(filename=file.filename, error=str(e)))
         except Exception as e:
-            logger.error(f"❌ 파일 처리 오류 {file.filename}: {str(e)}", exc_info=True)
+            logger.error(f"❌ 파일 읽기 오류 {file.filename}: {str(e)}", exc_info=True)
             results.append(ProcessingResult(
                 filename=file.filename,
                 error=f"파일 처리 중 오류가 발생했습니다: {str(e)}"
             ))
+
+    if pending:
+        try:
+            # 캐시 미적중 파일의 텍스트 영역만 모아 한 번에 인식
+            batch_results = await ocr_many_with_cache(
+                ocr_processor,
+                [(upload.data, filename) for _, filename, upload in pending],
+                digests=[upload.sha256 for _, _, upload in pending]
+            )
+        except Exception as e:
+            logger.error(f"❌ 일괄 OCR 처리 오류: {str(e)}", exc_info=True)
+            batch_results = [e] * len(pending)
+
+        for (index, filename, _), result in zip(pending, batch_results):
+            if isinstance(result, Exception):
+                results[index] = ProcessingResult(
+                    filename=filename,
+                    error=f"파일 처리 중 오류가 발생했습니다: {str(result)}"
+                )
+                continue
+            
+            _, parsed_result = result
+            logger.info(f"✅ OCR 처리 및 파싱 완료: {filename}")
             
-        finally:
-            # 임시 파일 삭제
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.info(f"🗑 임시 파일 삭제: {file_path}")
-            except Exception as e:
-                logger.error(f"임시 파일 삭제 오류 {file_path}: {str(e)}")
+            results[index] = ProcessingResult(
+                filename=filename,
+                parsed=parsed_result
+            )
 
     return results
 
-@app.post("/api/extract-logo", response_model=LogoResult)
-async def extract_logo_only(file: UploadFile = File(...)):
+@app.post("/api/extract-logo", response_model=LogoResult, openapi_extra=upload_openapi("file", multiple=False))
+async def extract_logo_only(
+    files: List[ReceivedUpload] = Depends(receive_uploads("file")),
+    ocr_processor: OCRProcessor = Depends(get_ocr_processor)
+):
     """로고만 추출하는 엔드포인트"""
+    file = files[0]
     logger.info(f"🔍 로고 추출 요청: {file.filename}")
     
     if not ocr_processor.allowed_file(file.filename):
         raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다.")
     
-    file_path = os.path.join(UPLOAD_FOLDER, file.filename)
+    try:
+        upload = await read_upload(file)
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=str(e))
     
     try:
-        # 파일 저장
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        logger.info(f"📁 파일 저장: {file_path}")
-        
         # 로고 추출
-        logo_result = ocr_processor.extract_logo_only(file_path)
+        logo_result = await ocr_processor.extract_logo(upload.data)
         
         if logo_result:
             logger.info(f"✅ 로고 추출 성공: {file.filename}")
@@ -305,6 +361,7 @@ async def extract_logo_only(file: UploadFile = File(...)):
                 bbox=logo_result.get('bbox'),
                 confidence=logo_result.get('confidence'),
                 method=logo_result.get('method'),
+                logo_hash=logo_result.get('logo_hash'),
                 logo_path=logo_result.get('logo_path'),
                 logo_size=logo_result.get('logo_size')
             )
@@ -315,15 +372,18 @@ async def extract_logo_only(file: UploadFile = File(...)):
     except Exception as e:
         logger.error(f"❌ 로고 추출 오류 {file.filename}: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"로고 추출 중 오류가 발생했습니다: {str(e)}")
-        
-    finally:
-        # 임시 파일 삭제
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.info(f"🗑 임시 파일 삭제: {file_path}")
-        except Exception as e:
-            logger.error(f"임시 파일 삭제 오류 {file_path}: {str(e)}")
+
+@app.get("/api/logos/{logo_hash}")
+async def get_logo(logo_hash: str):
+    """로고 이미지 조회 (내용 기반 파일명이라 변경되지 않으므로 장기 캐시 허용)"""
+    if not is_logo_hash(logo_hash):
+        raise HTTPException(status_code=400, detail="잘못된 로고 ID입니다.")
+    
+    path = logo_store.path_for(logo_hash)
+    if not await asyncio.to_thread(os.path.exists, path):
+        raise HTTPException(status_code=404, detail="로고를 찾을 수 없습니다.")
+    return FileResponse(path, media_type="image/webp",
+                        headers={"Cache-Control": "public, max-age=31536000, immutable"})
 
 # 헬스 체크 엔드포인트
 @app.get("/health")
@@ -335,6 +395,16 @@ async def health_check():
         "version": "2.0.0"
     }
 
+@app.get("/api/engine/status")
+async def get_engine_status():
+    """OCR 엔진 로드 상태, 메모리 사용량 및 작업 대기열 지표 조회"""
+    status = engine_registry.status()
+    status["executor"] = ocr_executor.metrics()
+    status["cache"] = ocr_cache.metrics()
+    status["events"] = ocr_event_bus.metrics()
+    status["logos"] = logo_store.metrics()
+    return status
+
 @app.get("/api/schema")
 async def get_database_schema():
     """데이터베이스 스키마 정보 조회"""
@@ -371,6 +441,7 @@ async def get_database_schema():
                     "postal_code": "str - 우편번호",
                     "ocr_raw_text": "str - 원본 OCR 텍스트",
                     "ocr_confidence": "float - OCR 신뢰도",
+                    "logo_hash": "str - 로고 저장소 참조 (지각 해시, 선택사항)",
                     "isFavorite": "bool - 즐겨찾기 여부",
                     "created_at": "datetime - 생성일시",
                     "updated_at": "datetime - 수정일시"
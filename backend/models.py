@@ -66,6 +66,7 @@ class BusinessCardBase(BaseModel):
     stored_filename: Optional[str] = None
     file_path: Optional[str] = None
     processing_status: Optional[str] = None  # "processing", "completed", "failed"
+    logo_hash: Optional[str] = Field(None, pattern=r"^[0-9a-f]{16}$")  # 로고 저장소 참조 (지각 해시)
     isFavorite: bool = False
 
 class BusinessCardCreate(BusinessCardBase):
@@ -85,6 +86,7 @@ class BusinessCardUpdate(BaseModel):
     postal_code: Optional[str] = None
     ocr_raw_text: Optional[str] = None
     ocr_confidence: Optional[float] = None
+    logo_hash: Optional[str] = Field(None, pattern=r"^[0-9a-f]{16}$")
     isFavorite: Optional[bool] = None
 
 class BusinessCardInDB(BusinessCardBase):
@@ -157,4 +159,17 @@ class OCRResult(BaseModel):
     ocr_raw_text: Optional[str] = None
     processing_status: Optional[str] = None  # "processing", "completed", "failed"
     card_id: Optional[str] = None  # 생성된 명함 ID
-    error: Optional[str] = None 
\ No newline at end of file
+    error: Optional[str] = None
+
+class BatchOCRItem(BaseModel):
+    filename: Optional[str] = None
+    card_id: Optional[str] = None
+    processing_status: Optional[str] = None  # "processing", "completed", "failed", "rejected"
+    error: Optional[str] = None
+
+class BatchOCRResult(BaseModel):
+    batch_id: Optional[str] = None
+    total: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    items: List[BatchOCRItem] = []
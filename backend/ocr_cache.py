@@ -0,0 +1,309 @@
+"""
+OCR 결과 캐시
+업로드 원본 바이트의 SHA-256 해시(+ 처리기/파서 버전, 전처리 설정 해시)를 키로 readtext 원본 결과와
+파싱 결과를 저장하여, 같은 명함을 다시 올렸을 때 방향 감지/기울기 보정/OCR/파싱을 건너뜁니다.
+
+1차: 프로세스 내 LRU (OCR_CACHE_MAX_ENTRIES, TTL)
+2차: MongoDB ocr_cache 컬렉션 (레플리카 간 공유, expires_at TTL 인덱스로 만료)
+
+DESKEW_MODE, ORIENTATION_MODE, SKEW_METHOD, OCR_MAX_IMAGE_SIDE 등 전처리 설정이 바뀌면
+키가 달라지므로 이전 설정의 결과는 재사용하지 않습니다.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from database import get_database
+from ocr_parser import PARSER_VERSION, parse_ocr_result
+from ocr_processor import PROCESSOR_SETTINGS_HASH, PROCESSOR_VERSION, OCRProcessor
+from config import (
+    OCR_CACHE_ENABLED,
+    OCR_CACHE_MAX_ENTRIES,
+    OCR_CACHE_TTL_SECONDS,
+    OCR_CACHE_MONGO_ENABLED
+)
+
+logger = logging.getLogger(__name__)
+
+# 진행 단계 알림 콜백 (단계 이름을 받아 await)
+StageCallback = Callable[[str], Awaitable[None]]
+
+
+class OCRResultCache:
+    """메모리 LRU + MongoDB 2단계 OCR 결과 캐시"""
+
+    def __init__(self, max_entries: int = OCR_CACHE_MAX_ENTRIES,
+                 ttl_seconds: int = OCR_CACHE_TTL_SECONDS,
+                 enabled: bool = OCR_CACHE_ENABLED,
+                 mongo_enabled: bool = OCR_CACHE_MONGO_ENABLED):
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(1, ttl_seconds)
+        self.enabled = enabled
+        self.mongo_enabled = mongo_enabled
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 지표
+        self._memory_hits = 0
+        self._mongo_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._errors = 0
+
+    @property
+    def collection(self):
+        return get_database().ocr_cache
+
+    @staticmethod
+    def make_key(data: bytes, digest: Optional[str] = None) -> str:
+        """업로드 바이트 해시 + 처리기/파서 버전 + 전처리 설정 해시로 캐시 키 생성
+
+        수신 시 계산한 digest가 있으면 재사용합니다.
+        """
+        digest = digest or hashlib.sha256(data).hexdigest()
+        return f"{digest}:p{PROCESSOR_VERSION}-{PROCESSOR_SETTINGS_HASH}:r{PARSER_VERSION}"
+
+    async def create_indexes(self):
+        """만료된 항목을 MongoDB가 자동 삭제하도록 TTL 인덱스 생성"""
+        if self.enabled and self.mongo_enabled:
+            await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (메모리 → MongoDB 순). 항목은 raw, parsed 키를 가짐"""
+        if not self.enabled:
+            return None
+
+        entry = self._get_memory(key)
+        if entry is not None:
+            self._memory_hits += 1
+            return entry
+
+        if self.mongo_enabled:
+            try:
+                doc = await self.collection.find_one(
+                    {"_id": key, "expires_at": {"$gt": datetime.utcnow()}}
+                )
+            except Exception as e:
+                self._errors += 1
+                logger.warning(f"OCR 캐시 조회 실패: {e}")
+                doc = None
+            if doc is not None:
+                self._mongo_hits += 1
+                entry = {"raw": doc["raw"], "parsed": doc["parsed"]}
+                self._set_memory(key, entry)
+                return copy.deepcopy(entry)
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: str, raw: List[Any], parsed: Dict[str, Any]):
+        """OCR 원본 결과와 파싱 결과 저장 (original_filename은 업로드마다 달라 제외)"""
+        if not self.enabled:
+            return
+
+        parsed = {k: v for k, v in parsed.items() if k != 'original_filename'}
+        entry = {"raw": raw, "parsed": parsed}
+        self._set_memory(key, entry)
+        self._stores += 1
+
+        if self.mongo_enabled:
+            now = datetime.utcnow()
+            try:
+                await self.collection.replace_one(
+                    {"_id": key},
+                    {
+                        "raw": raw,
+                        "parsed": parsed,
+                        "created_at": now,
+                        "expires_at": now + timedelta(seconds=self.ttl_seconds)
+                    },
+                    upsert=True
+                )
+            except Exception as e:
+                self._errors += 1
+                logger.warning(f"OCR 캐시 저장 실패: {e}")
+
+    def _get_memory(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return copy.deepcopy(entry)
+
+    def _set_memory(self, key: str, entry: Dict[str, Any]):
+        if self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(entry))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """메모리 캐시 비우기 (MongoDB 항목은 TTL로 만료)"""
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """캐시 적중률 지표"""
+        hits = self._memory_hits + self._mongo_hits
+        lookups = hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "mongo_enabled": self.mongo_enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "memory_hits": self._memory_hits,
+            "mongo_hits": self._mongo_hits,
+            "misses": self._misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "stores": self._stores,
+            "evictions": self._evictions,
+            "errors": self._errors
+        }
+
+
+def _texts(raw: List[Any]) -> List[str]:
+    return [item[1] for item in raw]
+
+
+def _with_filename(parsed: Dict[str, Any], filename: Optional[str]) -> Dict[str, Any]:
+    parsed = dict(parsed)
+    parsed['original_filename'] = filename
+    return parsed
+
+
+async def ocr_with_cache(processor: OCRProcessor, data: bytes,
+                         filename: Optional[str] = None,
+                         cache: Optional[OCRResultCache] = None,
+                         on_stage: Optional[StageCallback] = None,
+                         digest: Optional[str] = None) -> Tuple[List[str], Dict[str, Any]]:
+    """캐시를 먼저 확인하고, 없으면 OCR + 파싱 후 저장. (텍스트 목록, 파싱 결과) 반환
+
+    on_stage가 주어지면 캐시 미스 시 보정("orientation") → 인식("ocr") → 파싱("parse")
+    단계 시작마다 호출합니다.
+    """
+    cache = cache or ocr_cache
+    key = cache.make_key(data, digest)
+    entry = await cache.get(key)
+    if entry is not None:
+        logger.info(f"⚡ OCR 캐시 적중: {filename} ({key[:12]})")
+        return _texts(entry["raw"]), _with_filename(entry["parsed"], filename)
+
+    if processor.is_pdf(data):
+        # PDF는 텍스트 레이어 우선, 나머지 페이지만 페이지 단위 병렬 OCR
+        if on_stage is not None:
+            await on_stage("ocr")
+        raw = await processor.process_pdf(data, detail=True)
+        if on_stage is not None:
+            await on_stage("parse")
+    elif on_stage is None:
+        raw = await processor.process_image(data, detail=True)
+    else:
+        await on_stage("orientation")
+        corrected = await processor.preprocess(data)
+        await on_stage("ocr")
+        raw = await processor.process_image(corrected, detail=True, preprocessed=True)
+        await on_stage("parse")
+    texts = _texts(raw)
+    parsed = parse_ocr_result(texts, filename)
+    await cache.set(key, raw, parsed)
+    return texts, parsed
+
+
+async def ocr_with_logo_cache(processor: OCRProcessor, data: bytes,
+                              filename: Optional[str] = None,
+                              cache: Optional[OCRResultCache] = None,
+                              digest: Optional[str] = None) -> Tuple[List[str], Dict[str, Any], Optional[dict]]:
+    """OCR + 로고 추출 (레거시 /api/ocr). (텍스트 목록, 파싱 결과, 로고 정보) 반환
+
+    로고는 캐시하지 않습니다. 캐시 적중 시 인식 단계는 건너뛰고 로고만 추출하며
+    (텍스트 영역은 검출 모델로 가림), 미적중 시 OCR과 로고 추출을 함께 수행한 뒤 OCR 결과를 저장합니다.
+    """
+    cache = cache or ocr_cache
+    key = cache.make_key(data, digest)
+    entry = await cache.get(key)
+    if entry is not None:
+        logger.info(f"⚡ OCR 캐시 적중: {filename} ({key[:12]})")
+        logo = None if processor.is_pdf(data) else await processor.extract_logo(data)
+        return _texts(entry["raw"]), _with_filename(entry["parsed"], filename), logo
+
+    result = await processor.process_image_with_logo(data, detail=True)
+    raw = result['text']
+    texts = _texts(raw)
+    parsed = parse_ocr_result(texts, filename)
+    await cache.set(key, raw, parsed)
+    return texts, parsed, result.get('logo')
+
+
+async def ocr_many_with_cache(processor: OCRProcessor, items: List[Tuple[bytes, Optional[str]]],
+                              cache: Optional[OCRResultCache] = None,
+                              digests: Optional[List[Optional[str]]] = None) -> List[Any]:
+    """여러 업로드를 캐시 확인 후 미적중분만 일괄 OCR
+
+    items: (데이터, 파일명) 목록. 입력 순서대로 (텍스트 목록, 파싱 결과) 또는 예외 객체를 반환합니다.
+    같은 요청 안의 중복 업로드도 한 번만 처리합니다.
+    digests: 수신 시 계산한 항목별 SHA-256 (있으면 해시를 다시 계산하지 않음)
+    """
+    cache = cache or ocr_cache
+    results: List[Any] = [None] * len(items)
+    pending: "OrderedDict[str, List[int]]" = OrderedDict()
+    pending_data: Dict[str, bytes] = {}
+
+    for i, (data, filename) in enumerate(items):
+        key = cache.make_key(data, digests[i] if digests else None)
+        if key in pending:
+            pending[key].append(i)
+            continue
+        entry = await cache.get(key)
+        if entry is not None:
+            results[i] = (_texts(entry["raw"]), _with_filename(entry["parsed"], filename))
+            continue
+        pending[key] = [i]
+        pending_data[key] = data
+
+    if pending:
+        logger.info(f"⚡ OCR 캐시: {len(items)}개 중 {len(items) - sum(map(len, pending.values()))}개 적중")
+        # PDF는 일괄 이미지 인식에 넣지 않고 따로 처리
+        keys = [key for key in pending if not processor.is_pdf(pending_data[key])]
+        pdf_keys = [key for key in pending if processor.is_pdf(pending_data[key])]
+        batch_results = await processor.process_images_batch(
+            [pending_data[key] for key in keys], detail=True
+        ) if keys else []
+        for key in pdf_keys:
+            try:
+                batch_results.append(await processor.process_pdf(pending_data[key], detail=True))
+            except Exception as e:
+                batch_results.append(e)
+        keys += pdf_keys
+
+        for key, raw in zip(keys, batch_results):
+            if isinstance(raw, Exception):
+                for i in pending[key]:
+                    results[i] = raw
+                continue
+            texts = _texts(raw)
+            parsed = parse_ocr_result(texts, items[pending[key][0]][1])
+            await cache.set(key, raw, parsed)
+            for i in pending[key]:
+                results[i] = (texts, _with_filename(parsed, items[i][1]))
+
+    return results
+
+
+# 프로세스 전역 OCR 결과 캐시
+ocr_cache = OCRResultCache()
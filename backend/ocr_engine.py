@@ -0,0 +1,179 @@
+"""
+OCR 엔진 레지스트리
+프로세스 전체에서 EasyOCR 리더와 로고 추출기를 한 번만 로드하여 공유합니다.
+"""
+
+import os
+import time
+import threading
+import logging
+from typing import Dict, Any, Optional
+
+from config import UPLOAD_FOLDER, OCR_ENGINE
+
+logger = logging.getLogger(__name__)
+
+# 인식 언어와 모델 (ONNX 엔진도 같은 문자 집합 사용)
+OCR_LANGUAGES = ['ko', 'en']
+OCR_RECOG_NETWORK = 'korean_g2'
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """현재 프로세스의 RSS(상주 메모리) 크기 조회"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+        # /proc이 없는 환경(macOS 등)에서는 최대 RSS로 대체
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return None
+
+
+def _model_parameter_bytes(*models) -> int:
+    """torch 모델들의 파라미터 메모리 크기 합계"""
+    total = 0
+    for model in models:
+        if model is None or not hasattr(model, 'parameters'):
+            continue
+        try:
+            total += sum(p.numel() * p.element_size() for p in model.parameters())
+        except Exception:
+            continue
+    return total
+
+
+class OCREngineRegistry:
+    """EasyOCR 리더와 LogoExtractor를 소유하는 프로세스 단위 레지스트리"""
+
+    def __init__(self, upload_folder: str, ocr_engine: str = OCR_ENGINE):
+        if ocr_engine not in ("easyocr", "onnx", "onnx-int8"):
+            raise ValueError(f"지원하지 않는 OCR 엔진입니다: {ocr_engine}")
+        self.upload_folder = upload_folder
+        self.ocr_engine = ocr_engine
+        self._lock = threading.Lock()
+        self._reader = None
+        self._logo_extractor = None
+        self._logo_failed = False
+        self._processor = None
+        self._load_seconds: Dict[str, float] = {}
+        self._rss_delta: Dict[str, int] = {}
+
+    @property
+    def reader(self):
+        """EasyOCR 리더 (최초 접근 시 한 번만 로드)"""
+        if self._reader is None:
+            with self._lock:
+                if self._reader is None:
+                    self._reader = self._load('reader', self._create_reader)
+        return self._reader
+
+    @property
+    def logo_extractor(self):
+        """로고 추출기 (최초 접근 시 한 번만 로드, 실패 시 None)"""
+        if self._logo_extractor is None and not self._logo_failed:
+            with self._lock:
+                if self._logo_extractor is None and not self._logo_failed:
+                    try:
+                        self._logo_extractor = self._load('logo_extractor', self._create_logo_extractor)
+                    except Exception as e:
+                        logger.error(f"로고 추출기 초기화 실패: {str(e)}")
+                        self._logo_failed = True
+        return self._logo_extractor
+
+    @property
+    def processor(self):
+        """공유 OCRProcessor 인스턴스"""
+        if self._processor is None:
+            with self._lock:
+                if self._processor is None:
+                    from ocr_processor import OCRProcessor
+                    self._processor = OCRProcessor(self.upload_folder, engine=self)
+        return self._processor
+
+    def _create_reader(self):
+        if self.ocr_engine != "easyocr":
+            from ocr_onnx import create_onnx_reader
+            logger.info(f"Loading ONNX OCR model for Korean and English ({self.ocr_engine})")
+            return create_onnx_reader(OCR_LANGUAGES, OCR_RECOG_NETWORK, int8=self.ocr_engine == "onnx-int8")
+
+        import easyocr
+        logger.info("Loading EasyOCR model for Korean and English")
+        return easyocr.Reader(
+            lang_list=OCR_LANGUAGES,
+            gpu=False,
+            recog_network=OCR_RECOG_NETWORK
+        )
+
+    def _create_logo_extractor(self):
+        from logo_extractor import LogoExtractor
+        return LogoExtractor(self.upload_folder)
+
+    def _load(self, name: str, factory):
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+        instance = factory()
+        self._load_seconds[name] = time.perf_counter() - started
+        rss_after = _current_rss_bytes()
+        if rss_before is not None and rss_after is not None:
+            self._rss_delta[name] = rss_after - rss_before
+        logger.info(f"✅ {name} 로드 완료 ({self._load_seconds[name]:.2f}s)")
+        return instance
+
+    def warmup(self, include_logo: bool = False):
+        """서버 시작 시 모델 미리 로드"""
+        _ = self.reader
+        if include_logo:
+            _ = self.logo_extractor
+
+    def status(self) -> Dict[str, Any]:
+        """모델 로드 상태 및 메모리 사용량"""
+        reader = self._reader
+        logo_extractor = self._logo_extractor
+
+        reader_params = 0
+        if reader is not None:
+            reader_params = _model_parameter_bytes(
+                getattr(reader, 'detector', None),
+                getattr(reader, 'recognizer', None)
+            )
+
+        logo_params = 0
+        if logo_extractor is not None and getattr(logo_extractor, 'yolo', None) is not None:
+            logo_params = _model_parameter_bytes(getattr(logo_extractor.yolo, 'model', None))
+
+        return {
+            "pid": os.getpid(),
+            "ocr_engine": self.ocr_engine,
+            "rss_bytes": _current_rss_bytes(),
+            "models": {
+                "reader": {
+                    "loaded": reader is not None,
+                    "load_seconds": self._load_seconds.get('reader'),
+                    "rss_delta_bytes": self._rss_delta.get('reader'),
+                    "parameter_bytes": reader_params
+                },
+                "logo_extractor": {
+                    "loaded": logo_extractor is not None,
+                    "failed": self._logo_failed,
+                    "load_seconds": self._load_seconds.get('logo_extractor'),
+                    "rss_delta_bytes": self._rss_delta.get('logo_extractor'),
+                    "parameter_bytes": logo_params
+                }
+            }
+        }
+
+
+# 프로세스 전역 레지스트리
+engine_registry = OCREngineRegistry(UPLOAD_FOLDER)
+
+
+def get_ocr_processor():
+    """FastAPI 의존성: 공유 OCRProcessor 반환"""
+    return engine_registry.processor
@@ -0,0 +1,177 @@
+"""
+OCR 진행 상황 이벤트
+OCR 작업 단계(queued → orientation → ocr → parse → done/failed)를 사용자별로 발행하고,
+SSE 엔드포인트(/api/cards/events)를 통해 클라이언트에 전달합니다.
+
+레플리카 간 전달은 MongoDB capped 컬렉션(ocr_events)과 tailable cursor로 처리합니다.
+(change stream과 달리 단일 노드 MongoDB에서도 동작)
+발행은 컬렉션에 기록만 하고, 각 API 프로세스의 tailer가 읽어 자기 구독자에게 나눠줍니다.
+OCR_EVENTS_BACKEND=memory이면 MongoDB 없이 같은 프로세스 안에서만 전달합니다.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+import pymongo
+from bson import ObjectId
+from pymongo.errors import CollectionInvalid
+
+from database import get_database
+from config import OCR_EVENTS_BACKEND, OCR_EVENTS_CAPPED_BYTES, OCR_EVENTS_SUBSCRIBER_QUEUE
+
+logger = logging.getLogger(__name__)
+
+# 진행 단계
+STAGE_QUEUED = "queued"
+STAGE_ORIENTATION = "orientation"
+STAGE_OCR = "ocr"
+STAGE_PARSE = "parse"
+STAGE_DONE = "done"
+STAGE_FAILED = "failed"
+
+
+class OCREventBus:
+    """사용자별 OCR 진행 이벤트 발행/구독"""
+
+    def __init__(self, backend: str = OCR_EVENTS_BACKEND,
+                 capped_bytes: int = OCR_EVENTS_CAPPED_BYTES,
+                 queue_size: int = OCR_EVENTS_SUBSCRIBER_QUEUE):
+        if backend not in ("mongo", "memory"):
+            raise ValueError(f"지원하지 않는 이벤트 백엔드입니다: {backend}")
+        self.backend = backend
+        self.capped_bytes = capped_bytes
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._tailer: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+
+        # 지표
+        self._published = 0
+        self._delivered = 0
+        self._dropped = 0
+
+    @property
+    def collection(self):
+        return get_database().ocr_events
+
+    async def setup(self):
+        """capped 컬렉션 생성 (tailable cursor는 빈 컬렉션에서 바로 닫히므로 시작 문서 기록)"""
+        if self.backend != "mongo":
+            return
+        db = get_database()
+        if "ocr_events" not in await db.list_collection_names():
+            try:
+                await db.create_collection("ocr_events", capped=True, size=self.capped_bytes)
+                await self.collection.insert_one({"stage": "init", "created_at": datetime.utcnow()})
+            except CollectionInvalid:
+                pass  # 다른 레플리카가 먼저 생성
+        await self.collection.create_index([("user_id", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)])
+
+    async def publish(self, user_id: Any, card_id: Any, stage: str, **data):
+        """진행 이벤트 발행 (실패해도 OCR 처리에는 영향을 주지 않음)"""
+        event = {
+            "user_id": str(user_id),
+            "card_id": str(card_id),
+            "stage": stage,
+            "created_at": datetime.utcnow(),
+            **data
+        }
+        self._published += 1
+        try:
+            if self.backend == "mongo":
+                await self.collection.insert_one(event)
+            else:
+                event["_id"] = ObjectId()
+                self._dispatch(event)
+        except Exception as e:
+            logger.warning(f"OCR 진행 이벤트 발행 실패 ({stage}, 카드 {card_id}): {e}")
+
+    async def publish_many(self, entries: List[Dict[str, Any]], stage: str, **data):
+        """여러 카드에 같은 단계 이벤트 발행 (entries: user_id, card_id)"""
+        for entry in entries:
+            await self.publish(entry["user_id"], entry["card_id"], stage, **data)
+
+    def subscribe(self, user_id: Any) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[str(user_id)].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: Any, queue: asyncio.Queue):
+        key = str(user_id)
+        self._subscribers[key].discard(queue)
+        if not self._subscribers[key]:
+            del self._subscribers[key]
+
+    async def replay(self, user_id: Any, after_id: str, limit: int = 200) -> List[Dict[str, Any]]:
+        """재연결 시 Last-Event-ID 이후 이벤트 조회 (capped 컬렉션에 남아 있는 범위)"""
+        if self.backend != "mongo" or not ObjectId.is_valid(after_id):
+            return []
+        cursor = self.collection.find(
+            {"user_id": str(user_id), "_id": {"$gt": ObjectId(after_id)}}
+        ).sort("_id", 1).limit(limit)
+        return await cursor.to_list(length=limit)
+
+    def _dispatch(self, event: Dict[str, Any]):
+        for queue in list(self._subscribers.get(event.get("user_id"), ())):
+            try:
+                queue.put_nowait(event)
+                self._delivered += 1
+            except asyncio.QueueFull:
+                # 느린 클라이언트는 이벤트를 버리고 재연결 시 replay/스냅샷으로 복구
+                self._dropped += 1
+
+    def start(self):
+        """MongoDB 이벤트를 읽어 이 프로세스의 구독자에게 전달하는 tailer 시작"""
+        if self.backend == "mongo" and self._tailer is None:
+            self._stopping.clear()
+            self._tailer = asyncio.create_task(self._tail())
+
+    async def stop(self):
+        if self._tailer is not None:
+            self._stopping.set()
+            self._tailer.cancel()
+            try:
+                await self._tailer
+            except asyncio.CancelledError:
+                pass
+            self._tailer = None
+
+    async def _tail(self):
+        last = await self.collection.find_one(sort=[("$natural", pymongo.DESCENDING)])
+        last_id = last["_id"] if last else None
+
+        while not self._stopping.is_set():
+            try:
+                query = {"_id": {"$gt": last_id}} if last_id is not None else {}
+                cursor = self.collection.find(
+                    query,
+                    cursor_type=pymongo.CursorType.TAILABLE_AWAIT,
+                    max_await_time_ms=1000
+                )
+                while cursor.alive and not self._stopping.is_set():
+                    async for event in cursor:
+                        last_id = event["_id"]
+                        if event.get("user_id") in self._subscribers:
+                            self._dispatch(event)
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"OCR 이벤트 tailer 오류: {e}")
+                await asyncio.sleep(1.0)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self._published,
+            "delivered": self._delivered,
+            "dropped": self._dropped
+        }
+
+
+# 프로세스 전역 이벤트 버스
+ocr_event_bus = OCREventBus()
@@ -0,0 +1,172 @@
+"""
+OCR 작업 실행기
+EasyOCR, OpenCV, YOLO 등 CPU를 오래 점유하는 동기 작업을 이벤트 루프 밖의
+제한된 워커 풀에서 실행하고 대기열 상태를 지표로 제공합니다.
+"""
+
+import asyncio
+import time
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config import (
+    UPLOAD_FOLDER,
+    OCR_EXECUTOR_KIND,
+    OCR_EXECUTOR_WORKERS,
+    OCR_MAX_CONCURRENCY,
+    OCR_MAX_QUEUE
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OCRQueueFullError(RuntimeError):
+    """OCR 대기열이 가득 찬 경우"""
+
+
+# process 모드에서 워커 프로세스마다 하나씩 생성되는 OCRProcessor
+_worker_processor = None
+
+
+def _init_process_worker(upload_folder: str):
+    """워커 프로세스 초기화: 프로세스 전용 엔진 레지스트리 생성"""
+    global _worker_processor
+    from ocr_engine import OCREngineRegistry
+    registry = OCREngineRegistry(upload_folder)
+    registry.warmup()
+    _worker_processor = registry.processor
+
+
+def _call_worker_processor(method_name: str, args: tuple, kwargs: dict):
+    """워커 프로세스의 OCRProcessor 메서드 호출"""
+    return getattr(_worker_processor, method_name)(*args, **kwargs)
+
+
+class OCRExecutor:
+    """동시 실행 수가 제한된 OCR 워커 풀"""
+
+    def __init__(self, kind: str = "thread", max_workers: int = 2,
+                 max_concurrency: int = 2, max_queue: int = 0,
+                 upload_folder: str = UPLOAD_FOLDER):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 실행기 종류입니다: {kind}")
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.upload_folder = upload_folder
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # 지표
+        self._queued = 0
+        self._running = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_process_worker,
+                    initargs=(self.upload_folder,)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="ocr-worker"
+                )
+            logger.info(f"OCR 실행기 시작: {self.kind} (workers={self.max_workers}, "
+                        f"concurrency={self.max_concurrency})")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """동기 함수를 워커 풀에서 실행 (process 모드에서는 pickle 가능한 함수여야 함)"""
+        return await self._submit(lambda: self.executor.submit(func, *args, **kwargs))
+
+    async def run_method(self, processor, method_name: str, *args, **kwargs) -> Any:
+        """OCRProcessor 메서드를 워커 풀에서 실행
+
+        thread 모드에서는 전달된 processor를 그대로 사용하고,
+        process 모드에서는 워커 프로세스에 미리 로드된 processor를 사용합니다.
+        """
+        if self.kind == "process":
+            return await self._submit(
+                lambda: self.executor.submit(_call_worker_processor, method_name, args, kwargs)
+            )
+        method = getattr(processor, method_name)
+        return await self._submit(lambda: self.executor.submit(method, *args, **kwargs))
+
+    async def _submit(self, submit: Callable) -> Any:
+        if self.max_queue and self._queued >= self.max_queue:
+            self._rejected += 1
+            raise OCRQueueFullError("OCR 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요.")
+
+        semaphore = self._get_semaphore()
+        self._queued += 1
+        self._max_queue_depth = max(self._max_queue_depth, self._queued)
+        enqueued_at = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self._queued -= 1
+
+        started_at = time.perf_counter()
+        self._total_wait += started_at - enqueued_at
+        self._running += 1
+        try:
+            result = await asyncio.wrap_future(submit())
+            self._completed += 1
+            return result
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._running -= 1
+            self._total_run += time.perf_counter() - started_at
+            semaphore.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """대기열 깊이 및 처리 지표"""
+        finished = self._completed + self._failed
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "queue_depth": self._queued,
+            "max_queue_depth": self._max_queue_depth,
+            "running": self._running,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "avg_wait_ms": (self._total_wait / finished * 1000) if finished else 0.0,
+            "avg_run_ms": (self._total_run / finished * 1000) if finished else 0.0
+        }
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            logger.info("OCR 실행기 종료")
+
+
+# 프로세스 전역 실행기
+ocr_executor = OCRExecutor(
+    kind=OCR_EXECUTOR_KIND,
+    max_workers=OCR_EXECUTOR_WORKERS,
+    max_concurrency=OCR_MAX_CONCURRENCY,
+    max_queue=OCR_MAX_QUEUE
+)
@@ -0,0 +1,346 @@
+"""
+MongoDB 기반 OCR 작업 큐
+업로드 원본은 GridFS에 저장하고, 작업은 임대(lease) 방식으로 워커가 가져가 처리합니다.
+파드가 재시작되어도 작업이 유실되지 않으며 실패 시 지수 백오프로 재시도합니다.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pymongo
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorGridFSBucket
+
+from database import get_database
+from ocr_events import ocr_event_bus, STAGE_FAILED
+from config import (
+    OCR_JOB_MAX_ATTEMPTS,
+    OCR_JOB_LEASE_SECONDS,
+    OCR_JOB_RETRY_BASE_SECONDS,
+    OCR_JOB_RETRY_MAX_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class LeaseLostError(Exception):
+    """작업 임대가 만료되어 다른 워커에게 넘어간 경우 (완료/실패/결과 저장을 하지 않음)"""
+
+
+def _lease_filter(job: Dict[str, Any]) -> Dict[str, Any]:
+    """이 임대(작업 + 워커 + 시도 번호)가 아직 유효할 때만 일치하는 조건
+
+    만료 후 같은 워커가 다시 가져간 경우도 구분하도록 임대마다 증가하는 attempts를 함께 비교합니다.
+    """
+    return {
+        "_id": job["_id"],
+        "status": JOB_RUNNING,
+        "lease_owner": job.get("lease_owner"),
+        "attempts": job.get("attempts")
+    }
+
+
+class OCRJobQueue:
+    """ocr_jobs 컬렉션 + GridFS(ocr_uploads) 기반 작업 큐"""
+
+    def __init__(self, max_attempts: int = OCR_JOB_MAX_ATTEMPTS,
+                 lease_seconds: int = OCR_JOB_LEASE_SECONDS,
+                 retry_base_seconds: int = OCR_JOB_RETRY_BASE_SECONDS,
+                 retry_max_seconds: int = OCR_JOB_RETRY_MAX_SECONDS):
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+
+    @property
+    def jobs(self):
+        return get_database().ocr_jobs
+
+    @property
+    def files(self) -> AsyncIOMotorGridFSBucket:
+        return AsyncIOMotorGridFSBucket(get_database(), bucket_name="ocr_uploads")
+
+    async def create_indexes(self):
+        """작업 조회용 인덱스 생성"""
+        await self.jobs.create_index([
+            ("status", pymongo.ASCENDING),
+            ("available_at", pymongo.ASCENDING)
+        ])
+        await self.jobs.create_index([
+            ("status", pymongo.ASCENDING),
+            ("lease_expires_at", pymongo.ASCENDING)
+        ])
+        await self.jobs.create_index("card_id")
+
+    async def enqueue(self, card_id: ObjectId, user_id: ObjectId, filename: str,
+                      data: bytes, sha256: Optional[str] = None) -> ObjectId:
+        """업로드 원본을 GridFS에 저장하고 작업 등록 (sha256: 수신 시 계산한 원본 해시)"""
+        file_id = await self.files.upload_from_stream(
+            filename,
+            data,
+            metadata={"card_id": card_id, "user_id": user_id}
+        )
+        now = datetime.utcnow()
+        job = {
+            "card_id": card_id,
+            "user_id": user_id,
+            "original_filename": filename,
+            "file_id": file_id,
+            "sha256": sha256,
+            "status": JOB_QUEUED,
+            "attempts": 0,
+            "max_attempts": self.max_attempts,
+            "available_at": now,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "last_error": None,
+            "created_at": now,
+            "updated_at": now
+        }
+        result = await self.jobs.insert_one(job)
+        logger.info(f"📬 OCR 작업 등록: {result.inserted_id} (카드: {card_id})")
+        return result.inserted_id
+
+    async def enqueue_many(self, entries: List[Dict[str, Any]],
+                           batch_id: Optional[str] = None) -> List[ObjectId]:
+        """여러 작업을 한 번에 등록 (entries: card_id, user_id, filename, data, 선택적으로 sha256)"""
+        now = datetime.utcnow()
+        jobs = []
+        for entry in entries:
+            file_id = await self.files.upload_from_stream(
+                entry["filename"],
+                entry["data"],
+                metadata={"card_id": entry["card_id"], "user_id": entry["user_id"]}
+            )
+            jobs.append({
+                "card_id": entry["card_id"],
+                "user_id": entry["user_id"],
+                "original_filename": entry["filename"],
+                "file_id": file_id,
+                "sha256": entry.get("sha256"),
+                "batch_id": batch_id,
+                "status": JOB_QUEUED,
+                "attempts": 0,
+                "max_attempts": self.max_attempts,
+                "available_at": now,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "last_error": None,
+                "created_at": now,
+                "updated_at": now
+            })
+        if not jobs:
+            return []
+        result = await self.jobs.insert_many(jobs)
+        logger.info(f"📬 OCR 작업 {len(jobs)}개 일괄 등록 (배치: {batch_id})")
+        return list(result.inserted_ids)
+
+    async def claim_batch(self, worker_id: str, limit: int) -> List[Dict[str, Any]]:
+        """실행 가능한 작업을 최대 limit개까지 임대"""
+        claimed = []
+        while len(claimed) < limit:
+            job = await self.claim(worker_id)
+            if job is None:
+                break
+            claimed.append(job)
+        return claimed
+
+    async def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """실행 가능한 작업 하나를 임대하여 반환 (없으면 None)"""
+        now = datetime.utcnow()
+        return await self.jobs.find_one_and_update(
+            {"status": JOB_QUEUED, "available_at": {"$lte": now}},
+            {
+                "$set": {
+                    "status": JOB_RUNNING,
+                    "lease_owner": worker_id,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                    "started_at": now,
+                    "updated_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("available_at", pymongo.ASCENDING)],
+            return_document=pymongo.ReturnDocument.AFTER
+        )
+
+    async def extend_lease(self, job: Dict[str, Any], worker_id: str) -> bool:
+        """처리 중인 작업의 임대 연장 (다른 워커가 가져간 경우 False)"""
+        now = datetime.utcnow()
+        result = await self.jobs.update_one(
+            {**_lease_filter(job), "lease_owner": worker_id},
+            {"$set": {
+                "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                "updated_at": now
+            }}
+        )
+        return result.modified_count == 1
+
+    async def load_file(self, job: Dict[str, Any]) -> bytes:
+        """작업에 연결된 업로드 원본 읽기"""
+        stream = await self.files.open_download_stream(job["file_id"])
+        return await stream.read()
+
+    async def ensure_lease(self, job: Dict[str, Any]):
+        """결과 저장 직전 임대 확인 및 연장 (잃었으면 LeaseLostError)"""
+        if not await self.extend_lease(job, job.get("lease_owner")):
+            raise LeaseLostError(f"작업 임대를 잃었습니다: {job['_id']}")
+
+    async def complete(self, job: Dict[str, Any]):
+        """작업 완료 처리 및 원본 삭제 (임대를 잃었으면 LeaseLostError, 원본은 유지)"""
+        now = datetime.utcnow()
+        result = await self.jobs.update_one(
+            _lease_filter(job),
+            {"$set": {
+                "status": JOB_COMPLETED,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "finished_at": now,
+                "updated_at": now
+            }}
+        )
+        if not result.modified_count:
+            raise LeaseLostError(f"작업 임대를 잃었습니다: {job['_id']}")
+        await self._delete_file(job)
+
+    async def fail(self, job: Dict[str, Any], error: str) -> bool:
+        """작업 실패 처리. 재시도 횟수를 모두 소진하면 True 반환
+
+        임대를 잃은 작업이면 재시도 예약/원본 삭제 없이 LeaseLostError를 발생시킵니다.
+        """
+        now = datetime.utcnow()
+        attempts = job.get("attempts", 1)
+        if attempts < job.get("max_attempts", self.max_attempts):
+            delay = self.retry_delay(attempts)
+            result = await self.jobs.update_one(
+                _lease_filter(job),
+                {"$set": {
+                    "status": JOB_QUEUED,
+                    "available_at": now + timedelta(seconds=delay),
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "last_error": error,
+                    "updated_at": now
+                }}
+            )
+            if not result.modified_count:
+                raise LeaseLostError(f"작업 임대를 잃었습니다: {job['_id']}")
+            logger.warning(f"🔁 OCR 작업 재시도 예약: {job['_id']} ({attempts}회 실패, {delay}s 후)")
+            return False
+
+        result = await self.jobs.update_one(
+            _lease_filter(job),
+            {"$set": {
+                "status": JOB_FAILED,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "last_error": error,
+                "finished_at": now,
+                "updated_at": now
+            }}
+        )
+        if not result.modified_count:
+            raise LeaseLostError(f"작업 임대를 잃었습니다: {job['_id']}")
+        await self._delete_file(job)
+        logger.error(f"❌ OCR 작업 최종 실패: {job['_id']} ({attempts}회 시도)")
+        return True
+
+    def retry_delay(self, attempts: int) -> int:
+        """지수 백오프 지연 시간(초)"""
+        return min(self.retry_max_seconds, self.retry_base_seconds * (2 ** max(0, attempts - 1)))
+
+    async def requeue_expired(self) -> List[Dict[str, Any]]:
+        """임대가 만료된 작업(워커 종료/파드 재시작)을 다시 대기열로 돌림
+
+        재시도 횟수를 모두 소진한 작업은 최종 실패 처리하고 목록으로 반환합니다.
+        """
+        now = datetime.utcnow()
+        exhausted = []
+        cursor = self.jobs.find({"status": JOB_RUNNING, "lease_expires_at": {"$lt": now}})
+        async for job in cursor:
+            if job.get("attempts", 0) >= job.get("max_attempts", self.max_attempts):
+                try:
+                    await self.fail(job, "작업 임대가 만료되었습니다 (워커 중단)")
+                except LeaseLostError:
+                    # 다른 워커/레플리카가 먼저 처리함
+                    continue
+                exhausted.append(job)
+                continue
+
+            result = await self.jobs.update_one(
+                {"_id": job["_id"], "status": JOB_RUNNING, "lease_expires_at": job["lease_expires_at"]},
+                {"$set": {
+                    "status": JOB_QUEUED,
+                    "available_at": now,
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": now
+                }}
+            )
+            if result.modified_count:
+                logger.warning(f"♻️ 만료된 OCR 작업 재등록: {job['_id']} (이전 워커: {job.get('lease_owner')})")
+        return exhausted
+
+    async def recover_orphans(self) -> Dict[str, int]:
+        """시작 시 복구: 만료된 작업 재등록 + 작업 없이 처리 중으로 남은 명함 정리"""
+        exhausted = await self.requeue_expired()
+        for job in exhausted:
+            await mark_card_failed(job["card_id"], "처리 실패: 작업 재시도 횟수 초과", job.get("user_id"))
+
+        # 큐 도입 이전 방식(asyncio.create_task)으로 시작되어 유실된 명함
+        # (방금 생성되어 아직 작업이 등록되지 않은 명함은 제외하도록 임대 시간만큼 여유를 둠)
+        db = get_database()
+        cutoff = datetime.utcnow() - timedelta(seconds=self.lease_seconds)
+        active_card_ids = await self.jobs.distinct(
+            "card_id", {"status": {"$in": [JOB_QUEUED, JOB_RUNNING]}}
+        )
+        result = await db.business_cards.update_many(
+            {
+                "processing_status": "processing",
+                "_id": {"$nin": active_card_ids},
+                "updated_at": {"$lt": cutoff}
+            },
+            {"$set": {
+                "processing_status": "failed",
+                "ocr_raw_text": "처리 실패: 서버 재시작으로 작업이 유실되었습니다. 다시 업로드해주세요.",
+                "updated_at": datetime.utcnow()
+            }}
+        )
+
+        recovered = {"exhausted_jobs": len(exhausted), "orphaned_cards": result.modified_count}
+        logger.info(f"🩹 OCR 작업 복구 완료: {recovered}")
+        return recovered
+
+    async def _delete_file(self, job: Dict[str, Any]):
+        if not job.get("file_id"):
+            return
+        try:
+            await self.files.delete(job["file_id"])
+        except Exception as e:
+            logger.warning(f"업로드 원본 삭제 실패 {job['file_id']}: {e}")
+
+
+async def mark_card_failed(card_id: ObjectId, message: str, user_id: Optional[ObjectId] = None):
+    """명함을 처리 실패 상태로 변경 (user_id가 있으면 진행 이벤트도 발행)"""
+    db = get_database()
+    await db.business_cards.update_one(
+        {"_id": card_id},
+        {"$set": {
+            "processing_status": "failed",
+            "ocr_raw_text": message,
+            "updated_at": datetime.utcnow()
+        }}
+    )
+    if user_id is not None:
+        await ocr_event_bus.publish(user_id, card_id, STAGE_FAILED, error=message)
+
+
+# 프로세스 전역 작업 큐
+ocr_job_queue = OCRJobQueue()
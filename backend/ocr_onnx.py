@@ -0,0 +1,173 @@
+"""
+ONNX Runtime OCR 엔진
+EasyOCR의 CRAFT 검출기와 korean_g2 인식기를 ONNX(선택적으로 INT8 동적 양자화)로 실행합니다.
+
+EasyOCR Reader의 검출/인식 모델 자리에 ONNX 세션을 넣는 방식이라 전처리, 박스 병합,
+CTC 디코딩은 EasyOCR 코드를 그대로 사용하며 readtext/detect 결과 형식 (box, text, confidence)도 같습니다.
+
+모델은 서버 시작 전에 한 번 내보내 둡니다 (EasyOCR torch 모델이 있는 환경에서 실행):
+    python ocr_onnx.py export
+"""
+
+import argparse
+import logging
+import os
+from typing import List
+
+from config import OCR_ONNX_MODEL_DIR, OCR_ONNX_THREADS
+from onnx_utils import int8_model_path
+
+logger = logging.getLogger(__name__)
+
+DETECTOR_FILE = "craft.onnx"
+RECOGNIZER_FILE = "korean_g2.onnx"
+
+
+def model_paths(model_dir: str = OCR_ONNX_MODEL_DIR, int8: bool = False):
+    """(검출기, 인식기) ONNX 모델 경로"""
+    paths = (os.path.join(model_dir, DETECTOR_FILE), os.path.join(model_dir, RECOGNIZER_FILE))
+    return tuple(int8_model_path(path) for path in paths) if int8 else paths
+
+
+def _create_session(model_path: str, threads: int):
+    import onnxruntime as ort
+
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"ONNX OCR 모델이 없습니다: {model_path} (python ocr_onnx.py export 로 생성)")
+
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.inter_op_num_threads = 1
+    if threads:
+        options.intra_op_num_threads = threads
+    return ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+
+
+class OnnxDetector:
+    """CRAFT 검출기 자리에 들어가는 ONNX 세션 (EasyOCR test_net이 net(x)로 호출)"""
+
+    def __init__(self, model_path: str, threads: int = OCR_ONNX_THREADS):
+        self.model_path = model_path
+        self.session = _create_session(model_path, threads)
+        self.input_name = self.session.get_inputs()[0].name
+        # 두 번째 출력(feature)은 EasyOCR 후처리에서 사용하지 않음
+        self.output_names = [self.session.get_outputs()[0].name]
+
+    def eval(self):
+        return self
+
+    def __call__(self, x):
+        import torch
+
+        score = self.session.run(self.output_names, {self.input_name: x.numpy()})[0]
+        return torch.from_numpy(score), None
+
+
+class OnnxRecognizer:
+    """korean_g2 인식기 자리에 들어가는 ONNX 세션 (EasyOCR recognizer_predict가 model(image, text)로 호출)"""
+
+    def __init__(self, model_path: str, threads: int = OCR_ONNX_THREADS):
+        self.model_path = model_path
+        self.session = _create_session(model_path, threads)
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+
+    def eval(self):
+        return self
+
+    def __call__(self, image, text=None):
+        import torch
+
+        feeds = {self.input_names[0]: image.numpy()}
+        # 사용하지 않는 text 입력이 그래프에 남아 있으면 함께 전달
+        if len(self.input_names) > 1 and text is not None:
+            feeds[self.input_names[1]] = text.numpy()
+        return torch.from_numpy(self.session.run(None, feeds)[0])
+
+
+def create_onnx_reader(lang_list: List[str], recog_network: str, int8: bool = False,
+                       model_dir: str = OCR_ONNX_MODEL_DIR, threads: int = OCR_ONNX_THREADS):
+    """torch 모델 대신 ONNX 세션을 사용하는 EasyOCR Reader 생성"""
+    import easyocr
+    from easyocr.config import BASE_PATH
+    from easyocr.detection import get_textbox
+    from easyocr.utils import CTCLabelConverter
+
+    detector_path, recognizer_path = model_paths(model_dir, int8)
+
+    # torch 모델은 로드하지 않고 문자 집합/언어 설정만 사용
+    reader = easyocr.Reader(lang_list=lang_list, gpu=False, recog_network=recog_network,
+                            detector=False, recognizer=False)
+    reader.detect_network = 'craft'
+    reader.get_textbox = get_textbox
+    reader.detector = OnnxDetector(detector_path, threads)
+    reader.recognizer = OnnxRecognizer(recognizer_path, threads)
+    dict_list = {lang: os.path.join(BASE_PATH, 'dict', f"{lang}.txt") for lang in lang_list}
+    reader.converter = CTCLabelConverter(reader.character, {}, dict_list)
+
+    logger.info(f"ONNX OCR 모델 로드: {detector_path}, {recognizer_path}")
+    return reader
+
+
+def export_onnx(lang_list: List[str], recog_network: str, model_dir: str = OCR_ONNX_MODEL_DIR,
+                int8: bool = True) -> List[str]:
+    """EasyOCR torch 모델을 동적 입력 크기 ONNX로 내보내고, 선택적으로 INT8 동적 양자화 모델 생성"""
+    import easyocr
+    import torch
+    from easyocr.config import imgH
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    os.makedirs(model_dir, exist_ok=True)
+    detector_path, recognizer_path = model_paths(model_dir)
+
+    # 이미 torch 양자화된 모델은 내보낼 수 없으므로 quantize=False로 로드
+    reader = easyocr.Reader(lang_list=lang_list, gpu=False, recog_network=recog_network, quantize=False)
+    detector = getattr(reader.detector, 'module', reader.detector)
+    recognizer = getattr(reader.recognizer, 'module', reader.recognizer)
+    detector.eval()
+    recognizer.eval()
+
+    with torch.no_grad():
+        torch.onnx.export(
+            detector, torch.rand(1, 3, 640, 960), detector_path,
+            input_names=['input'], output_names=['score', 'feature'],
+            dynamic_axes={'input': {0: 'batch', 2: 'height', 3: 'width'},
+                          'score': {0: 'batch', 1: 'score_height', 2: 'score_width'},
+                          'feature': {0: 'batch', 2: 'feature_height', 3: 'feature_width'}},
+            opset_version=12, do_constant_folding=True
+        )
+        torch.onnx.export(
+            recognizer, (torch.rand(1, 1, imgH, 256), torch.zeros(1, 26, dtype=torch.long)), recognizer_path,
+            input_names=['image', 'text'], output_names=['preds'],
+            dynamic_axes={'image': {0: 'batch', 3: 'width'}, 'text': {0: 'batch'},
+                          'preds': {0: 'batch', 1: 'steps'}},
+            opset_version=12, do_constant_folding=True
+        )
+    written = [detector_path, recognizer_path]
+    logger.info(f"ONNX OCR 모델 내보내기 완료: {model_dir}")
+
+    if int8:
+        for path in (detector_path, recognizer_path):
+            quantize_dynamic(path, int8_model_path(path), weight_type=QuantType.QUInt8)
+            written.append(int8_model_path(path))
+        logger.info("INT8 OCR 모델 생성 완료")
+
+    return written
+
+
+def main():
+    from ocr_engine import OCR_LANGUAGES, OCR_RECOG_NETWORK
+
+    parser = argparse.ArgumentParser(description="EasyOCR 모델 ONNX 내보내기")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export = subparsers.add_parser("export", help="검출기/인식기를 ONNX(+INT8)로 내보내기")
+    export.add_argument("--output", default=OCR_ONNX_MODEL_DIR)
+    export.add_argument("--no-int8", action="store_true", help="INT8 모델 생성 생략")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for path in export_onnx(OCR_LANGUAGES, OCR_RECOG_NETWORK, args.output, not args.no_int8):
+        print(f"✅ {path} ({os.path.getsize(path) / (1024 * 1024):.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,51 @@ OCR 결과 파싱 모듈
 import re
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
+# 파싱 규칙이 바뀌면 올려서 이전 OCR 캐시를 무효화
+PARSER_VERSION = "1"
+
+
+def _keyword_regex(keywords: List[str]) -> 're.Pattern':
+    """키워드 목록을 하나의 alternation 정규식으로 컴파일 (긴 키워드 우선)"""
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    return re.compile('|'.join(re.escape(keyword) for keyword in ordered))
+
+
+def _alternation_regex(patterns: List[str]) -> 're.Pattern':
+    """여러 정규식을 패턴별 캡처 그룹으로 묶은 단일 정규식으로 컴파일 (lastindex로 패턴 식별)"""
+    return re.compile('|'.join(f'({pattern})' for pattern in patterns))
+
+
+class LineFeatures:
+    """OCR 텍스트 한 줄의 분류 결과"""
+
+    __slots__ = (
+        'has_legal_form', 'has_company_keyword', 'has_position_keyword',
+        'has_department_keyword', 'has_name_exclude_keyword',
+        'is_address', 'is_excluded', 'is_personal_name', 'is_potential_company'
+    )
+
+
+class _LineFeatureCache(dict):
+    """parse() 한 번 동안 줄별 특징을 처음 조회될 때 계산해 보관"""
+
+    def __init__(self, parser: 'OCRParser'):
+        super().__init__()
+        self._parser = parser
+
+    def __missing__(self, text: str) -> LineFeatures:
+        features = self._parser.classify_line(text)
+        self[text] = features
+        return features
+
+
 class OCRParser:
     """OCR 결과를 파싱하여 명함 정보를 추출하는 클래스"""
     
@@ -53,6 +94,101 @@ class OCRParser:
             '설', '마', '길', '연', '위', '표', '명', '기', '반', '왕', '금', '옥', '육', '인', 
             '맹', '제', '모', '장', '남', '탁', '국', '여', '진', '어', '은', '편', '구', '용'
         ]
+        
+        # 법인 형태 키워드 (회사명 후보 중 최우선)
+        self.legal_form_keywords = [
+            '주식회사', '(주)', '㈜', '유한회사', '(유)', '합자회사', '(합)',
+            '합명회사', '유한책임회사', '(유책)', 'Co.', 'Ltd', 'Inc', 'Corp',
+            'Corporation', 'Company', 'Limited', 'LLC', 'LLP', '사무소'
+        ]
+        
+        self._compile_rules()
+    
+    def _compile_rules(self):
+        """모든 정규식과 키워드 목록을 생성 시 한 번만 컴파일"""
+        # 키워드 목록 → 단일 alternation 정규식 (부분 문자열 포함 여부를 한 번의 검색으로 판단)
+        self._legal_form_re = _keyword_regex(self.legal_form_keywords)
+        self._company_re = _keyword_regex(self.company_keywords)
+        self._position_re = _keyword_regex(self.position_keywords)
+        self._department_re = _keyword_regex(self.department_keywords)
+        self._address_keyword_re = _keyword_regex(self.address_keywords)
+        self._name_exclude_re = _keyword_regex(self.company_keywords + self.position_keywords)
+        self._position_set = frozenset(self.position_keywords)
+        self._surname_set = frozenset(self.common_surnames)
+        
+        # 전체 텍스트 대상 패턴
+        self._email_res = [
+            re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+            re.compile(r'\b[가-힣A-Za-z0-9._%+-]+@[가-힣A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        ]
+        self._phone_res = [
+            re.compile(r'(\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4})'),  # 02-1234-5678, 010-1234-5678
+            re.compile(r'(\d{3}[-\s]?\d{4}[-\s]?\d{4})'),      # 010-1234-5678
+            re.compile(r'(\+82[-\s]?\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})')  # +82-10-1234-5678
+        ]
+        self._fax_re = re.compile(r'Fax[.\s]*(\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4})')
+        self._postal_res = [
+            re.compile(r'\b\d{5}\b'),  # 5자리 우편번호
+            re.compile(r'\b\d{3}-\d{3}\b')  # 구 우편번호 형식
+        ]
+        self._english_name_re = re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b')
+        
+        # 줄 단위 패턴
+        self._noise_re = re.compile(r'^[^\w가-힣]+$')
+        self._whitespace_re = re.compile(r'\s+')
+        self._hangul_re = re.compile(r'^[가-힣]+$')
+        self._name_line_re = re.compile(r'^[가-힣\s]{2,}$')
+        self._phone_like_re = re.compile(r'\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4}')
+        self._zipcode_re = re.compile(r'\b\d{5}\b')
+        self._paren_line_re = re.compile(r'^\(.+\)$')
+        self._address_regex = re.compile(
+            r'\b(서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)\s?[^\s]{0,15}(시|도)\s?[^\s]{0,15}(구|군|시)?[^\s]*(로|길|번길)[^\s]*'
+        )
+        
+        # 주소 강력 지표 (search) / 제외 패턴 (match) - 패턴별 그룹으로 묶어 어떤 패턴이 맞았는지 식별
+        self._strong_address_patterns = [
+            # 행정구역 패턴
+            r'[가-힣]*시\s*[가-힣]*구',  # 서울시 강남구
+            r'[가-힣]*도\s*[가-힣]*시',  # 경기도 성남시
+            r'[가-힣]*구\s*[가-힣]*동',  # 강남구 역삼동
+            r'[가-힣]*시\s*[가-힣]*동',  # 부산시 해운대동
+            # 도로명 패턴
+            r'[가-힣]*로\s*\d+',         # 테헤란로 123
+            r'[가-힣]*길\s*\d+',         # 강남대로길 45
+            r'\d+번길',                   # 15번길
+            r'[가-힣]*대로\s*\d+',       # 강남대로 567
+            # 건물 정보 패턴
+            r'\d+층',                     # 5층
+            r'\d+호',                     # 301호
+            r'[가-힣]*빌딩',              # 삼성빌딩
+            r'[가-힣]*타워',              # 63타워
+            r'[가-힣]*센터',              # 월드트레이드센터 (단, 회사명의 센터와 구분 필요)
+            # 기타 주소 패턴
+            r'\d+-\d+',                   # 123-45 (번지)
+            r'[가-힣]*아파트',            # 래미안아파트
+            r'[가-힣]*오피스텔',          # 강남오피스텔
+        ]
+        self._strong_address_re = _alternation_regex(self._strong_address_patterns)
+        
+        self._exclude_patterns = [
+            r'.*@.*',  # 이메일
+            r'.*[0-9]{2,3}[-\s]?[0-9]{3,4}[-\s]?[0-9]{4}.*',  # 전화번호
+            r'^[0-9\-\s\(\)]+$',  # 숫자와 기호만
+            r'^\d{5}$',  # 우편번호
+            r'^[A-Za-z]{1,3}$',  # 너무 짧은 영문 (CEO, CTO 등 직책 제외)
+            r'^www\.',  # 웹사이트
+            r'^http',   # URL
+        ]
+        self._exclude_re = _alternation_regex(self._exclude_patterns)
+        
+        # 명백히 회사명이 아닌 패턴들
+        self._non_company_re = _alternation_regex([
+            r'^[가-힣]{2,4}$',  # 2-4글자 순수 한글 이름 (성씨로 시작)
+            r'.*@.*',  # 이메일
+            r'.*[0-9]{2,3}[-\s]?[0-9]{3,4}[-\s]?[0-9]{4}.*',  # 전화번호
+            r'^[0-9\-\s\(\)]+$',  # 숫자와 기호만
+            r'^[A-Za-z]{1,3}$',  # 짧은 영문 (KIA, TO 등은 제외)
+        ])
     
     def parse(self, text_data: List[str], filename: str = None) -> Dict[str, Any]:
         """OCR 결과에서 명함 정보를 추출합니다."""
@@ -79,6 +215,9 @@ class OCRParser:
         text_data = self._preprocess_text(text_data)
         full_text = ' '.join(text_data)
         
+        # 줄별 특징은 처음 조회될 때 한 번만 계산하여 모든 추출기가 공유
+        lines = _LineFeatureCache(self)
+        
         # 각 정보 추출
         result['email'] = self._extract_email(full_text)
         phone, mobile, fax = self._extract_phones(full_text)
@@ -87,10 +226,10 @@ class OCRParser:
         result['fax_number'] = fax
         result['postal_code'] = self._extract_postal_code(full_text)
         result['name_en'] = self._extract_english_name(full_text)
-        result['company_name'] = self._extract_company_name(text_data)
-        result['name'] = self._extract_korean_name(text_data)
-        result['position'] = self._extract_position(text_data)
-        result['department'] = self._extract_department(text_data, result['position'])
+        result['company_name'] = self._extract_company_name(text_data, lines)
+        result['name'] = self._extract_korean_name(text_data, lines)
+        result['position'] = self._extract_position(text_data, lines)
+        result['department'] = self._extract_department(text_data, result['position'], lines)
         result['address'] = self._extract_address(text_data)
         
         # 결과 검증 및 로깅
@@ -98,6 +237,22 @@ class OCRParser:
         
         return result
     
+    def classify_line(self, text: str) -> 'LineFeatures':
+        """한 줄의 특징(주소/제외/회사명 후보/이름/키워드 포함 여부)을 계산"""
+        features = LineFeatures()
+        features.has_legal_form = self._legal_form_re.search(text) is not None
+        features.has_company_keyword = self._company_re.search(text) is not None
+        features.has_position_keyword = self._position_re.search(text) is not None
+        features.has_department_keyword = self._department_re.search(text) is not None
+        features.has_name_exclude_keyword = self._name_exclude_re.search(text) is not None
+        features.is_address = self._is_address_text(text)
+        features.is_excluded = self._is_excluded_text(text)
+        features.is_personal_name = self._is_personal_name(text)
+        features.is_potential_company = self._is_potential_company_name(
+            text, features.has_position_keyword
+        )
+        return features
+    
     def _preprocess_text(self, text_data: List[str]) -> List[str]:
         """텍스트 전처리 - 노이즈 제거"""
         # OCR 결과가 너무 짧거나 의미 없는 경우 로깅
@@ -109,7 +264,7 @@ class OCRParser:
         for text in text_data:
             cleaned = text.strip()
             # 너무 짧거나 특수문자만 있는 텍스트 제거
-            if len(cleaned) > 1 and not re.match(r'^[^\w가-힣]+$', cleaned):
+            if len(cleaned) > 1 and not self._noise_re.match(cleaned):
                 cleaned_texts.append(cleaned)
         
         if cleaned_texts:
@@ -120,13 +275,8 @@ class OCRParser:
     
     def _extract_email(self, full_text: str) -> str:
         """이메일 추출"""
-        email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            r'\b[가-힣A-Za-z0-9._%+-]+@[가-힣A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        ]
-        
-        for pattern in email_patterns:
-            email_match = re.search(pattern, full_text)
+        for pattern in self._email_res:
+            email_match = pattern.search(full_text)
             if email_match:
                 return email_match.group()
         
@@ -134,18 +284,10 @@ class OCRParser:
     
     def _extract_phones(self, full_text: str) -> tuple:
         """전화번호 추출 (일반전화, 휴대폰, 팩스)"""
-        phone_patterns = [
-            r'(\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4})',  # 02-1234-5678, 010-1234-5678
-            r'(\d{3}[-\s]?\d{4}[-\s]?\d{4})',      # 010-1234-5678
-            r'(\+82[-\s]?\d{1,2}[-\s]?\d{3,4}[-\s]?\d{4})'  # +82-10-1234-5678
-        ]
-        
         phones_found = []
-        for pattern in phone_patterns:
-            phone_matches = re.findall(pattern, full_text)
-            for match in phone_matches:
-                phone_num = match.replace(' ', '-') if isinstance(match, str) else match[0].replace(' ', '-')
-                phones_found.append(phone_num)
+        for pattern in self._phone_res:
+            for match in pattern.findall(full_text):
+                phones_found.append(match.replace(' ', '-'))
         
         # 전화번호 분류
         phone = None
@@ -153,8 +295,7 @@ class OCRParser:
         fax = None
         
         # 팩스 우선 찾기 (Fax 키워드가 있는 라인에서)
-        fax_pattern = r'Fax[.\s]*(\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4})'
-        fax_match = re.search(fax_pattern, full_text)
+        fax_match = self._fax_re.search(full_text)
         if fax_match:
             fax = fax_match.group(1).replace(' ', '-')
             if fax in phones_found:
@@ -175,13 +316,8 @@ class OCRParser:
     
     def _extract_postal_code(self, full_text: str) -> str:
         """우편번호 추출"""
-        postal_patterns = [
-            r'\b\d{5}\b',  # 5자리 우편번호
-            r'\b\d{3}-\d{3}\b'  # 구 우편번호 형식
-        ]
-        
-        for pattern in postal_patterns:
-            postal_match = re.search(pattern, full_text)
+        for pattern in self._postal_res:
+            postal_match = pattern.search(full_text)
             if postal_match:
                 return postal_match.group()
         
@@ -189,32 +325,25 @@ class OCRParser:
     
     def _extract_english_name(self, full_text: str) -> str:
         """영문 이름 추출"""
-        english_name_pattern = r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b'
-        english_match = re.search(english_name_pattern, full_text)
+        english_match = self._english_name_re.search(full_text)
         if english_match:
             return english_match.group()
         
         return None
     
-    def _extract_company_name(self, text_data: List[str]) -> str:
+    def _extract_company_name(self, text_data: List[str], lines: '_LineFeatureCache') -> str:
         """회사명 추출 (주소 필터링 및 엄격한 조건 적용)"""
         company_candidates = []
         
-        # 법인 형태 키워드 리스트 (우선순위 높음)
-        legal_form_keywords = ['주식회사', '(주)', '㈜', '유한회사', '(유)', '합자회사', '(합)', 
-                            '합명회사', '유한책임회사', '(유책)', 'Co.', 'Ltd', 'Inc', 'Corp', 
-                            'Corporation', 'Company', 'Limited', 'LLC', 'LLP', '사무소']
-        
         # 1. 인접 키워드 병합 처리 (OCR 띄어쓰기 오류 대응)
-        merged_texts = self._merge_adjacent_company_keywords(text_data, legal_form_keywords)
+        merged_texts = self._merge_adjacent_company_keywords(text_data, lines)
         logger.info(f"병합 후 텍스트: {merged_texts}")
         
         # 2. 법인 형태 키워드가 포함된 텍스트 최우선 처리
         for text in merged_texts:
             clean_text = text.strip()
-            if (any(keyword in clean_text for keyword in legal_form_keywords) and
-                not self._is_address_text(clean_text) and
-                not self._is_excluded_text(clean_text)):
+            features = lines[clean_text]
+            if features.has_legal_form and not features.is_address and not features.is_excluded:
                 company_candidates.append(clean_text)
                 logger.info(f"법인 형태 키워드로 회사명 발견: {clean_text}")
         
@@ -222,17 +351,15 @@ class OCRParser:
         if not company_candidates:
             for text in merged_texts:
                 clean_text = text.strip()
-                if (any(keyword in clean_text for keyword in self.company_keywords) and
-                    not self._is_address_text(clean_text) and
-                    not self._is_excluded_text(clean_text)):
+                features = lines[clean_text]
+                if features.has_company_keyword and not features.is_address and not features.is_excluded:
                     company_candidates.append(clean_text)
                     logger.info(f"회사 키워드로 회사명 발견: {clean_text}")
         
         # 4. 가장 적절한 회사명 선택
         if company_candidates:
             # 법인 형태 키워드가 포함된 것 최우선
-            legal_candidates = [text for text in company_candidates 
-                            if any(keyword in text for keyword in legal_form_keywords)]
+            legal_candidates = [text for text in company_candidates if lines[text].has_legal_form]
             if legal_candidates:
                 # 법인 형태 중에서는 가장 완전한 형태 선택 (하지만 너무 길지는 않게)
                 legal_candidates.sort(key=lambda x: (len(x) > 50, -len(x)))  # 50글자 이상은 후순위
@@ -241,8 +368,7 @@ class OCRParser:
                 return result
             
             # 일반 회사 키워드가 포함된 것 다음 우선
-            keyword_candidates = [text for text in company_candidates 
-                                if any(keyword in text for keyword in self.company_keywords)]
+            keyword_candidates = [text for text in company_candidates if lines[text].has_company_keyword]
             if keyword_candidates:
                 # 키워드 포함 중에서는 적절한 길이 선택 (너무 길지 않게)
                 keyword_candidates.sort(key=lambda x: (len(x) > 30, -len(x)))  # 30글자 이하 우선
@@ -257,10 +383,10 @@ class OCRParser:
             # 명확히 제외되지 않는 텍스트 중에서 선택 (매우 제한적)
             for text in text_data:
                 clean_text = text.strip()
-                if (len(clean_text) >= 3 and  # 최소 3글자 이상
-                    not self._is_address_text(clean_text) and
-                    not self._is_excluded_text(clean_text) and
-                    not self._is_personal_name(clean_text)):
+                if len(clean_text) < 3:  # 최소 3글자 이상
+                    continue
+                features = lines[clean_text]
+                if not features.is_address and not features.is_excluded and not features.is_personal_name:
                     logger.info(f"제한적 조건으로 회사명 후보 발견: {clean_text}")
                     return clean_text
             
@@ -273,38 +399,15 @@ class OCRParser:
         if not text:
             return False
         
-        # 주소 관련 강력한 지표들
-        strong_address_indicators = [
-            # 행정구역 패턴
-            r'[가-힣]*시\s*[가-힣]*구',  # 서울시 강남구
-            r'[가-힣]*도\s*[가-힣]*시',  # 경기도 성남시
-            r'[가-힣]*구\s*[가-힣]*동',  # 강남구 역삼동
-            r'[가-힣]*시\s*[가-힣]*동',  # 부산시 해운대동
-            # 도로명 패턴
-            r'[가-힣]*로\s*\d+',         # 테헤란로 123
-            r'[가-힣]*길\s*\d+',         # 강남대로길 45
-            r'\d+번길',                   # 15번길
-            r'[가-힣]*대로\s*\d+',       # 강남대로 567
-            # 건물 정보 패턴
-            r'\d+층',                     # 5층
-            r'\d+호',                     # 301호
-            r'[가-힣]*빌딩',              # 삼성빌딩
-            r'[가-힣]*타워',              # 63타워
-            r'[가-힣]*센터',              # 월드트레이드센터 (단, 회사명의 센터와 구분 필요)
-            # 기타 주소 패턴
-            r'\d+-\d+',                   # 123-45 (번지)
-            r'[가-힣]*아파트',            # 래미안아파트
-            r'[가-힣]*오피스텔',          # 강남오피스텔
-        ]
-        
         # 강력한 지표가 있으면 주소로 판단
-        for pattern in strong_address_indicators:
-            if re.search(pattern, text):
-                logger.info(f"강력한 주소 지표로 주소 판단: '{text}' (패턴: {pattern})")
-                return True
+        match = self._strong_address_re.search(text)
+        if match:
+            pattern = self._strong_address_patterns[match.lastindex - 1]
+            logger.info(f"강력한 주소 지표로 주소 판단: '{text}' (패턴: {pattern})")
+            return True
         
-        # 주소 키워드 개수 확인 (시, 구, 동, 로, 길 등)
-        address_keyword_count = sum(1 for keyword in self.address_keywords if keyword in text)
+        # 주소 키워드 종류 수 확인 (시, 구, 동, 로, 길 등)
+        address_keyword_count = len(set(self._address_keyword_re.findall(text)))
         
         # 주소 키워드가 2개 이상이고 길이가 10글자 이상인 경우 주소로 판단
         if address_keyword_count >= 2 and len(text) >= 10:
@@ -312,7 +415,7 @@ class OCRParser:
             return True
         
         # 우편번호가 포함된 경우
-        if re.search(r'\b\d{5}\b', text):
+        if self._zipcode_re.search(text):
             logger.info(f"우편번호 포함으로 주소 판단: '{text}'")
             return True
         
@@ -323,25 +426,15 @@ class OCRParser:
         if not text:
             return True
         
-        # 제외할 패턴들
-        exclude_patterns = [
-            r'.*@.*',  # 이메일
-            r'.*[0-9]{2,3}[-\s]?[0-9]{3,4}[-\s]?[0-9]{4}.*',  # 전화번호
-            r'^[0-9\-\s\(\)]+$',  # 숫자와 기호만
-            r'^\d{5}$',  # 우편번호
-            r'^[A-Za-z]{1,3}$',  # 너무 짧은 영문 (CEO, CTO 등 직책 제외)
-            r'^www\.',  # 웹사이트
-            r'^http',   # URL
-        ]
-        
         # 제외 패턴에 해당하는지 확인
-        for pattern in exclude_patterns:
-            if re.match(pattern, text):
-                logger.info(f"제외 패턴으로 텍스트 제외: '{text}' (패턴: {pattern})")
-                return True
+        match = self._exclude_re.match(text)
+        if match:
+            pattern = self._exclude_patterns[match.lastindex - 1]
+            logger.info(f"제외 패턴으로 텍스트 제외: '{text}' (패턴: {pattern})")
+            return True
         
         # 직책 키워드가 포함된 경우 제외 (단독 직책인 경우)
-        if text.strip() in self.position_keywords:
+        if text.strip() in self._position_set:
             logger.info(f"직책 키워드로 텍스트 제외: '{text}'")
             return True
         
@@ -353,18 +446,18 @@ class OCRParser:
             return False
         
         # 공백 제거 후 순수 한글 확인
-        no_space_text = re.sub(r'\s+', '', text)
+        no_space_text = self._whitespace_re.sub('', text)
         
         # 2-4글자 순수 한글이고 성씨로 시작하는 경우
         if (2 <= len(no_space_text) <= 4 and 
-            re.match(r'^[가-힣]+$', no_space_text) and 
-            no_space_text[0] in self.common_surnames):
+            self._hangul_re.match(no_space_text) and 
+            no_space_text[0] in self._surname_set):
             logger.info(f"개인 이름으로 판단: '{text}'")
             return True
         
         return False
 
-    def _merge_adjacent_company_keywords(self, text_data: List[str], legal_keywords: List[str]) -> List[str]:
+    def _merge_adjacent_company_keywords(self, text_data: List[str], lines: '_LineFeatureCache') -> List[str]:
         """인접한 회사명 관련 키워드들을 병합하는 함수 (주소 필터링 추가)"""
         if not text_data:
             return text_data
@@ -374,23 +467,22 @@ class OCRParser:
         
         while i < len(text_data):
             current_text = text_data[i].strip()
+            current = lines[current_text]
             
             # 현재 텍스트가 주소인 경우 병합하지 않고 그대로 추가
-            if self._is_address_text(current_text):
+            if current.is_address:
                 merged_texts.append(current_text)
                 i += 1
                 continue
             
-            # 현재 텍스트가 법인 키워드인지 확인
-            is_legal_keyword = any(keyword in current_text for keyword in legal_keywords)
-            
-            if is_legal_keyword and i + 1 < len(text_data):
+            if current.has_legal_form and i + 1 < len(text_data):
                 next_text = text_data[i + 1].strip()
+                following = lines[next_text]
                 
                 # 다음 텍스트가 주소가 아니고 회사명일 가능성이 높은지 확인
-                if (not self._is_address_text(next_text) and 
-                    not self._is_excluded_text(next_text) and
-                    self._is_potential_company_name(next_text)):
+                if (not following.is_address and 
+                    not following.is_excluded and
+                    following.is_potential_company):
                     # 병합
                     merged_text = current_text + ' ' + next_text
                     merged_texts.append(merged_text)
@@ -399,15 +491,14 @@ class OCRParser:
                     continue
             
             # 현재 텍스트가 잠재적 회사명이고 다음이 법인 키워드인 경우
-            elif (not self._is_address_text(current_text) and 
-                not self._is_excluded_text(current_text) and
-                self._is_potential_company_name(current_text) and 
+            elif (not current.is_excluded and
+                current.is_potential_company and 
                 i + 1 < len(text_data)):
                 next_text = text_data[i + 1].strip()
-                is_next_legal = any(keyword in next_text for keyword in legal_keywords)
+                following = lines[next_text]
                 
                 # 다음 텍스트가 주소가 아니고 법인 키워드인 경우
-                if is_next_legal and not self._is_address_text(next_text):
+                if following.has_legal_form and not following.is_address:
                     # 병합 (회사명 + 법인형태)
                     merged_text = current_text + ' ' + next_text
                     merged_texts.append(merged_text)
@@ -423,54 +514,39 @@ class OCRParser:
         all_texts = list(text_data) + merged_texts
         return all_texts
     
-    def _is_potential_company_name(self, text: str) -> bool:
+    def _is_potential_company_name(self, text: str, has_position_keyword: Optional[bool] = None) -> bool:
         """텍스트가 잠재적 회사명인지 판단"""
         if not text or len(text) < 2:
             return False
         
-        # 명백히 회사명이 아닌 패턴들
-        exclude_patterns = [
-            r'^[가-힣]{2,4}$',  # 2-4글자 순수 한글 이름 (성씨로 시작)
-            r'.*@.*',  # 이메일
-            r'.*[0-9]{2,3}[-\s]?[0-9]{3,4}[-\s]?[0-9]{4}.*',  # 전화번호
-            r'^[0-9\-\s\(\)]+$',  # 숫자와 기호만
-            r'^[A-Za-z]{1,3}$',  # 짧은 영문 (KIA, TO 등은 제외)
-        ]
-        
-        # 제외 패턴에 해당하면 회사명이 아님
-        if any(re.match(pattern, text) for pattern in exclude_patterns):
+        # 명백히 회사명이 아닌 패턴에 해당하면 회사명이 아님
+        # (2-4글자 순수 한글은 성씨 여부와 관계없이 이 단계에서 걸러짐)
+        if self._non_company_re.match(text):
             return False
         
         # 직책 키워드가 포함되면 회사명이 아님
-        if any(keyword in text for keyword in self.position_keywords):
-            return False
-        
-        # 성씨로 시작하는 2-4글자 한글이면 이름일 가능성이 높음
-        if (2 <= len(text) <= 4 and 
-            re.match(r'^[가-힣]+$', text) and 
-            text[0] in self.common_surnames):
-            return False
-        
-        return True
+        if has_position_keyword is None:
+            has_position_keyword = self._position_re.search(text) is not None
+        return not has_position_keyword
     
-    def _extract_korean_name(self, text_data: List[str]) -> str:
+    def _extract_korean_name(self, text_data: List[str], lines: '_LineFeatureCache') -> str:
         """한국어 이름 추출 (공백 처리 및 필터링 개선)"""
         logger.info(f"이름 추출 시작 - 입력 텍스트: {text_data}")
 
         name_candidates = []
         for text in text_data:
             clean_text = text.strip()
-            no_space_text = re.sub(r'\s+', '', clean_text)
 
             # 제외 조건 검사
-            if any(keyword in clean_text for keyword in self.company_keywords + self.position_keywords):
+            if lines[clean_text].has_name_exclude_keyword:
                 continue
-            if '@' in clean_text or re.search(r'\d{2,3}[-\s]?\d{3,4}[-\s]?\d{4}', clean_text):
+            if '@' in clean_text or self._phone_like_re.search(clean_text):
                 continue
 
             # 순수 한글 공백 포함 + 제거 후 이름 조건 확인
-            if re.match(r'^[가-힣\s]{2,}$', clean_text):
-                if 2 <= len(no_space_text) <= 4 and no_space_text[0] in self.common_surnames:
+            if self._name_line_re.match(clean_text):
+                no_space_text = self._whitespace_re.sub('', clean_text)
+                if 2 <= len(no_space_text) <= 4 and no_space_text[0] in self._surname_set:
                     name_candidates.append(no_space_text)
                     logger.info(f"이름 후보 발견: '{clean_text}' → '{no_space_text}'")
 
@@ -488,65 +564,57 @@ class OCRParser:
         logger.info(f"모든 후보: {name_candidates}")
         return None
     
-    def _extract_position(self, text_data: List[str]) -> str:
+    def _extract_position(self, text_data: List[str], lines: '_LineFeatureCache') -> str:
         """직책 추출"""
         # 1. 직책만 단독으로 있는 경우
         for text in text_data:
             clean_text = text.strip()
-            if clean_text in self.position_keywords:
+            if clean_text in self._position_set:
                 logger.info(f"단독 직책 발견: {clean_text}")
                 return clean_text
         
         # 2. 직책이 다른 텍스트와 함께 있는 경우
         for text in text_data:
             clean_text = text.strip()
-            for keyword in self.position_keywords:
-                if keyword in clean_text:
-                    # 직책만 추출 (이름 부분 제거)
-                    if keyword == '대표' and len(clean_text) > 2:
-                        # "대표우태경" -> "대표"
-                        logger.info(f"직책 추출: '{clean_text}' -> '대표'")
-                        return '대표'
-                    else:
-                        logger.info(f"직책 텍스트 발견: {clean_text}")
-                        return clean_text
+            if not lines[clean_text].has_position_keyword:
+                continue
+            # 직책만 추출 (이름 부분 제거) - '대표'는 키워드 목록의 첫 항목이므로 우선 확인
+            if '대표' in clean_text and len(clean_text) > 2:
+                # "대표우태경" -> "대표"
+                logger.info(f"직책 추출: '{clean_text}' -> '대표'")
+                return '대표'
+            logger.info(f"직책 텍스트 발견: {clean_text}")
+            return clean_text
         
         return None
     
-    def _extract_department(self, text_data: List[str], position: str) -> str:
+    def _extract_department(self, text_data: List[str], position: str, lines: '_LineFeatureCache') -> str:
         """부서 추출"""
         for text in text_data:
-            if any(keyword in text for keyword in self.department_keywords) and text != position:
+            if lines[text].has_department_keyword and text != position:
                 return text
         
         return None
     
     def _extract_address(self, text_data: List[str]) -> Optional[str]:
         """주소 추출 (우편번호 제거 + 정규표현식 + 키워드 + 괄호 줄 병합)"""
-
-        address_keywords = self.address_keywords
-        address_regex = re.compile(
-            r'\b(서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)\s?[^\s]{0,15}(시|도)\s?[^\s]{0,15}(구|군|시)?[^\s]*(로|길|번길)[^\s]*'
-        )
-        zipcode_regex = re.compile(r'\b\d{5}\b')  # 우편번호 제거용
-
         candidates = []
 
         for i, text in enumerate(text_data):
             cleaned = text.strip()
-            cleaned = zipcode_regex.sub('', cleaned).strip()  # ✅ 우편번호 제거
+            cleaned = self._zipcode_re.sub('', cleaned).strip()  # ✅ 우편번호 제거
 
             score = 0
-            if any(k in cleaned for k in address_keywords):
+            if self._address_keyword_re.search(cleaned):
                 score += 1
-            if address_regex.search(cleaned):
+            if self._address_regex.search(cleaned):
                 score += 2
 
             if score > 0:
                 appended_text = cleaned
                 if i + 1 < len(text_data):
                     next_line = text_data[i + 1].strip()
-                    if re.match(r'^\(.+\)$', next_line):  # 괄호로만 구성된 문장
+                    if self._paren_line_re.match(next_line):  # 괄호로만 구성된 문장
                         appended_text += f' {next_line}'
                 candidates.append((score, appended_text))
 
@@ -578,4 +646,65 @@ ocr_parser = OCRParser()
 
 def parse_ocr_result(text_data: List[str], filename: str = None) -> Dict[str, Any]:
     """OCR 결과에서 명함 정보를 추출합니다. (하위 호환성을 위한 함수)"""
-    return ocr_parser.parse(text_data, filename) 
\ No newline at end of file
+    return ocr_parser.parse(text_data, filename) 
+
+
+def _init_parse_worker(log_level: int):
+    """parse_many 워커 프로세스 초기화: 명함마다 남기는 상세 로그 수준 조정"""
+    logger.setLevel(log_level)
+
+
+def _parse_chunk(chunk: List[List[str]]) -> List[Dict[str, Any]]:
+    """워커 프로세스에서 명함 텍스트 묶음 파싱"""
+    return [ocr_parser.parse(text_data) for text_data in chunk]
+
+
+def create_parse_executor(workers: Optional[int] = None,
+                          log_level: int = logging.WARNING) -> ProcessPoolExecutor:
+    """parse_many용 프로세스 풀 생성 (여러 번 호출할 때 재사용)"""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parse_worker,
+        initargs=(log_level,)
+    )
+
+
+def parse_many(text_lists: Iterable[List[str]], workers: Optional[int] = None,
+               chunk_size: int = 64, executor: Optional[Executor] = None) -> Iterator[Dict[str, Any]]:
+    """여러 명함의 OCR 결과를 프로세스 풀에서 일괄 파싱
+
+    입력을 chunk_size 단위로 나눠 워커 프로세스에 보내고, 결과는 입력 순서대로 yield합니다.
+    입력은 끝까지 한 번에 읽지 않고 진행 중인 묶음 수를 워커 수의 2배로 제한해 스트리밍합니다.
+    workers=1이면 프로세스 풀 없이 현재 프로세스에서 파싱합니다.
+    executor를 넘기면 해당 풀을 사용하고 종료하지 않습니다.
+    """
+    chunk_size = max(1, chunk_size)
+    items = iter(text_lists)
+
+    if executor is None and workers == 1:
+        for text_data in items:
+            yield ocr_parser.parse(text_data)
+        return
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = create_parse_executor(workers)
+    max_in_flight = 2 * (getattr(executor, '_max_workers', None) or workers or 1)
+
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                chunk = list(islice(items, chunk_size))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_parse_chunk, chunk))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown(wait=True)
+
@@ -1,11 +1,33 @@
+import asyncio
+import hashlib
+import json
 import os
 import cv2
 import numpy as np
-import easyocr
 import fitz  # PyMuPDF
 import logging
 from PIL import Image
 import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List, Optional, Tuple, Union
+from ocr_engine import OCREngineRegistry, engine_registry
+from ocr_executor import OCRExecutor, ocr_executor
+from config import (
+    ORIENTATION_MODE,
+    ORIENTATION_MAX_SIDE,
+    ORIENTATION_SAMPLE_CROPS,
+    ORIENTATION_EARLY_EXIT_CONFIDENCE,
+    OCR_RECOGNITION_BATCH_SIZE,
+    OCR_MAX_IMAGE_SIDE,
+    SKEW_METHOD,
+    SKEW_MAX_SIDE,
+    SKEW_MAX_ANGLE,
+    DESKEW_MODE,
+    PDF_MAX_PAGES,
+    PDF_MIN_TEXT_CHARS,
+    PDF_RENDER_MAX_ZOOM,
+    OCR_ENGINE
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -21,85 +43,245 @@ try:
 except ImportError:
     logger.warning("pillow-heif not installed, HEIF files will not be supported")
 
+# 처리 가능한 이미지 입력: 파일 경로, 업로드 바이트, 디코딩된 BGR ndarray
+ImageSource = Union[str, bytes, np.ndarray]
+
+# 전처리/인식 동작이 바뀌면 올려서 이전 OCR 캐시를 무효화 (ONNX 엔진은 결과가 미세하게 달라 캐시 분리)
+PROCESSOR_VERSION = "4" if OCR_ENGINE == "easyocr" else f"4-{OCR_ENGINE}"
+
+# OCR 결과를 바꾸는 전처리 설정. 하나라도 바뀌면 캐시 키(PROCESSOR_SETTINGS_HASH)가 달라짐
+PROCESSOR_SETTINGS = {
+    "ORIENTATION_MODE": ORIENTATION_MODE,
+    "ORIENTATION_MAX_SIDE": ORIENTATION_MAX_SIDE,
+    "ORIENTATION_SAMPLE_CROPS": ORIENTATION_SAMPLE_CROPS,
+    "ORIENTATION_EARLY_EXIT_CONFIDENCE": ORIENTATION_EARLY_EXIT_CONFIDENCE,
+    "OCR_MAX_IMAGE_SIDE": OCR_MAX_IMAGE_SIDE,
+    "SKEW_METHOD": SKEW_METHOD,
+    "SKEW_MAX_SIDE": SKEW_MAX_SIDE,
+    "SKEW_MAX_ANGLE": SKEW_MAX_ANGLE,
+    "DESKEW_MODE": DESKEW_MODE,
+    "PDF_MAX_PAGES": PDF_MAX_PAGES,
+    "PDF_MIN_TEXT_CHARS": PDF_MIN_TEXT_CHARS,
+    "PDF_RENDER_MAX_ZOOM": PDF_RENDER_MAX_ZOOM
+}
+
+
+def settings_hash(settings: dict) -> str:
+    """설정 값의 짧은 해시 (캐시 키용 8자리)"""
+    encoded = json.dumps(settings, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:8]
+
+
+PROCESSOR_SETTINGS_HASH = settings_hash(PROCESSOR_SETTINGS)
+
+# 투영 프로파일 기울기 추정에 사용하는 최대 전경 픽셀 수 (초과 시 균등 샘플링)
+_SKEW_MAX_POINTS = 40000
+
+# OCR과 동시에 YOLO 로고 후보 탐지를 실행하는 보조 스레드 (워커 프로세스마다 지연 생성)
+_logo_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_logo_pool() -> ThreadPoolExecutor:
+    global _logo_pool
+    if _logo_pool is None:
+        _logo_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logo")
+    return _logo_pool
+
 class OCRProcessor:
-    def __init__(self, upload_folder: str):
+    def __init__(self, upload_folder: str, engine: Optional[OCREngineRegistry] = None,
+                 executor: Optional[OCRExecutor] = None):
         logger.info("Initializing OCR Processor")
         self.upload_folder = upload_folder
-        logger.info("Loading EasyOCR model for Korean and English")
-        self.reader = easyocr.Reader(
-                        lang_list=['ko', 'en'],
-                        gpu=False,
-                        recog_network='korean_g2'
-                    )
+        # 모델은 프로세스 전역 레지스트리에서 공유 (라우터마다 따로 로드하지 않음)
+        self.engine = engine or engine_registry
+        # 동기 OCR 작업은 제한된 워커 풀에서 실행
+        self.executor = executor or ocr_executor
 
         if not os.path.exists(upload_folder):
             logger.info(f"Creating upload folder: {upload_folder}")
             os.makedirs(upload_folder)
-        
-        # 로고 추출기 초기화 (지연 로딩)
-        self._logo_extractor = None
+
+    @property
+    def reader(self):
+        """공유 EasyOCR 리더"""
+        return self.engine.reader
+
+    @property
+    def recognizer_height(self) -> int:
+        """인식 모델 입력 높이 (EasyOCR는 Reader 속성이 아닌 모듈 전역 imgH로 관리)"""
+        from easyocr import easyocr as easyocr_module
+        return getattr(easyocr_module, 'imgH', 64)
 
     @property
     def logo_extractor(self):
-        """로고 추출기 지연 로딩"""
-        if self._logo_extractor is None:
-            try:
-                from .logo_extractor import LogoExtractor
-                self._logo_extractor = LogoExtractor(self.upload_folder)
-                logger.info("로고 추출기 초기화 완료")
-            except Exception as e:
-                logger.error(f"로고 추출기 초기화 실패: {str(e)}")
-                self._logo_extractor = None
-        return self._logo_extractor
+        """공유 로고 추출기 (지연 로딩)"""
+        return self.engine.logo_extractor
 
-    def validate_image(self, image_path: str) -> bool:
-        """이미지 파일 유효성 검사"""
+    def validate_image(self, image: Union[str, bytes]) -> bool:
+        """이미지 파일 유효성 검사 (경로 또는 바이트)"""
         try:
-            with Image.open(image_path) as img:
+            with Image.open(self._as_stream(image)) as img:
                 # HEIF 파일의 경우 특별 처리
                 if img.format in ['HEIF', 'HEIC']:
-                    logger.info(f"HEIF/HEIC file detected: {image_path}")
+                    logger.info(f"HEIF/HEIC file detected: {self._describe(image)}")
                 img.verify()
             return True
         except Exception as e:
-            logger.error(f"Image validation failed for {image_path}: {str(e)}")
+            logger.error(f"Image validation failed for {self._describe(image)}: {str(e)}")
             return False
 
-    def detect_skew_angle(self, image: np.ndarray) -> float:
+    @staticmethod
+    def _as_stream(image: Union[str, bytes]):
+        if isinstance(image, (bytes, bytearray, memoryview)):
+            return io.BytesIO(image)
+        return image
+
+    @staticmethod
+    def _describe(image) -> str:
+        if isinstance(image, str):
+            return image
+        if isinstance(image, np.ndarray):
+            return f"<ndarray {image.shape[1]}x{image.shape[0]}>"
+        return f"<{len(image)} bytes>"
+
+    def load_image(self, image: ImageSource, max_side: Optional[int] = None) -> np.ndarray:
+        """경로/바이트를 한 번만 디코딩하여 BGR ndarray로 반환
+
+        긴 변이 max_side(기본 OCR_MAX_IMAGE_SIDE, 0이면 제한 없음)를 넘으면 축소합니다.
+        JPEG는 draft 모드로 DCT 단계에서 1/2~1/8 크기로 디코딩하여 전체 해상도 디코딩을 생략합니다.
+        """
+        if isinstance(image, np.ndarray):
+            return image
+        max_side = OCR_MAX_IMAGE_SIDE if max_side is None else max_side
+
+        try:
+            # PIL로 이미지 열기
+            with Image.open(self._as_stream(image)) as pil_img:
+                # HEIF/HEIC 파일의 경우 로그 출력
+                if pil_img.format in ['HEIF', 'HEIC']:
+                    logger.info(f"Processing HEIF/HEIC file: {self._describe(image)}")
+
+                # JPEG 축소 디코딩 (요청 크기 이상인 가장 작은 배율 선택)
+                if max_side and pil_img.format == 'JPEG' and max(pil_img.size) > max_side:
+                    ratio = max_side / max(pil_img.size)
+                    pil_img.draft(pil_img.mode, tuple(int(np.ceil(dim * ratio)) for dim in pil_img.size))
+
+                # RGBA인 경우 RGB로 변환
+                if pil_img.mode == 'RGBA':
+                    pil_img = pil_img.convert('RGB')
+                elif pil_img.mode not in ['RGB', 'L']:  # HEIF의 경우 다양한 모드 가능
+                    pil_img = pil_img.convert('RGB')
+
+                # 이미지가 너무 큰 경우 리사이징 (정수배 박스 축소 후 LANCZOS로 마무리)
+                if max_side and max(pil_img.size) > max_side:
+                    ratio = max_side / max(pil_img.size)
+                    new_size = tuple(max(1, int(dim * ratio)) for dim in pil_img.size)
+                    pil_img = pil_img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+                # PIL 이미지를 OpenCV 형식으로 변환
+                img_array = np.array(pil_img)
+        except Exception as e:
+            logger.error(f"Image decoding failed for {self._describe(image)}: {str(e)}")
+            raise ValueError("Invalid or corrupted image file") from e
+
+        if img_array.ndim == 2:
+            return cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR)
+        return cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+
+    def detect_skew_angle(self, image: np.ndarray, method: Optional[str] = None) -> float:
+        """기울기 각도 추정 (rotate_image(image, -angle)로 보정되는 각도)
+
+        method: contour(윤곽선 minAreaRect 중앙값) 또는 projection(축소 이진 이미지의 투영 프로파일 탐색)
+        """
+        method = (method or SKEW_METHOD).lower()
         try:
             if len(image.shape) == 3:
                 gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
             else:
                 gray = image.copy()
 
-            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (30, 5))
-            morph = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-            contours, _ = cv2.findContours(morph, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-
-            angles = []
-            for contour in contours:
-                if cv2.contourArea(contour) > 100:
-                    rect = cv2.minAreaRect(contour)
-                    angle = rect[2]
-                    if angle < -45:
-                        angle += 90
-                    elif angle > 45:
-                        angle -= 90
-                    angles.append(angle)
-
-            if angles:
-                median_angle = np.median(angles)
-                logger.info(f"Detected skew angle: {median_angle:.2f} degrees")
-                return median_angle
-            else:
-                logger.info("No significant skew detected")
-                return 0.0
+            if method == 'projection':
+                return self._detect_skew_projection(gray)
+            return self._detect_skew_contour(gray)
 
         except Exception as e:
             logger.error(f"Error detecting skew angle: {str(e)}")
             return 0.0
 
+    def _detect_skew_contour(self, gray: np.ndarray) -> float:
+        """원본 해상도에서 텍스트 덩어리 윤곽선의 minAreaRect 각도 중앙값 (기존 방식)"""
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (30, 5))
+        morph = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        contours, _ = cv2.findContours(morph, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+        angles = []
+        for contour in contours:
+            if cv2.contourArea(contour) > 100:
+                rect = cv2.minAreaRect(contour)
+                angle = rect[2]
+                if angle < -45:
+                    angle += 90
+                elif angle > 45:
+                    angle -= 90
+                angles.append(angle)
+
+        if angles:
+            median_angle = np.median(angles)
+            logger.info(f"Detected skew angle: {median_angle:.2f} degrees")
+            return median_angle
+        else:
+            logger.info("No significant skew detected")
+            return 0.0
+
+    def _detect_skew_projection(self, gray: np.ndarray) -> float:
+        """축소 이진 이미지의 전경 픽셀을 각도별로 투영하여 행 프로파일이 가장 뾰족한 각도 선택
+
+        이미지를 회전시키지 않고 전경 좌표만 후보 각도 전체에 대해 한 번에 투영(NumPy 행렬 연산)하며,
+        거친 간격으로 찾은 뒤 주변을 0.1도 간격으로 다시 탐색합니다.
+        """
+        h, w = gray.shape[:2]
+        scale = min(1.0, SKEW_MAX_SIDE / max(h, w))
+        if scale < 1.0:
+            gray = cv2.resize(gray, (max(1, int(w * scale)), max(1, int(h * scale))),
+                              interpolation=cv2.INTER_AREA)
+        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        # 어두운 바탕의 밝은 글씨면 적은 쪽을 전경으로 사용
+        if np.count_nonzero(binary) > binary.size // 2:
+            binary = cv2.bitwise_not(binary)
+
+        ys, xs = np.nonzero(binary)
+        if len(ys) < 50:
+            logger.info("No significant skew detected")
+            return 0.0
+        if len(ys) > _SKEW_MAX_POINTS:
+            keep = np.linspace(0, len(ys) - 1, _SKEW_MAX_POINTS).astype(np.int64)
+            ys, xs = ys[keep], xs[keep]
+        sh, sw = binary.shape[:2]
+        ys = ys.astype(np.float32) - sh / 2
+        xs = xs.astype(np.float32) - sw / 2
+
+        def sharpest(angles: np.ndarray) -> float:
+            radians = np.deg2rad(angles).astype(np.float32)
+            # 각도 β로 투영한 행 좌표: 기울기 β인 텍스트 줄은 한 행에 모임
+            rows = np.rint(ys[None, :] * np.cos(radians)[:, None] - xs[None, :] * np.sin(radians)[:, None])
+            rows = rows.astype(np.int64)
+            rows -= rows.min()
+            size = int(rows.max()) + 1
+            rows += (np.arange(len(angles), dtype=np.int64) * size)[:, None]
+            profiles = np.bincount(rows.ravel(), minlength=len(angles) * size).reshape(len(angles), size)
+            scores = np.square(profiles.astype(np.float64)).sum(axis=1)
+            return float(angles[int(np.argmax(scores))])
+
+        step = 0.5
+        coarse = sharpest(np.arange(-SKEW_MAX_ANGLE, SKEW_MAX_ANGLE + step / 2, step))
+        fine = sharpest(np.arange(coarse - step, coarse + step + 0.05, 0.1))
+
+        # 이미지 좌표(y 아래 방향)에서 오른쪽 아래로 기운 줄은 반시계 회전으로 보정
+        skew_angle = -fine
+        logger.info(f"Detected skew angle (projection): {skew_angle:.2f} degrees")
+        return skew_angle
+
     def rotate_image(self, image: np.ndarray, angle: float) -> np.ndarray:
         if abs(angle) < 0.5:
             return image
@@ -125,62 +307,116 @@ class OCRProcessor:
             logger.error(f"Error rotating image: {str(e)}")
             return image
 
-    def correct_orientation(self, image: np.ndarray) -> np.ndarray:
+    def correct_orientation(self, image: np.ndarray, mode: Optional[str] = None) -> np.ndarray:
+        """텍스트 방향(0/90/180/270도) 보정"""
+        angle = self.detect_orientation(image, mode)
+        return self._rotate_right_angle(image, angle)
+
+    def detect_orientation(self, image: np.ndarray, mode: Optional[str] = None) -> int:
+        """이미지를 바로 세우기 위해 필요한 시계방향 회전 각도 반환"""
+        mode = (mode or ORIENTATION_MODE).lower()
+        if mode == 'off':
+            return 0
+        if mode == 'full':
+            return self._detect_orientation_full(image)
+        return self._detect_orientation_fast(image)
+
+    @staticmethod
+    def _rotate_right_angle(image: np.ndarray, angle: int) -> np.ndarray:
+        if angle == 90:
+            return cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
+        if angle == 180:
+            return cv2.rotate(image, cv2.ROTATE_180)
+        if angle == 270:
+            return cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
+        return image
+
+    def _detect_orientation_full(self, image: np.ndarray) -> int:
+        """4방향 모두 전체 OCR을 수행하여 평균 신뢰도가 가장 높은 방향 선택 (기존 방식)"""
         def get_confidence_score(img: np.ndarray) -> float:
-            temp_path = "temp_orientation_test.png"
-            cv2.imwrite(temp_path, img)
-            result = self.reader.readtext(temp_path)
-            os.remove(temp_path)
+            result = self.reader.readtext(img)
             if not result:
                 return 0.0
             return np.mean([r[2] for r in result])  # 평균 신뢰도
 
-        # 0, 90, 180, 270 회전 이미지 생성
-        rotations = {
-            0: image,
-            90: cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE),
-            180: cv2.rotate(image, cv2.ROTATE_180),
-            270: cv2.rotate(image, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        }
-
-        scores = {angle: get_confidence_score(rot_img) for angle, rot_img in rotations.items()}
+        scores = {angle: get_confidence_score(self._rotate_right_angle(image, angle))
+                  for angle in (0, 90, 180, 270)}
         best_angle = max(scores, key=scores.get)
 
         logger.info(f"📐 방향 감지 (신뢰도 기준): {scores}")
         logger.info(f"🔄 최종 선택된 방향: {best_angle}도")
 
-        return rotations[best_angle]
-
-    def correct_skew(self, image_path: str) -> tuple[np.ndarray, str]:
-        try:
-            # PIL로 이미지 열기
-            with Image.open(image_path) as pil_img:
-                # HEIF/HEIC 파일의 경우 로그 출력
-                if pil_img.format in ['HEIF', 'HEIC']:
-                    logger.info(f"Processing HEIF/HEIC file: {image_path}")
-                
-                # RGBA인 경우 RGB로 변환
-                if pil_img.mode == 'RGBA':
-                    pil_img = pil_img.convert('RGB')
-                elif pil_img.mode not in ['RGB', 'L']:  # HEIF의 경우 다양한 모드 가능
-                    pil_img = pil_img.convert('RGB')
-                
-                # 이미지가 너무 큰 경우 리사이징
-                if max(pil_img.size) > 4000:
-                    ratio = 4000 / max(pil_img.size)
-                    new_size = tuple(int(dim * ratio) for dim in pil_img.size)
-                    pil_img = pil_img.resize(new_size, Image.Resampling.LANCZOS)
-                
-                # PIL 이미지를 OpenCV 형식으로 변환
-                img_array = np.array(pil_img)
-                orig_image = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        return best_angle
+
+    def _detect_orientation_fast(self, image: np.ndarray) -> int:
+        """축소 이미지에서 검출기 1회 + 샘플 박스 인식만으로 방향 판단
+
+        1. 텍스트 박스의 가로/세로 비율 통계로 0/180도 계열인지 90/270도 계열인지 결정
+        2. 후보 방향에서 가장 큰 박스 몇 개만 인식하여 평균 신뢰도 비교
+        3. 첫 번째 후보의 신뢰도가 충분히 높으면 나머지 후보는 건너뜀
+        """
+        h, w = image.shape[:2]
+        scale = min(1.0, ORIENTATION_MAX_SIDE / max(h, w))
+        small = image
+        if scale < 1.0:
+            small = cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+        sh, sw = small.shape[:2]
+
+        horizontal_list, free_list = self.reader.detect(small)
+        boxes = list(horizontal_list[0]) if horizontal_list else []
+        for poly in (free_list[0] if free_list else []):
+            xs = [p[0] for p in poly]
+            ys = [p[1] for p in poly]
+            boxes.append([min(xs), max(xs), min(ys), max(ys)])
+        boxes = [[int(max(0, b[0])), int(min(sw, b[1])), int(max(0, b[2])), int(min(sh, b[3]))]
+                 for b in boxes if b[1] > b[0] and b[3] > b[2]]
+
+        if not boxes:
+            logger.info("📐 방향 감지: 텍스트 박스 없음 → 0도 유지")
+            return 0
+
+        # 면적 가중 가로 박스 비율 (가로로 긴 박스가 많으면 0/180도 계열)
+        widths = np.array([b[1] - b[0] for b in boxes], dtype=np.float64)
+        heights = np.array([b[3] - b[2] for b in boxes], dtype=np.float64)
+        areas = widths * heights
+        horizontal_ratio = float(areas[widths >= heights].sum() / max(areas.sum(), 1.0))
+        candidates = (0, 180) if horizontal_ratio >= 0.5 else (90, 270)
+
+        # 면적이 큰 박스 위주로 샘플링
+        order = np.argsort(-areas)[:max(1, ORIENTATION_SAMPLE_CROPS)]
+        samples = [boxes[i] for i in order]
+
+        scores = {}
+        for angle in candidates:
+            rotated = self._rotate_right_angle(small, angle)
+            rotated_boxes = [self._rotate_box(b, angle, sw, sh) for b in samples]
+            result = self.reader.recognize(rotated, horizontal_list=rotated_boxes, free_list=[])
+            scores[angle] = float(np.mean([r[2] for r in result])) if result else 0.0
+            if angle == candidates[0] and scores[angle] >= ORIENTATION_EARLY_EXIT_CONFIDENCE:
+                break
 
-            if orig_image is None:
-                logger.error(f"Failed to load image: {image_path}")
-                return None, image_path
+        best_angle = max(scores, key=scores.get)
+        logger.info(f"📐 방향 감지 (fast, 가로 비율 {horizontal_ratio:.2f}): {scores}")
+        logger.info(f"🔄 최종 선택된 방향: {best_angle}도")
+        return best_angle
 
+    @staticmethod
+    def _rotate_box(box: list, angle: int, width: int, height: int) -> list:
+        """[x_min, x_max, y_min, y_max] 박스를 이미지 회전(시계방향)에 맞춰 변환"""
+        x_min, x_max, y_min, y_max = box
+        if angle == 90:
+            return [height - y_max, height - y_min, x_min, x_max]
+        if angle == 180:
+            return [width - x_max, width - x_min, height - y_max, height - y_min]
+        if angle == 270:
+            return [y_min, y_max, width - x_max, width - x_min]
+        return list(box)
+
+    def correct_skew(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """방향 + 기울기 보정 (메모리 상에서만 처리, 실패 시 None)"""
+        try:
             # 텍스트 방향 보정
-            base_image = self.correct_orientation(orig_image)
+            base_image = self.correct_orientation(image)
 
             # 기울기 보정
             skew_angle = self.detect_skew_angle(base_image)
@@ -189,90 +425,421 @@ class OCRProcessor:
             else:
                 corrected_image = base_image
 
-            corrected_path = f"{image_path}_corrected.png"
-            cv2.imwrite(corrected_path, corrected_image)
-            logger.info(f"Skew + 회전 보정 이미지 저장 완료: {corrected_path}")
-            return corrected_image, corrected_path
+            logger.info("Skew + 회전 보정 완료")
+            return corrected_image
 
         except Exception as e:
             logger.error(f"Error in skew correction: {str(e)}")
-            return None, image_path
-
-    async def process_image(self, image_path: str) -> list:
-        """이미지 처리 및 OCR 수행"""
-        logger.info(f"Processing image: {image_path}")
-        corrected_path = None
+            return None
+
+    async def process_image(self, image: ImageSource, detail: bool = False,
+                            preprocessed: bool = False, deskew: Optional[str] = None) -> list:
+        """이미지 처리 및 OCR 수행 - 이벤트 루프를 막지 않도록 OCR 워커 풀에서 실행"""
+        return await self.executor.run_method(
+            self, 'process_image_sync', image, detail, preprocessed, deskew
+        )
+
+    async def preprocess(self, image: ImageSource, deskew: Optional[str] = None) -> np.ndarray:
+        """디코딩 + 방향/기울기 보정만 OCR 워커 풀에서 실행 (진행 단계를 나눠 알릴 때 사용)"""
+        return await self.executor.run_method(self, 'preprocess_image', image, deskew)
+
+    def process_image_sync(self, image: ImageSource, detail: bool = False,
+                           preprocessed: bool = False, deskew: Optional[str] = None) -> list:
+        """이미지 처리 및 OCR 수행 (경로, 업로드 바이트, 디코딩된 ndarray 지원)
+
+        detail=True이면 텍스트 대신 readtext 원본 결과 [(box, text, confidence)]를 반환합니다.
+        preprocessed=True이면 preprocess_image()를 거친 ndarray로 보고 보정을 건너뜁니다.
+        deskew(기본 DESKEW_MODE): image는 이미지 전체를 회전한 뒤 다시 검출하고,
+        boxes는 검출 1회의 박스 각도로 기울기를 구해 박스 영역만 펴서 인식합니다.
+        """
+        logger.info(f"Processing image: {self._describe(image)}")
+        deskew = (deskew or DESKEW_MODE).lower()
 
         try:
-            if not self.validate_image(image_path):
-                raise ValueError("Invalid or corrupted image file")
-
-            # 이미지 보정
-            corrected_image, corrected_path = self.correct_skew(image_path)
-            if corrected_image is None:
-                logger.warning("Using original image as correction failed")
-                final_path = image_path
-            else:
-                final_path = corrected_path
+            corrected_image = image if preprocessed else self.preprocess_image(image, deskew)
 
             # OCR 수행
-            result = self.reader.readtext(final_path)
+            result = self._run_ocr(corrected_image, deskew)
             extracted_text = [text[1] for text in result]
             logger.info(f"Successfully extracted {len(extracted_text)} text segments from image")
 
+            if detail:
+                return self._to_plain_result(result)
             return extracted_text
 
         except Exception as e:
-            logger.error(f"Error processing image {image_path}: {str(e)}", exc_info=True)
+            logger.error(f"Error processing image {self._describe(image)}: {str(e)}", exc_info=True)
             raise
-        finally:
-            if corrected_path and corrected_path != image_path and os.path.exists(corrected_path):
-                os.remove(corrected_path)
-                logger.info(f"Removed temporary corrected image: {corrected_path}")
-
-    async def process_pdf(self, pdf_path: str) -> list:
-        """PDF 파일에서 텍스트 추출"""
-        logger.info(f"Processing PDF: {pdf_path}")
-        doc = fitz.open(pdf_path)
-        extracted_text = []
-        
+
+    def _run_ocr(self, corrected_image: np.ndarray, deskew: str) -> list:
+        """보정된 이미지에서 검출 + 인식 ([(box, text, confidence)])"""
+        if deskew == 'boxes':
+            return self._recognize_crops(self._detect_crops(corrected_image, deskew))
+        return self.reader.readtext(corrected_image)
+
+    async def process_image_with_logo(self, image: ImageSource, detail: bool = False,
+                                      deskew: Optional[str] = None) -> dict:
+        """OCR + 로고 추출 통합 처리 - OCR 워커 풀에서 실행"""
+        return await self.executor.run_method(self, 'process_image_with_logo_sync', image, detail, deskew)
+
+    async def extract_logo(self, image: ImageSource) -> Optional[dict]:
+        """로고만 추출 - OCR 워커 풀에서 실행"""
+        return await self.executor.run_method(self, 'extract_logo_only', image)
+
+    def process_image_with_logo_sync(self, image: ImageSource, detail: bool = False,
+                                     deskew: Optional[str] = None) -> dict:
+        """디코딩/보정을 한 번만 하고 같은 ndarray로 OCR과 로고 추출을 함께 수행
+
+        YOLO 후보 탐지는 보조 스레드에서 OCR과 동시에 실행하고, OCR이 끝나면
+        텍스트 박스와 겹치는 후보를 제외한 뒤 텍스트를 가린 이미지로 휴리스틱 탐지를 합니다.
+        반환: {'text': 텍스트 리스트(detail=True이면 readtext 형식), 'logo': 로고 정보 또는 None}
+        """
+        if self.is_pdf(image):
+            # PDF는 페이지별 텍스트만 추출 (로고 탐지는 명함 사진 대상)
+            return {'text': self.process_pdf_sync(image, detail), 'logo': None}
+
+        logger.info(f"Processing image with logo: {self._describe(image)}")
+        deskew = (deskew or DESKEW_MODE).lower()
+        corrected_image = self.preprocess_image(image, deskew)
+
+        extractor = self.logo_extractor
+        candidates = None
+        if extractor is not None:
+            candidates = _get_logo_pool().submit(extractor.detect_yolo_candidates, corrected_image)
+
+        result = self._run_ocr(corrected_image, deskew)
+        logger.info(f"Successfully extracted {len(result)} text segments from image")
+
+        logo = None
+        if candidates is not None:
+            try:
+                logo = extractor.select_logo(corrected_image, candidates.result(),
+                                             self._text_boxes([box for box, _, _ in result]))
+            except Exception as e:
+                logger.error(f"로고 추출 중 오류: {str(e)}")
+
+        plain = self._to_plain_result(result)
+        return {'text': plain if detail else [text for _, text, _ in plain], 'logo': logo}
+
+    def extract_logo_only(self, image: ImageSource) -> Optional[dict]:
+        """로고만 추출 (디코딩/방향 보정 1회, 텍스트 영역은 검출 모델로만 찾아 가림)"""
+        extractor = self.logo_extractor
+        if extractor is None:
+            logger.error("로고 추출기를 사용할 수 없습니다")
+            return None
+
+        corrected_image = self.preprocess_image(image)
+        candidates = _get_logo_pool().submit(extractor.detect_yolo_candidates, corrected_image)
         try:
-            for page_num, page in enumerate(doc):
-                logger.info(f"Processing page {page_num + 1} of PDF")
-                try:
-                    # PDF 페이지를 이미지로 변환
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # 해상도 2배 증가
-                    
-                    # 이미지 데이터를 PIL Image로 변환
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    
-                    # 이미지 저장
-                    temp_image_path = os.path.join(self.upload_folder, f'temp_image_{page_num}.png')
-                    img.save(temp_image_path, format='PNG')
-                    
-                    try:
-                        # OCR 처리
-                        result = self.reader.readtext(temp_image_path)
-                        page_text = [text[1] for text in result]
-                        extracted_text.extend(page_text)
-                        logger.info(f"Successfully extracted {len(page_text)} text segments from page {page_num + 1}")
-                    finally:
-                        # 임시 이미지 파일 삭제
-                        if os.path.exists(temp_image_path):
-                            os.remove(temp_image_path)
-                            logger.info(f"Removed temporary image: {temp_image_path}")
-                
-                except Exception as e:
-                    logger.error(f"Error processing page {page_num + 1}: {str(e)}")
-                    continue  # 한 페이지 처리 실패 시 다음 페이지로 진행
-            
-            return extracted_text
+            horizontal_list, free_list = self.reader.detect(corrected_image)
+            text_boxes = [[x_min, y_min, x_max, y_max] for x_min, x_max, y_min, y_max in horizontal_list[0]]
+            text_boxes += self._text_boxes(free_list[0])
         except Exception as e:
-            logger.error(f"Error processing PDF {pdf_path}: {str(e)}", exc_info=True)
-            raise
+            logger.warning(f"텍스트 영역 검출 실패, 가리지 않고 로고 탐색: {str(e)}")
+            text_boxes = None
+        return extractor.select_logo(corrected_image, candidates.result(), text_boxes)
+
+    @staticmethod
+    def _text_boxes(quads: list) -> List[List[float]]:
+        """4점 텍스트 박스를 [x1, y1, x2, y2] 외접 사각형으로 변환"""
+        boxes = []
+        for quad in quads:
+            points = np.asarray(quad, dtype=np.float32)
+            x_min, y_min = points.min(axis=0)
+            x_max, y_max = points.max(axis=0)
+            boxes.append([float(x_min), float(y_min), float(x_max), float(y_max)])
+        return boxes
+
+    def preprocess_image(self, image: ImageSource, deskew: Optional[str] = None) -> np.ndarray:
+        """디코딩(1회) + 방향/기울기 보정된 BGR ndarray 반환 (boxes 모드는 방향 보정만)"""
+        # 디코딩은 한 번만 수행하고 이후 단계는 ndarray를 그대로 전달
+        original_image = self.load_image(image)
+
+        # boxes 모드의 기울기는 검출 박스 단위로 보정하므로 이미지 전체 회전 생략
+        if (deskew or DESKEW_MODE).lower() == 'boxes':
+            try:
+                return self.correct_orientation(original_image)
+            except Exception as e:
+                logger.error(f"Error in orientation correction: {str(e)}")
+                return original_image
+
+        # 이미지 보정
+        corrected_image = self.correct_skew(original_image)
+        if corrected_image is None:
+            logger.warning("Using original image as correction failed")
+            corrected_image = original_image
+        return corrected_image
+
+    async def process_images_batch(self, images: List[ImageSource], detail: bool = False,
+                                   deskew: Optional[str] = None) -> List[Union[list, Exception]]:
+        """여러 명함 일괄 OCR - OCR 워커 풀에서 실행"""
+        return await self.executor.run_method(self, 'process_images_batch_sync', images, detail, deskew)
+
+    def process_images_batch_sync(self, images: List[ImageSource], detail: bool = False,
+                                  deskew: Optional[str] = None) -> List[Union[list, Exception]]:
+        """여러 명함을 한 번에 OCR 처리
+
+        명함별로 보정과 텍스트 검출을 수행한 뒤, 모든 명함의 텍스트 영역을
+        한데 모아 인식 모델에 batch_size 단위로 넣어 모델 호출 오버헤드를 줄입니다.
+        결과는 입력 순서대로 텍스트 리스트(detail=True이면 readtext 형식) 또는
+        해당 명함의 예외 객체입니다.
+        """
+        logger.info(f"Processing batch of {len(images)} images")
+        deskew = (deskew or DESKEW_MODE).lower()
+        results: List[Union[list, Exception]] = [None] * len(images)
+        crops = []  # (명함 인덱스, (box, crop_img))
+
+        for index, image in enumerate(images):
+            try:
+                corrected_image = self.preprocess_image(image, deskew)
+                image_list = self._detect_crops(corrected_image, deskew)
+                crops.extend((index, item) for item in image_list)
+                results[index] = []
+            except Exception as e:
+                logger.error(f"Error preprocessing batch image {index}: {str(e)}", exc_info=True)
+                results[index] = e
+
+        recognized = self._recognize_crops([item for _, item in crops])
+        for (index, _), item in zip(crops, recognized):
+            results[index].append(item if detail else item[1])
+
+        if detail:
+            results = [r if isinstance(r, Exception) else self._to_plain_result(r) for r in results]
+
+        logger.info(f"Batch OCR completed: {len(crops)} text regions from {len(images)} images")
+        return results
+
+    def _detect_crops(self, image: np.ndarray, deskew: str = 'image') -> list:
+        """텍스트 검출 후 인식 모델 입력용 영역 목록 [(box, crop_img)] 반환
+
+        boxes 모드는 단어 박스를 모두 회전 사각형으로 받아 박스 각도로 기울기를 구하고,
+        기울기를 없앤 좌표계에서 박스를 줄 단위로 병합한 뒤 원본 좌표의 사각형으로 되돌립니다.
+        각 영역은 원근 변환으로 펴서 잘라내므로 이미지 전체 회전과 재검출이 필요 없습니다.
+        """
+        from easyocr.utils import get_image_list, group_text_box
+
+        reader = self.reader
+        grey = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        if deskew != 'boxes':
+            horizontal_list, free_list = reader.detect(image)
+            image_list, _ = get_image_list(
+                horizontal_list[0], free_list[0], grey, model_height=self.recognizer_height
+            )
+            return image_list
+
+        # slope_ths=0: 병합하지 않은 단어 박스를 4점 사각형 그대로 받음
+        _, free_list = reader.detect(image, slope_ths=0.0, add_margin=0.0)
+        quads = [np.asarray(quad, dtype=np.float32) for quad in free_list[0]]
+        if not quads:
+            return []
+
+        angle = self._box_skew_angle(quads)
+        h, w = image.shape[:2]
+        center = np.array([w / 2, h / 2], dtype=np.float32)
+        cos, sin = np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))
+        to_flat = np.array([[cos, -sin], [sin, cos]], dtype=np.float32)  # 점을 -angle 회전
+
+        polys = []
+        for quad in quads:
+            flat = (quad - center) @ to_flat + center
+            x_min, y_min = flat.min(axis=0)
+            x_max, y_max = flat.max(axis=0)
+            polys.append([x_min, y_min, x_max, y_min, x_max, y_max, x_min, y_max])
+
+        # reader.detect 기본값과 같은 기준으로 줄 단위 병합
+        merged, merged_free = group_text_box(
+            polys, slope_ths=0.1, ycenter_ths=0.5, height_ths=0.5, width_ths=0.5, add_margin=0.1
+        )
+        flat_quads = [np.array([[b[0], b[2]], [b[1], b[2]], [b[1], b[3]], [b[0], b[3]]], dtype=np.float32)
+                      for b in merged]
+        flat_quads += [np.asarray(quad, dtype=np.float32) for quad in merged_free]
+
+        limit = np.array([w - 1, h - 1], dtype=np.float32)
+        line_quads = [
+            np.clip((quad - center) @ to_flat.T + center, 0, limit).astype(np.int32).tolist()
+            for quad in flat_quads
+        ]
+        logger.info(f"📐 박스 기반 기울기 보정: {angle:.2f}도, 단어 {len(quads)}개 → 줄 {len(line_quads)}개")
+
+        image_list, _ = get_image_list([], line_quads, grey, model_height=self.recognizer_height)
+        return image_list
+
+    @staticmethod
+    def _box_skew_angle(quads: List[np.ndarray]) -> float:
+        """단어 박스 윗변/아랫변 각도의 너비 가중 중앙값 (이미지 좌표, 오른쪽 아래로 기울면 양수)"""
+        stacked = np.stack(quads)
+        edges = np.concatenate([stacked[:, 1] - stacked[:, 0], stacked[:, 2] - stacked[:, 3]])
+        widths = np.hypot(edges[:, 0], edges[:, 1])
+        angles = np.degrees(np.arctan2(edges[:, 1], edges[:, 0]))
+        valid = (widths > 0) & (np.abs(angles) < 45)
+        if not valid.any():
+            return 0.0
+        angles, widths = angles[valid], widths[valid]
+        order = np.argsort(angles)
+        cumulative = np.cumsum(widths[order])
+        return float(angles[order][np.searchsorted(cumulative, cumulative[-1] / 2)])
+
+    @staticmethod
+    def _to_plain_result(result: list) -> list:
+        """readtext 결과의 numpy 타입을 직렬화 가능한 파이썬 타입으로 변환"""
+        return [
+            ([[int(x), int(y)] for x, y in box], text, float(confidence))
+            for box, text, confidence in result
+        ]
+
+    def _recognize_crops(self, image_list: list) -> list:
+        """검출된 텍스트 영역들을 배치 단위로 인식 ([(box, text, confidence)], 입력 순서 유지)
+
+        EasyOCR의 recognize()는 CPU에서 박스를 하나씩 처리하므로 get_text를 직접 호출합니다.
+        패딩 낭비를 줄이기 위해 가로/세로 비율이 비슷한 영역끼리 묶습니다.
+        """
+        from easyocr.recognition import get_text
+
+        if not image_list:
+            return []
+
+        reader = self.reader
+        img_h = self.recognizer_height
+        ignore_char = ''.join(set(reader.character) - set(reader.lang_char))
+        ratios = [item[1].shape[1] / max(item[1].shape[0], 1) for item in image_list]
+        order = sorted(range(len(image_list)), key=lambda i: ratios[i])
+
+        recognized = [None] * len(image_list)
+        for start in range(0, len(order), OCR_RECOGNITION_BATCH_SIZE):
+            chunk = order[start:start + OCR_RECOGNITION_BATCH_SIZE]
+            max_width = int(np.ceil(max(max(ratios[i] for i in chunk), 1.0))) * img_h
+            chunk_result = get_text(
+                reader.character, img_h, max_width, reader.recognizer, reader.converter,
+                [image_list[i] for i in chunk],
+                ignore_char=ignore_char,
+                decoder='greedy',
+                beamWidth=5,
+                batch_size=len(chunk),
+                contrast_ths=0.1,
+                adjust_contrast=0.5,
+                filter_ths=0.003,
+                workers=0,
+                device=reader.device
+            )
+            for i, item in zip(chunk, chunk_result):
+                recognized[i] = item
+        return recognized
+
+    @staticmethod
+    def is_pdf(data: Union[str, bytes]) -> bool:
+        """PDF 입력 여부 (경로는 확장자, 바이트는 파일 시그니처 기준)"""
+        if isinstance(data, str):
+            return data.lower().endswith('.pdf')
+        return isinstance(data, (bytes, bytearray, memoryview)) and bytes(data[:5]) == b'%PDF-'
+
+    @staticmethod
+    def _open_pdf(pdf: Union[str, bytes]):
+        if isinstance(pdf, str):
+            return fitz.open(pdf)
+        return fitz.open(stream=bytes(pdf), filetype="pdf")
+
+    @staticmethod
+    def _pdf_text_layer(page) -> Optional[list]:
+        """내장 텍스트 레이어를 readtext 형식 [(box, text, 1.0)]으로 추출 (글자 수가 부족하면 None)"""
+        lines = []
+        for x0, y0, x1, y1, text, _, block_type in page.get_text("blocks"):
+            if block_type != 0:  # 이미지 블록
+                continue
+            box = [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+            lines.extend((box, line.strip(), 1.0) for line in text.splitlines() if line.strip())
+        if sum(len(text) for _, text, _ in lines) < PDF_MIN_TEXT_CHARS:
+            return None
+        return lines
+
+    def inspect_pdf_sync(self, pdf: Union[str, bytes], max_pages: Optional[int] = None) -> List[dict]:
+        """페이지별 텍스트 레이어 확인: [{"page": 번호, "result": 추출 결과 또는 None(OCR 필요)}]"""
+        max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+        logger.info(f"Processing PDF: {self._describe(pdf)}")
+        doc = self._open_pdf(pdf)
+        try:
+            count = doc.page_count
+            if max_pages and count > max_pages:
+                logger.warning(f"⚠️ PDF {count}페이지 중 앞 {max_pages}페이지만 처리합니다")
+                count = max_pages
+            return [{"page": number, "result": self._pdf_text_layer(doc[number])} for number in range(count)]
         finally:
             doc.close()
-            logger.info("PDF processing completed")
+
+    def process_pdf_page_sync(self, pdf: Union[str, bytes], number: int) -> list:
+        """텍스트 레이어가 없는 페이지 한 장을 페이지 크기에 맞는 해상도로 렌더링하여 OCR (readtext 형식)"""
+        doc = self._open_pdf(pdf)
+        try:
+            page = doc[number]
+            # 긴 변이 OCR_MAX_IMAGE_SIDE가 되는 배율 (1pt = 1/72인치, 작은 페이지는 최대 PDF_RENDER_MAX_ZOOM배)
+            zoom = OCR_MAX_IMAGE_SIDE / max(page.rect.width, page.rect.height) if OCR_MAX_IMAGE_SIDE else 2.0
+            zoom = min(max(zoom, 1.0), PDF_RENDER_MAX_ZOOM)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+
+            # 픽스맵 버퍼를 그대로 ndarray로 사용 (임시 파일 없음)
+            page_image = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+            page_image = cv2.cvtColor(page_image, cv2.COLOR_RGB2BGR)
+        finally:
+            doc.close()
+
+        logger.info(f"PDF page {number + 1} rendered at {72 * zoom:.0f} DPI ({pix.width}x{pix.height})")
+        return self.process_image_sync(page_image, detail=True, preprocessed=True)
+
+    async def iter_pdf_pages(self, pdf: Union[str, bytes],
+                             max_pages: Optional[int] = None) -> AsyncIterator[Tuple[int, list]]:
+        """PDF 페이지별 결과를 페이지 순서대로 스트리밍 ((페이지 번호, readtext 형식 결과))
+
+        텍스트 레이어가 있는 페이지는 OCR 없이 바로 내보내고,
+        나머지 페이지는 OCR 워커 풀에서 동시에 렌더링/인식합니다.
+        """
+        pages = await self.executor.run_method(self, 'inspect_pdf_sync', pdf, max_pages)
+        tasks = {
+            entry["page"]: asyncio.ensure_future(
+                self.executor.run_method(self, 'process_pdf_page_sync', pdf, entry["page"])
+            )
+            for entry in pages if entry["result"] is None
+        }
+        logger.info(f"📄 PDF {len(pages)}페이지: 텍스트 레이어 {len(pages) - len(tasks)}개, OCR {len(tasks)}개")
+
+        try:
+            for entry in pages:
+                number = entry["page"]
+                result = entry["result"]
+                if number in tasks:
+                    try:
+                        result = await tasks[number]
+                    except Exception as e:
+                        logger.error(f"Error processing page {number + 1}: {str(e)}")
+                        result = []  # 한 페이지 처리 실패 시 다음 페이지로 진행
+                yield number, result
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def process_pdf(self, pdf: Union[str, bytes], detail: bool = False) -> list:
+        """PDF 텍스트 추출 (페이지 순서대로 이어 붙인 결과, detail=True이면 readtext 형식)"""
+        result = []
+        async for _, page_result in self.iter_pdf_pages(pdf):
+            result.extend(page_result)
+        logger.info("PDF processing completed")
+
+        plain = self._to_plain_result(result)
+        return plain if detail else [text for _, text, _ in plain]
+
+    def process_pdf_sync(self, pdf: Union[str, bytes], detail: bool = False) -> list:
+        """PDF 텍스트 추출 (동기, 페이지 순차 처리)"""
+        result = []
+        for entry in self.inspect_pdf_sync(pdf):
+            if entry["result"] is not None:
+                result.extend(entry["result"])
+                continue
+            try:
+                result.extend(self.process_pdf_page_sync(pdf, entry["page"]))
+            except Exception as e:
+                logger.error(f"Error processing page {entry['page'] + 1}: {str(e)}")
+        logger.info("PDF processing completed")
+
+        plain = self._to_plain_result(result)
+        return plain if detail else [text for _, text, _ in plain]
 
     @staticmethod
     def allowed_file(filename: str) -> bool:
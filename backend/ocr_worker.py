@@ -0,0 +1,284 @@
+"""
+OCR 작업 워커
+ocr_jobs 큐에서 작업을 임대받아 OCR → 파싱 → 명함 업데이트를 수행합니다.
+
+API 프로세스 안에서 실행하거나(OCR_EMBEDDED_WORKER=true),
+API 레플리카와 별도로 확장할 수 있도록 독립 프로세스로 실행합니다:
+    python ocr_worker.py
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from database import get_database, connect_to_mongo, close_mongo_connection
+from ocr_engine import engine_registry
+from ocr_executor import ocr_executor
+from ocr_jobs import LeaseLostError, OCRJobQueue, ocr_job_queue, mark_card_failed
+from ocr_parser import PARSER_VERSION
+from card_search import search_fields
+from ocr_cache import ocr_cache, ocr_with_cache, ocr_many_with_cache
+from ocr_events import ocr_event_bus, STAGE_QUEUED, STAGE_OCR, STAGE_PARSE, STAGE_DONE
+from ocr_processor import OCRProcessor
+from config import OCR_WORKER_CONCURRENCY, OCR_WORKER_BATCH_SIZE, OCR_JOB_POLL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+async def process_ocr_job(job: Dict[str, Any], queue: OCRJobQueue, ocr_processor: OCRProcessor):
+    """작업 하나 처리: 원본 로드 → OCR → 파싱 → 명함 업데이트"""
+    logger.info(f"🔄 OCR 작업 시작: {job.get('original_filename')} (작업: {job['_id']}, 시도: {job.get('attempts')})")
+
+    data = await queue.load_file(job)
+    logger.info(f"📄 파일 크기: {len(data)} bytes")
+
+    async def on_stage(stage: str):
+        await ocr_event_bus.publish(job["user_id"], job["card_id"], stage)
+
+    # OCR 처리 (같은 원본의 이전 결과가 캐시에 있으면 재사용)
+    ocr_result, parsed_result = await ocr_with_cache(
+        ocr_processor, data, job.get("original_filename"), on_stage=on_stage, digest=job.get("sha256")
+    )
+    await save_ocr_result(job, ocr_result, parsed_result, queue)
+
+
+async def process_ocr_jobs_batch(jobs: List[Dict[str, Any]], queue: OCRJobQueue,
+                                 ocr_processor: OCRProcessor) -> List[Optional[Exception]]:
+    """여러 작업을 한 번의 일괄 인식으로 처리. 작업별 예외(성공 시 None) 목록 반환"""
+    logger.info(f"🔄 OCR 일괄 작업 시작: {len(jobs)}개")
+    errors: List[Optional[Exception]] = [None] * len(jobs)
+
+    items = []
+    digests = []
+    loaded = []
+    for i, job in enumerate(jobs):
+        try:
+            items.append((await queue.load_file(job), job.get("original_filename")))
+            digests.append(job.get("sha256"))
+            loaded.append(i)
+        except Exception as e:
+            errors[i] = e
+
+    # 일괄 처리는 보정과 인식이 한 번에 수행되므로 인식/파싱 단계만 알림
+    await ocr_event_bus.publish_many([jobs[i] for i in loaded], STAGE_OCR)
+    batch_results = await ocr_many_with_cache(ocr_processor, items, digests=digests) if items else []
+    await ocr_event_bus.publish_many(
+        [jobs[i] for i, result in zip(loaded, batch_results) if not isinstance(result, Exception)],
+        STAGE_PARSE
+    )
+    for i, result in zip(loaded, batch_results):
+        if isinstance(result, Exception):
+            errors[i] = result
+            continue
+        try:
+            await save_ocr_result(jobs[i], *result, queue)
+        except Exception as e:
+            errors[i] = e
+    return errors
+
+
+async def save_ocr_result(job: Dict[str, Any], ocr_result: List[str],
+                          parsed_result: Dict[str, Any], queue: OCRJobQueue = ocr_job_queue):
+    """파싱된 OCR 결과로 명함 업데이트 (작업 임대를 잃었으면 LeaseLostError, 명함은 그대로)"""
+    card_id = job["card_id"]
+    logger.info(f"✅ OCR 처리 완료: {len(ocr_result)}개 텍스트 추출")
+
+    # OCR 결과 로깅 (처음 5개만)
+    if ocr_result:
+        logger.info("📋 추출된 텍스트 샘플:")
+        for i, text in enumerate(ocr_result[:5]):
+            logger.info(f"  {i+1}. {text}")
+    else:
+        logger.warning("⚠️ OCR 결과가 비어있습니다")
+
+    logger.info(f"📊 파싱 완료 - 이름: {parsed_result.get('name')}, 회사: {parsed_result.get('company_name')}")
+
+    # MongoDB 업데이트
+    db = get_database()
+    update_dict = {
+        "name": parsed_result.get('name'),
+        "name_en": parsed_result.get('name_en'),
+        "email": parsed_result.get('email'),
+        "phone_number": parsed_result.get('phone_number'),
+        "mobile_phone_number": parsed_result.get('mobile_phone_number'),
+        "fax_number": parsed_result.get('fax_number'),
+        "position": parsed_result.get('position'),
+        "department": parsed_result.get('department'),
+        "company_name": parsed_result.get('company_name'),
+        "address": parsed_result.get('address'),
+        "postal_code": parsed_result.get('postal_code'),
+        "ocr_raw_text": parsed_result.get('ocr_raw_text'),
+        "parser_version": PARSER_VERSION,
+        "processing_status": "completed",  # 처리 완료
+        "updated_at": datetime.utcnow()
+    }
+    update_dict.update(search_fields(update_dict))
+
+    # 임대가 만료되어 다른 워커가 가져간 작업이면 그 워커의 결과를 덮어쓰지 않음
+    # (확인과 함께 임대를 연장하므로 저장까지 만료되지 않음)
+    await queue.ensure_lease(job)
+    await db.business_cards.update_one(
+        {"_id": card_id},
+        {"$set": update_dict}
+    )
+    logger.info(f"💾 명함 업데이트 완료: {card_id}")
+
+
+class OCRWorker:
+    """작업 큐를 폴링하며 동시에 여러 작업 묶음을 처리하는 워커"""
+
+    def __init__(self, queue: OCRJobQueue = ocr_job_queue,
+                 ocr_processor: Optional[OCRProcessor] = None,
+                 concurrency: int = OCR_WORKER_CONCURRENCY,
+                 batch_size: int = OCR_WORKER_BATCH_SIZE,
+                 poll_seconds: float = OCR_JOB_POLL_SECONDS):
+        self.queue = queue
+        self._ocr_processor = ocr_processor
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.poll_seconds = poll_seconds
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._stopping = asyncio.Event()
+        self._tasks: Set[asyncio.Task] = set()
+        self._sweep_interval = max(5.0, queue.lease_seconds / 4)
+
+    @property
+    def ocr_processor(self) -> OCRProcessor:
+        if self._ocr_processor is None:
+            self._ocr_processor = engine_registry.processor
+        return self._ocr_processor
+
+    def stop(self):
+        self._stopping.set()
+
+    async def run(self):
+        """작업 루프 (stop() 호출 시 진행 중인 작업을 마치고 종료)"""
+        logger.info(f"👷 OCR 워커 시작: {self.worker_id} "
+                    f"(동시 처리 {self.concurrency}묶음, 묶음당 최대 {self.batch_size}개)")
+        loop = asyncio.get_running_loop()
+        next_sweep = 0.0
+
+        while not self._stopping.is_set():
+            try:
+                if loop.time() >= next_sweep:
+                    for job in await self.queue.requeue_expired():
+                        await mark_card_failed(job["card_id"], "처리 실패: 작업 재시도 횟수 초과",
+                                               job.get("user_id"))
+                    next_sweep = loop.time() + self._sweep_interval
+
+                claimed = False
+                while len(self._tasks) < self.concurrency:
+                    jobs = await self.queue.claim_batch(self.worker_id, self.batch_size)
+                    if not jobs:
+                        break
+                    claimed = True
+                    task = asyncio.create_task(self._handle(jobs))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+                if not claimed:
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+            except Exception as e:
+                logger.error(f"OCR 워커 루프 오류: {str(e)}", exc_info=True)
+                await asyncio.sleep(self.poll_seconds)
+
+        if self._tasks:
+            logger.info(f"진행 중인 OCR 작업 {len(self._tasks)}개 완료 대기")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(f"👋 OCR 워커 종료: {self.worker_id}")
+
+    async def _handle(self, jobs: List[Dict[str, Any]]):
+        heartbeats = [asyncio.create_task(self._heartbeat(job)) for job in jobs]
+        try:
+            if len(jobs) == 1:
+                try:
+                    await process_ocr_job(jobs[0], self.queue, self.ocr_processor)
+                    errors = [None]
+                except Exception as e:
+                    errors = [e]
+            else:
+                try:
+                    errors = await process_ocr_jobs_batch(jobs, self.queue, self.ocr_processor)
+                except Exception as e:
+                    errors = [e] * len(jobs)
+
+            for job, error in zip(jobs, errors):
+                await self._finish(job, error)
+        finally:
+            for heartbeat in heartbeats:
+                heartbeat.cancel()
+
+    async def _finish(self, job: Dict[str, Any], error: Optional[Exception]):
+        try:
+            if error is None:
+                await self.queue.complete(job)
+                await ocr_event_bus.publish(job["user_id"], job["card_id"], STAGE_DONE)
+                return
+
+            if isinstance(error, LeaseLostError):
+                raise error
+            logger.error(f"❌ OCR 작업 처리 오류 {job['_id']}: {str(error)}", exc_info=error)
+            if await self.queue.fail(job, str(error)):
+                await mark_card_failed(job["card_id"], f"처리 실패: {str(error)}", job.get("user_id"))
+            else:
+                # 백오프 후 재시도 대기
+                await ocr_event_bus.publish(job["user_id"], job["card_id"], STAGE_QUEUED, retry=True)
+        except LeaseLostError as lost:
+            # 다른 워커가 처리 중이므로 원본 삭제/재시도/명함 실패 처리를 하지 않음
+            logger.warning(f"⚠️ {lost} (결과를 반영하지 않음)")
+        except Exception as update_error:
+            logger.error(f"작업 상태 업데이트 실패: {str(update_error)}")
+
+    async def _heartbeat(self, job: Dict[str, Any]):
+        """처리 중 임대가 만료되지 않도록 주기적으로 연장"""
+        interval = max(1.0, self.queue.lease_seconds / 3)
+        while True:
+            await asyncio.sleep(interval)
+            if not await self.queue.extend_lease(job, self.worker_id):
+                logger.warning(f"작업 임대를 잃었습니다: {job['_id']}")
+                return
+
+
+async def main():
+    """독립 워커 프로세스 진입점"""
+    await connect_to_mongo()
+    await ocr_job_queue.create_indexes()
+    await ocr_cache.create_indexes()
+    await ocr_event_bus.setup()
+    await ocr_job_queue.recover_orphans()
+
+    # 모델은 작업을 받기 전에 미리 로드 (process 실행기는 워커 프로세스에서 로드)
+    if ocr_executor.kind == "thread":
+        await asyncio.to_thread(engine_registry.warmup)
+
+    worker = OCRWorker()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass
+
+    try:
+        await worker.run()
+    finally:
+        ocr_executor.shutdown(wait=False)
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    asyncio.run(main())
@@ -0,0 +1,13 @@
+"""
+ONNX 모델 공통 유틸
+로고 탐지기(logo_detector)와 OCR 엔진(ocr_onnx)이 함께 쓰는 모델 경로 규칙입니다.
+무거운 의존성(cv2, onnxruntime) 없이 import 할 수 있도록 표준 라이브러리만 사용합니다.
+"""
+
+import os
+
+
+def int8_model_path(model_path: str) -> str:
+    """FP32 모델 경로에 대응하는 INT8 모델 경로 (models/yolov8n.onnx → models/yolov8n-int8.onnx)"""
+    base, extension = os.path.splitext(model_path)
+    return f"{base}-int8{extension or '.onnx'}"
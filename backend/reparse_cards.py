@@ -0,0 +1,161 @@
+"""
+명함 일괄 재파싱
+파서 규칙이 바뀐 뒤 business_cards 컬렉션의 ocr_raw_text로부터 명함 필드를 다시 추출합니다.
+OCR은 다시 수행하지 않으며, 파싱은 프로세스 풀(parse_many)에서 병렬로 처리합니다.
+
+사용자가 PUT /api/cards/{id}로 수정한 필드(edited_fields)는 기본적으로 그대로 두며,
+--overwrite-edits를 주면 수정한 값도 파싱 결과로 덮어씁니다.
+재파싱은 명함 내용을 사용자가 바꾼 것이 아니므로 값이 바뀐 명함만 updated_at을 갱신합니다.
+
+사용법:
+    python reparse_cards.py [--user-id <ObjectId>] [--only-stale] [--workers 4]
+                            [--chunk-size 64] [--batch-size 1000] [--dry-run] [--overwrite-edits]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from database import get_database, connect_to_mongo, close_mongo_connection
+from ocr_parser import PARSER_VERSION, create_parse_executor, parse_many
+from card_search import search_fields
+
+# 재파싱으로 갱신하는 명함 필드
+PARSED_FIELDS = [
+    'name', 'name_en', 'email', 'phone_number', 'mobile_phone_number', 'fax_number',
+    'position', 'department', 'company_name', 'address', 'postal_code'
+]
+
+
+def _load_text_list(raw: Any) -> Optional[List[str]]:
+    """ocr_raw_text(JSON 문자열 목록) 복원. 실패 메시지 등 목록이 아니면 None"""
+    if not isinstance(raw, str):
+        return None
+    try:
+        texts = json.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+        return None
+    return texts
+
+
+def _changes(card: Dict[str, Any], parsed: Dict[str, Any], overwrite_edits: bool = False) -> Dict[str, Any]:
+    """기존 값과 다른 필드만 반환 (사용자가 수정한 필드는 overwrite_edits일 때만 포함)"""
+    protected = set() if overwrite_edits else set(card.get('edited_fields') or [])
+    return {field: parsed.get(field) for field in PARSED_FIELDS
+            if field not in protected and card.get(field) != parsed.get(field)}
+
+
+async def reparse_cards(query: Dict[str, Any], workers: Optional[int], chunk_size: int,
+                        batch_size: int, dry_run: bool, overwrite_edits: bool = False):
+    db = get_database()
+    total = await db.business_cards.count_documents(query)
+    print(f"🚀 재파싱 대상 명함: {total}개 (파서 버전 {PARSER_VERSION}, "
+          f"{'변경 사항 확인만' if dry_run else '업데이트 적용'})")
+    if not total:
+        return
+
+    projection = {field: 1 for field in PARSED_FIELDS}
+    projection['ocr_raw_text'] = 1
+    projection['edited_fields'] = 1
+    cursor = db.business_cards.find(query, projection).batch_size(batch_size)
+
+    loop = asyncio.get_running_loop()
+    executor = create_parse_executor(workers, log_level=logging.ERROR)
+    started = time.perf_counter()
+    processed = skipped = changed = 0
+
+    async def flush(cards: List[Dict[str, Any]]):
+        nonlocal processed, skipped, changed
+        entries = [(card, _load_text_list(card.get('ocr_raw_text'))) for card in cards]
+        parsable = [(card, texts) for card, texts in entries if texts is not None]
+        skipped += len(entries) - len(parsable)
+
+        # parse_many는 동기 제너레이터이므로 이벤트 루프 밖에서 소비
+        results = await loop.run_in_executor(
+            None,
+            lambda: list(parse_many([texts for _, texts in parsable],
+                                    chunk_size=chunk_size, executor=executor))
+        )
+
+        now = datetime.utcnow()
+        operations = []
+        for (card, _), parsed in zip(parsable, results):
+            update = _changes(card, parsed, overwrite_edits)
+            if update:
+                changed += 1
+                update.update(search_fields({**card, **update}))
+                update['updated_at'] = now
+            # 값이 그대로인 명함은 파서 버전만 기록 (updated_at 기준 정렬/페이지가 바뀌지 않도록)
+            update['parser_version'] = PARSER_VERSION
+            operations.append(UpdateOne({"_id": card["_id"]}, {"$set": update}))
+
+        if operations and not dry_run:
+            await db.business_cards.bulk_write(operations, ordered=False)
+
+        processed += len(cards)
+        elapsed = time.perf_counter() - started
+        print(f"   📊 {processed}/{total} ({processed / total * 100:.1f}%) - "
+              f"변경 {changed}, 건너뜀 {skipped}, {processed / elapsed:,.0f} 명함/초")
+
+    try:
+        batch = []
+        async for card in cursor:
+            batch.append(card)
+            if len(batch) >= batch_size:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+    finally:
+        executor.shutdown(wait=True)
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "=" * 60)
+    print(f"✅ 재파싱 완료: {processed}개 처리, {changed}개 변경, {skipped}개 건너뜀")
+    print(f"⏱️  소요 시간: {elapsed:.1f}s ({processed / elapsed if elapsed else 0:,.0f} 명함/초)")
+
+
+async def main():
+    arg_parser = argparse.ArgumentParser(description="business_cards 일괄 재파싱")
+    arg_parser.add_argument('--user-id', help="특정 사용자의 명함만 재파싱")
+    arg_parser.add_argument('--only-stale', action='store_true',
+                            help="현재 파서 버전으로 파싱되지 않은 명함만 처리")
+    arg_parser.add_argument('--workers', type=int, default=None, help="파서 프로세스 수 (기본: CPU 수)")
+    arg_parser.add_argument('--chunk-size', type=int, default=64, help="워커에 한 번에 보낼 명함 수")
+    arg_parser.add_argument('--batch-size', type=int, default=1000, help="MongoDB 읽기/쓰기 묶음 크기")
+    arg_parser.add_argument('--dry-run', action='store_true', help="변경 사항만 집계하고 저장하지 않음")
+    arg_parser.add_argument('--overwrite-edits', action='store_true',
+                            help="사용자가 수정한 필드도 파싱 결과로 덮어씀 (기본: 수정한 필드 유지)")
+    args = arg_parser.parse_args()
+
+    query: Dict[str, Any] = {"processing_status": {"$nin": ["processing", "failed"]}}
+    if args.user_id:
+        query["user_id"] = ObjectId(args.user_id)
+    if args.only_stale:
+        query["parser_version"] = {"$ne": PARSER_VERSION}
+
+    await connect_to_mongo()
+    try:
+        await reparse_cards(query, args.workers, args.chunk_size, max(1, args.batch_size), args.dry_run,
+                            args.overwrite_edits)
+    finally:
+        await close_mongo_connection()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+"""
+테스트 공통 설정
+backend 모듈을 패키지 없이 import 하므로 backend 디렉터리를 경로에 추가하고,
+MongoDB 대신 사용할 메모리 컬렉션을 제공합니다.
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bson import ObjectId  # noqa: E402
+
+
+def _matches_condition(value, condition):
+    if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+        for operator, operand in condition.items():
+            if operator == "$lt" and not (value is not None and value < operand):
+                return False
+            if operator == "$lte" and not (value is not None and value <= operand):
+                return False
+            if operator == "$in" and value not in operand:
+                return False
+            if operator == "$ne" and value == operand:
+                return False
+            if operator == "$nin" and value in operand:
+                return False
+            if operator == "$all" and not set(operand) <= set(value or []):
+                return False
+        return True
+    return value == condition
+
+
+def matches(query, doc):
+    """테스트에서 쓰는 조건($and, $or, $lt, $lte, $in, $ne, $nin, $all, 값 일치)만 해석하는 간단한 매처"""
+    for key, condition in (query or {}).items():
+        if key == "$and":
+            if not all(matches(branch, doc) for branch in condition):
+                return False
+        elif key == "$or":
+            if not any(matches(branch, doc) for branch in condition):
+                return False
+        elif not _matches_condition(doc.get(key), condition):
+            return False
+    return True
+
+
+def apply_update(doc, update):
+    """$set, $inc, $addToSet($each) 적용"""
+    doc.update(update.get("$set", {}))
+    for field, amount in update.get("$inc", {}).items():
+        doc[field] = doc.get(field, 0) + amount
+    for field, value in update.get("$addToSet", {}).items():
+        values = doc.setdefault(field, [])
+        for item in value["$each"] if isinstance(value, dict) else [value]:
+            if item not in values:
+                values.append(item)
+
+
+class FakeCollection:
+    """테스트에 필요한 motor 컬렉션 메서드만 구현한 메모리 컬렉션"""
+
+    def __init__(self):
+        self.docs = []
+
+    async def insert_one(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(dict(doc))
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs):
+        return SimpleNamespace(inserted_ids=[(await self.insert_one(doc)).inserted_id for doc in docs])
+
+    async def find_one(self, query):
+        return next((dict(doc) for doc in self.docs if matches(query, doc)), None)
+
+    async def update_one(self, query, update):
+        for doc in self.docs:
+            if matches(query, doc):
+                apply_update(doc, update)
+                return SimpleNamespace(matched_count=1, modified_count=1)
+        return SimpleNamespace(matched_count=0, modified_count=0)
+
+    async def update_many(self, query, update):
+        matched = [doc for doc in self.docs if matches(query, doc)]
+        for doc in matched:
+            apply_update(doc, update)
+        return SimpleNamespace(matched_count=len(matched), modified_count=len(matched))
+
+    async def find_one_and_update(self, query, update, sort=None, return_document=None):
+        cursor = FakeCursor([doc for doc in self.docs if matches(query, doc)])
+        if sort:
+            cursor.sort(sort)
+        if not cursor.docs:
+            return None
+        doc = cursor.docs[0]
+        before = dict(doc)
+        apply_update(doc, update)
+        # pymongo ReturnDocument.AFTER는 True
+        return dict(doc) if return_document else before
+
+    async def distinct(self, field, query=None):
+        # MongoDB처럼 값이 null인 필드는 None으로 포함 (필드가 없는 문서는 제외)
+        return list({doc[field] for doc in self.docs if field in doc and matches(query, doc)})
+
+    async def create_index(self, *args, **kwargs):
+        return None
+
+    async def count_documents(self, query):
+        return sum(1 for doc in self.docs if matches(query, doc))
+
+    def find(self, query=None, projection=None):
+        return FakeCursor([dict(doc) for doc in self.docs if matches(query, doc)])
+
+    async def bulk_write(self, operations, ordered=True):
+        for operation in operations:
+            for doc in self.docs:
+                if matches(operation._filter, doc):
+                    apply_update(doc, operation._doc)
+
+
+class FakeCursor:
+    """find() 결과 커서 (sort/limit 후 to_list 또는 async for로 순회)"""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def batch_size(self, size):
+        return self
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    def hint(self, index):
+        return self
+
+    async def to_list(self, length=None):
+        return list(self.docs)
+
+    def __aiter__(self):
+        self._iterator = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.business_cards = FakeCollection()
+        self.ocr_jobs = FakeCollection()
+
+
+class FakeGridFS:
+    """작업 큐가 사용하는 GridFS 버킷 메서드만 구현"""
+
+    def __init__(self):
+        self.files = {}
+
+    async def upload_from_stream(self, filename, data, metadata=None):
+        file_id = ObjectId()
+        self.files[file_id] = data
+        return file_id
+
+    async def open_download_stream(self, file_id):
+        data = self.files[file_id]
+
+        class Stream:
+            async def read(self):
+                return data
+
+        return Stream()
+
+    async def delete(self, file_id):
+        del self.files[file_id]
@@ -0,0 +1,67 @@
+"""
+토큰 클레임 기반 사용자 구성 테스트
+user_token_claims로 만든 클레임이 JWT를 거쳐 _user_from_claims로 같은 사용자로 복원되는지,
+클레임이 없는 이전 토큰은 None(DB 조회 경로)이 되는지 확인합니다.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from jose import jwt
+
+import auth
+from auth import _user_from_claims, create_access_token, user_token_claims
+from config import ALGORITHM, SECRET_KEY
+from models import UserInDB
+
+
+@pytest.fixture
+def user():
+    return UserInDB(username="tester", email="tester@example.com", full_name="테스터",
+                    hashed_password="hashed", created_at=datetime(2024, 3, 1, 12, 30, 15, 123456))
+
+
+def _decode(token):
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def test_claims_round_trip_through_jwt(user):
+    payload = _decode(create_access_token(user_token_claims(user)))
+    restored = _user_from_claims(payload)
+
+    assert restored.id == user.id
+    assert restored.username == user.username
+    assert restored.email == user.email
+    assert restored.full_name == user.full_name
+    assert restored.is_active is True
+    # created 클레임은 초 단위
+    assert restored.created_at == user.created_at.replace(microsecond=0)
+    assert restored.hashed_password == ""
+
+
+def test_inactive_user_claim(user):
+    user.is_active = False
+    assert _user_from_claims(user_token_claims(user)).is_active is False
+
+
+@pytest.mark.parametrize("missing", ["uid", "email", "created"])
+def test_legacy_token_without_claims(user, missing):
+    payload = user_token_claims(user)
+    del payload[missing]
+    assert _user_from_claims(payload) is None
+
+
+def test_token_claims_skip_database(user, monkeypatch):
+    monkeypatch.setattr(auth, "AUTH_TRUST_TOKEN_CLAIMS", True)
+    monkeypatch.setattr(auth.user_cache, "get", lambda subject: None)
+    monkeypatch.setattr(auth.user_cache, "set", lambda subject, value: None)
+
+    async def no_database(*args, **kwargs):
+        raise AssertionError("클레임이 있으면 DB를 조회하지 않아야 합니다")
+
+    monkeypatch.setattr(auth, "get_user_by_id", no_database)
+    monkeypatch.setattr(auth, "get_user_by_username", no_database)
+
+    token = create_access_token(user_token_claims(user))
+    assert asyncio.run(auth.get_user_from_token(token)).id == user.id
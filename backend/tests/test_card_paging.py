@@ -0,0 +1,83 @@
+"""
+명함 목록 키셋 페이지네이션 테스트
+커서 인코딩/디코딩과, 같은 created_at을 가진 명함이 있어도 페이지 사이에 빠지거나 중복되지 않는지 확인합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException, Response
+
+import business_card_routes
+from business_card_routes import _decode_cursor, _encode_cursor, get_user_cards
+from models import UserInDB
+
+from conftest import FakeDatabase
+
+BASE = datetime(2024, 5, 1, 9, 30)
+
+
+@pytest.fixture
+def user():
+    return UserInDB(username="tester", email="tester@example.com", hashed_password="x")
+
+
+@pytest.fixture
+def db(monkeypatch, user):
+    database = FakeDatabase()
+    # 3장씩 같은 created_at을 갖도록 구성하여 _id 보조 정렬을 검증
+    for i in range(8):
+        created = BASE + timedelta(minutes=i // 3)
+        asyncio.run(database.business_cards.insert_one({
+            "user_id": user.id, "name": f"명함{i}", "created_at": created, "updated_at": created
+        }))
+    asyncio.run(database.business_cards.insert_one({
+        "user_id": ObjectId(), "name": "다른 사용자", "created_at": BASE, "updated_at": BASE
+    }))
+    monkeypatch.setattr(business_card_routes, "get_database", lambda: database)
+    return database
+
+
+def test_cursor_round_trip():
+    card_id = ObjectId()
+    cursor = _encode_cursor(BASE, card_id)
+
+    assert "=" not in cursor
+    assert _decode_cursor(cursor) == (BASE, card_id)
+    assert _decode_cursor(None) is None
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", _encode_cursor(BASE, ObjectId())[:-4]])
+def test_invalid_cursor_rejected(cursor):
+    with pytest.raises(HTTPException) as error:
+        _decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+def test_pages_cover_all_cards_once(db, user):
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        response = Response()
+        cards = asyncio.run(get_user_cards(response, fields=None, cursor=cursor, limit=3, current_user=user))
+        seen.extend(cards)
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    expected = sorted((doc for doc in db.business_cards.docs if doc["user_id"] == user.id),
+                      key=lambda doc: (doc["created_at"], doc["_id"]), reverse=True)
+    assert pages == 3
+    assert [card.id for card in seen] == [str(doc["_id"]) for doc in expected]
+
+
+def test_unlimited_listing_has_no_cursor(db, user):
+    response = Response()
+    cards = asyncio.run(get_user_cards(response, fields=None, cursor=None, limit=None, current_user=user))
+
+    assert len(cards) == 8
+    assert "X-Next-Cursor" not in response.headers
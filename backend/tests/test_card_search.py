@@ -0,0 +1,72 @@
+import re
+
+import pytest
+from bson import ObjectId
+
+from card_search import build_search_query, search_fields
+
+USER_ID = ObjectId()
+
+CARD = {
+    "user_id": USER_ID,
+    "name": "홍길동",
+    "name_en": "Gildong Hong",
+    "email": "kim1234@example.com",
+    "phone_number": "02-555-7890",
+    "mobile_phone_number": "010-1234-5678",
+    "fax_number": "02-555-7891",
+    "company_name": "카드렛 2024 주식회사",
+    "position": "팀장",
+    "department": "개발팀"
+}
+
+
+def _matches_condition(doc, field, condition):
+    if isinstance(condition, dict) and "$regex" in condition:
+        flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+        value = doc.get(field)
+        return value is not None and re.search(condition["$regex"], str(value), flags) is not None
+    if isinstance(condition, dict) and "$all" in condition:
+        return set(condition["$all"]) <= set(doc.get(field) or [])
+    return doc.get(field) == condition
+
+
+def matches(search_filter, doc):
+    """build_search_query가 만드는 조건($all, $or, $regex)만 해석하는 간단한 매처"""
+    for key, condition in search_filter.items():
+        if key == "$or":
+            if not any(all(_matches_condition(doc, f, c) for f, c in branch.items()) for branch in condition):
+                return False
+        elif not _matches_condition(doc, key, condition):
+            return False
+    return True
+
+
+@pytest.fixture
+def doc():
+    return {**CARD, **search_fields(CARD)}
+
+
+@pytest.mark.parametrize("query", [
+    "홍길동", "길동", "홍", "ㅎㄱㄷ", "gildong", "HONG",
+    "010-1234-5678", "01012345678", "1234 5678", "555-7890",
+    "kim1234", "1234", "2024", "example.com", "개발", "팀장"
+])
+def test_query_finds_card(doc, query):
+    assert matches(build_search_query(USER_ID, query), doc), query
+
+
+@pytest.mark.parametrize("query", ["김철수", "ㅂㅅ", "9999", "010-9999-5678", "other"])
+def test_query_excludes_card(doc, query):
+    assert not matches(build_search_query(USER_ID, query), doc), query
+
+
+def test_digit_query_uses_index_tokens(doc):
+    search_filter = build_search_query(USER_ID, "1234")
+    assert search_filter["search_tokens"] == {"$all": ["p:1234"]}
+    # 전화번호가 아닌 필드(이메일)의 숫자도 색인되어 있어야 함
+    assert "p:1234" in search_fields({"email": "kim1234@example.com"})["search_tokens"]
+
+
+def test_other_users_cards_are_excluded(doc):
+    assert not matches(build_search_query(ObjectId(), "홍길동"), doc)
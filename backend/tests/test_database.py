@@ -0,0 +1,31 @@
+"""
+이전 인덱스 정리 테스트
+대체된 인덱스는 삭제하고, 이미 없는 인덱스는 오류 없이 넘어가는지 확인합니다.
+"""
+
+import asyncio
+
+import pymongo.errors
+
+import database
+
+
+class IndexCollection:
+    def __init__(self, names):
+        self.names = set(names)
+
+    async def drop_index(self, name):
+        if name not in self.names:
+            raise pymongo.errors.OperationFailure("index not found", code=27)
+        self.names.remove(name)
+
+
+def test_drop_legacy_indexes(monkeypatch):
+    cards = IndexCollection(["_id_", "user_id_1_created_at_-1"])
+    monkeypatch.setattr(database.Database, "database", {"business_cards": cards})
+
+    asyncio.run(database.drop_legacy_indexes())
+    # 두 번째 실행에서는 삭제할 인덱스가 없어도 실패하지 않음
+    asyncio.run(database.drop_legacy_indexes())
+
+    assert cards.names == {"_id_"}
@@ -0,0 +1,66 @@
+"""
+휴리스틱 로고 탐지 테스트
+검색 영역 경계(x=w/2, y=h/3)에 걸친 로고도 후보로 잡히는지 확인합니다.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+import logo_extractor
+from logo_extractor import LogoExtractor
+
+WIDTH, HEIGHT = 600, 400
+
+
+@pytest.fixture
+def extractor(tmp_path, monkeypatch):
+    # YOLO 모델 없이 휴리스틱 단계만 사용
+    def unavailable(backend):
+        raise RuntimeError("YOLO 모델 없음")
+
+    monkeypatch.setattr(logo_extractor, "create_logo_detector", unavailable)
+    return LogoExtractor(str(tmp_path))
+
+
+def _card(x1, y1, x2, y2):
+    image = np.full((HEIGHT, WIDTH, 3), 255, dtype=np.uint8)
+    cv2.rectangle(image, (x1, y1), (x2, y2), (40, 40, 40), thickness=-1)
+    return image
+
+
+def _covered(candidates, x1, y1, x2, y2):
+    """후보 사각형들의 합집합이 로고 가로/세로 범위를 덮는지"""
+    left = min(c['bbox'][0] for c in candidates)
+    top = min(c['bbox'][1] for c in candidates)
+    right = max(c['bbox'][2] for c in candidates)
+    bottom = max(c['bbox'][3] for c in candidates)
+    return left <= x1 + 2 and top <= y1 + 2 and right >= x2 - 2 and bottom >= y2 - 2
+
+
+def test_logo_straddling_vertical_center(extractor):
+    # x=w/2(300)에 걸치고 좌/우측 확장 영역에는 들어가지 않는 로고
+    logo = (260, 40, 340, 100)
+    candidates = extractor._detect_logo_heuristic(_card(*logo))
+
+    assert candidates
+    assert _covered(candidates, *logo)
+    for candidate in candidates:
+        x1, y1, x2, y2 = candidate['bbox']
+        assert x2 - x1 >= extractor.min_logo_size[0] and y2 - y1 >= extractor.min_logo_size[1]
+
+
+def test_logo_straddling_top_third(extractor):
+    # y=h/3(133)에 걸치고 좌/우측 확장 영역에는 들어가지 않는 로고
+    logo = (220, 90, 380, 170)
+    candidates = extractor._detect_logo_heuristic(_card(*logo))
+
+    assert candidates
+    assert all(c['bbox'][1] < HEIGHT // 3 for c in candidates)
+
+
+def test_logo_inside_region_keeps_full_bbox(extractor):
+    logo = (40, 30, 140, 110)
+    candidates = extractor._detect_logo_heuristic(_card(*logo))
+
+    assert any(abs(c['bbox'][0] - logo[0]) <= 2 and abs(c['bbox'][2] - logo[2]) <= 2 for c in candidates)
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+
+import business_card_routes
+import logo_store as logo_store_module
+from conftest import FakeDatabase
+from logo_store import LogoStore, perceptual_hash
+from models import BusinessCardCreate, UserInDB
+
+
+def _logo(seed: int) -> np.ndarray:
+    """8x12 블록 무늬 로고 (블록 단위라 축소해도 밝기 순서가 유지됨)"""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(20, 236, size=(8, 12, 3), dtype=np.uint8)
+    return np.repeat(np.repeat(blocks, 8, axis=0), 8, axis=1)
+
+
+def _age(path: str, seconds: float = 3600):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def db(monkeypatch):
+    database = FakeDatabase()
+    monkeypatch.setattr(logo_store_module, "get_database", lambda: database)
+    monkeypatch.setattr(business_card_routes, "get_database", lambda: database)
+    return database
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LogoStore(str(tmp_path / "logos"), hash_distance=4, gc_interval=0, orphan_grace=60)
+
+
+def test_put_dedups_identical_logo(store):
+    image = _logo(1)
+    first_hash, first_path = store.put(image)
+    second_hash, second_path = store.put(image.copy())
+
+    assert first_hash == second_hash == perceptual_hash(image)
+    assert first_path == second_path == store.path_for(first_hash)
+    assert os.path.exists(first_path)
+    assert store.metrics()["stored"] == 1
+    assert store.metrics()["exact_hits"] == 1
+
+
+def test_put_reuses_near_duplicate(store):
+    image = _logo(2)
+    logo_hash, _ = store.put(image)
+    # 밝기만 조금 바뀐 같은 로고는 해밍 거리가 작아 기존 파일 재사용
+    brighter = np.clip(image.astype(np.int16) + 3, 0, 255).astype(np.uint8)
+    assert store.put(brighter)[0] == logo_hash
+    assert store.metrics()["stored"] == 1
+
+
+def test_collect_garbage_keeps_referenced_logos(store, db):
+    kept_hash, kept_path = store.put(_logo(3))
+    _, orphan_path = store.put(_logo(4))
+    for path in (kept_path, orphan_path):
+        _age(path)
+    asyncio.run(db.business_cards.insert_one({"logo_hash": kept_hash}))
+
+    result = asyncio.run(store.collect_garbage())
+
+    assert os.path.exists(kept_path)
+    assert not os.path.exists(orphan_path)
+    assert result["removed"] == 1
+    assert result["files"] == 1
+
+
+def test_collect_garbage_respects_grace_period(store, db):
+    _, fresh_path = store.put(_logo(5))
+    asyncio.run(store.collect_garbage())
+    assert os.path.exists(fresh_path)
+
+
+def test_card_created_with_logo_hash_keeps_logo_through_gc(store, db):
+    logo_hash, logo_path = store.put(_logo(6))
+    _age(logo_path)
+    user = UserInDB(username="tester", email="tester@example.com", hashed_password="x")
+
+    card = asyncio.run(business_card_routes.create_card(
+        BusinessCardCreate(name="홍길동", logo_hash=logo_hash), current_user=user
+    ))
+    asyncio.run(store.collect_garbage())
+
+    assert card.logo_hash == logo_hash
+    assert db.business_cards.docs[0]["logo_hash"] == logo_hash
+    assert os.path.exists(logo_path)
+
+
+def test_card_without_logo_does_not_protect_unhashed_files(store, db):
+    user = UserInDB(username="tester", email="tester@example.com", hashed_password="x")
+    asyncio.run(business_card_routes.create_card(BusinessCardCreate(name="로고 없음"), current_user=user))
+    assert asyncio.run(db.business_cards.distinct("logo_hash")) == [None]
+
+    # 이전 방식 logo_<timestamp>.png와 남은 임시 파일은 해시가 없어 참조될 수 없음
+    os.makedirs(store.root, exist_ok=True)
+    legacy_path = os.path.join(store.root, "logo_1700000000.png")
+    temp_path = os.path.join(store.root, "ab", "abcdef0123456789.webp.123.456.tmp")
+    os.makedirs(os.path.dirname(temp_path), exist_ok=True)
+    for path in (legacy_path, temp_path):
+        with open(path, "wb") as f:
+            f.write(b"old")
+        _age(path)
+
+    result = asyncio.run(store.collect_garbage())
+
+    assert not os.path.exists(legacy_path)
+    assert not os.path.exists(temp_path)
+    assert result["removed"] == 2
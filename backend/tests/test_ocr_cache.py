@@ -0,0 +1,57 @@
+"""
+OCR 결과 캐시 테스트
+전처리 설정이 캐시 키에 반영되는지와, 레거시 /api/ocr 경로(OCR + 로고)가 캐시를 사용하는지 확인합니다.
+"""
+
+import asyncio
+
+import ocr_cache
+from ocr_cache import OCRResultCache, ocr_with_logo_cache
+from ocr_processor import PROCESSOR_SETTINGS, settings_hash
+
+RAW = [([[0, 0], [10, 0], [10, 5], [0, 5]], "홍길동", 0.9),
+       ([[0, 10], [10, 10], [10, 15], [0, 15]], "hong@example.com", 0.8)]
+
+
+class RecordingProcessor:
+    """호출만 기록하는 처리기 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def is_pdf(self, data):
+        return False
+
+    async def process_image_with_logo(self, data, detail=False, deskew=None):
+        self.calls.append("ocr+logo")
+        return {"text": RAW, "logo": {"logo_hash": "0123456789abcdef"}}
+
+    async def extract_logo(self, data):
+        self.calls.append("logo")
+        return {"logo_hash": "0123456789abcdef"}
+
+
+def test_settings_change_cache_key(monkeypatch):
+    assert settings_hash(PROCESSOR_SETTINGS) == settings_hash(dict(PROCESSOR_SETTINGS))
+    for name, value in [("DESKEW_MODE", "boxes"), ("ORIENTATION_MODE", "off"),
+                        ("SKEW_METHOD", "projection"), ("OCR_MAX_IMAGE_SIDE", 1024)]:
+        assert settings_hash({**PROCESSOR_SETTINGS, name: value}) != settings_hash(PROCESSOR_SETTINGS), name
+
+    key = OCRResultCache.make_key(b"card", digest="abc")
+    monkeypatch.setattr(ocr_cache, "PROCESSOR_SETTINGS_HASH",
+                        settings_hash({**PROCESSOR_SETTINGS, "DESKEW_MODE": "boxes"}))
+    assert OCRResultCache.make_key(b"card", digest="abc") != key
+
+
+def test_legacy_ocr_with_logo_uses_cache():
+    cache = OCRResultCache(max_entries=10, enabled=True, mongo_enabled=False)
+    processor = RecordingProcessor()
+
+    first = asyncio.run(ocr_with_logo_cache(processor, b"card", "a.jpg", cache=cache))
+    second = asyncio.run(ocr_with_logo_cache(processor, b"card", "b.jpg", cache=cache))
+
+    assert processor.calls == ["ocr+logo", "logo"]
+    assert first[0] == second[0] == ["홍길동", "hong@example.com"]
+    assert second[1]["name"] == first[1]["name"]
+    assert second[1]["original_filename"] == "b.jpg"
+    assert second[2] == {"logo_hash": "0123456789abcdef"}
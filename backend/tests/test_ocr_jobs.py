@@ -0,0 +1,246 @@
+"""
+OCR 작업 큐 테스트
+임대(claim) → 만료 → 재임대 흐름과, 임대를 잃은 워커의 complete/fail/결과 저장이
+새 워커의 작업과 명함을 건드리지 않는지, 재시도 백오프와 시작 시 복구를 확인합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+
+import ocr_jobs
+import ocr_worker
+from ocr_jobs import JOB_COMPLETED, JOB_FAILED, JOB_QUEUED, JOB_RUNNING, LeaseLostError, OCRJobQueue
+from ocr_worker import OCRWorker, save_ocr_result
+
+from conftest import FakeDatabase, FakeGridFS
+
+
+@pytest.fixture
+def db(monkeypatch):
+    database = FakeDatabase()
+    files = FakeGridFS()
+    database.files = files
+    monkeypatch.setattr(ocr_jobs, "get_database", lambda: database)
+    monkeypatch.setattr(ocr_worker, "get_database", lambda: database)
+    monkeypatch.setattr(OCRJobQueue, "files", property(lambda self: files))
+
+    published = []
+
+    async def publish(user_id, card_id, stage, **fields):
+        published.append((card_id, stage))
+
+    monkeypatch.setattr(ocr_jobs.ocr_event_bus, "publish", publish)
+    monkeypatch.setattr(ocr_worker.ocr_event_bus, "publish", publish)
+    database.published = published
+    return database
+
+
+@pytest.fixture
+def queue():
+    return OCRJobQueue(max_attempts=3, lease_seconds=60, retry_base_seconds=10, retry_max_seconds=25)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def _enqueue(db, queue, processing_card=True):
+    card_id = ObjectId()
+    user_id = ObjectId()
+    run(db.business_cards.insert_one({
+        "_id": card_id, "user_id": user_id, "processing_status": "processing",
+        "name": None, "updated_at": datetime.utcnow()
+    }))
+    job_id = run(queue.enqueue(card_id, user_id, "card.jpg", b"image-bytes"))
+    return job_id, card_id
+
+
+def _job(db, job_id):
+    return run(db.ocr_jobs.find_one({"_id": job_id}))
+
+
+def _expire(db, job_id):
+    for doc in db.ocr_jobs.docs:
+        if doc["_id"] == job_id:
+            doc["lease_expires_at"] = datetime.utcnow() - timedelta(seconds=1)
+
+
+def _reclaim(db, queue, job_id, worker_id):
+    """임대 만료 → 재등록 → 다른 워커가 다시 임대"""
+    _expire(db, job_id)
+    assert run(queue.requeue_expired()) == []
+    return run(queue.claim(worker_id))
+
+
+def test_claim_leases_job_once(db, queue):
+    job_id, _ = _enqueue(db, queue)
+
+    job = run(queue.claim("worker-a"))
+    assert job["_id"] == job_id
+    assert job["status"] == JOB_RUNNING
+    assert job["lease_owner"] == "worker-a"
+    assert job["attempts"] == 1
+    assert job["lease_expires_at"] > datetime.utcnow()
+    assert run(queue.claim("worker-b")) is None
+
+
+def test_extend_lease_only_by_owner(db, queue):
+    _enqueue(db, queue)
+    job = run(queue.claim("worker-a"))
+
+    assert run(queue.extend_lease(job, "worker-a"))
+    assert not run(queue.extend_lease(job, "worker-b"))
+
+
+def test_expired_lease_is_reclaimed(db, queue):
+    job_id, _ = _enqueue(db, queue)
+    stale = run(queue.claim("worker-a"))
+
+    fresh = _reclaim(db, queue, job_id, "worker-b")
+
+    assert fresh["_id"] == job_id
+    assert fresh["lease_owner"] == "worker-b"
+    assert fresh["attempts"] == 2
+    assert not run(queue.extend_lease(stale, "worker-a"))
+
+
+def test_stale_complete_after_reclaim(db, queue):
+    job_id, _ = _enqueue(db, queue)
+    stale = run(queue.claim("worker-a"))
+    fresh = _reclaim(db, queue, job_id, "worker-b")
+
+    with pytest.raises(LeaseLostError):
+        run(queue.complete(stale))
+    # 새 워커가 읽고 있는 원본과 작업 상태는 그대로
+    assert fresh["file_id"] in db.files.files
+    assert _job(db, job_id)["status"] == JOB_RUNNING
+
+    run(queue.complete(fresh))
+    assert _job(db, job_id)["status"] == JOB_COMPLETED
+    assert fresh["file_id"] not in db.files.files
+
+
+def test_stale_fail_after_reclaim(db, queue):
+    job_id, _ = _enqueue(db, queue)
+    stale = run(queue.claim("worker-a"))
+    _reclaim(db, queue, job_id, "worker-b")
+
+    with pytest.raises(LeaseLostError):
+        run(queue.fail(stale, "timeout"))
+    job = _job(db, job_id)
+    assert job["status"] == JOB_RUNNING
+    assert job["lease_owner"] == "worker-b"
+    assert job["last_error"] is None
+
+
+def test_same_worker_reclaim_invalidates_old_lease(db, queue):
+    job_id, _ = _enqueue(db, queue)
+    stale = run(queue.claim("worker-a"))
+    fresh = _reclaim(db, queue, job_id, "worker-a")
+
+    with pytest.raises(LeaseLostError):
+        run(queue.complete(stale))
+    run(queue.complete(fresh))
+    assert _job(db, job_id)["status"] == JOB_COMPLETED
+
+
+def test_retry_backoff_then_final_failure(db, queue):
+    job_id, _ = _enqueue(db, queue)
+
+    delays = []
+    for attempt in range(1, 3):
+        job = run(queue.claim("worker-a"))
+        assert job["attempts"] == attempt
+        before = datetime.utcnow()
+        assert run(queue.fail(job, "OCR 오류")) is False
+        queued = _job(db, job_id)
+        assert queued["status"] == JOB_QUEUED
+        assert queued["last_error"] == "OCR 오류"
+        delays.append((queued["available_at"] - before).total_seconds())
+        # 백오프가 끝난 것으로 간주
+        queued_doc = next(doc for doc in db.ocr_jobs.docs if doc["_id"] == job_id)
+        queued_doc["available_at"] = datetime.utcnow()
+
+    assert delays[0] == pytest.approx(10, abs=1)
+    assert delays[1] == pytest.approx(20, abs=1)
+    assert [queue.retry_delay(n) for n in (1, 2, 3, 4)] == [10, 20, 25, 25]
+
+    job = run(queue.claim("worker-a"))
+    assert run(queue.fail(job, "OCR 오류")) is True
+    assert _job(db, job_id)["status"] == JOB_FAILED
+    assert job["file_id"] not in db.files.files
+
+
+def test_requeue_expired_fails_exhausted_jobs(db, queue):
+    job_id, _ = _enqueue(db, queue)
+    for doc in db.ocr_jobs.docs:
+        doc["attempts"] = 2
+    run(queue.claim("worker-a"))
+    _expire(db, job_id)
+
+    exhausted = run(queue.requeue_expired())
+
+    assert [job["_id"] for job in exhausted] == [job_id]
+    assert _job(db, job_id)["status"] == JOB_FAILED
+
+
+def test_recover_orphans(db, queue):
+    # 재시도를 모두 소진한 채 임대가 만료된 작업
+    exhausted_id, exhausted_card = _enqueue(db, queue)
+    for doc in db.ocr_jobs.docs:
+        doc["attempts"] = 2
+    run(queue.claim("worker-a"))
+    _expire(db, exhausted_id)
+    # 대기 중인 작업이 있는 명함
+    _, active_card = _enqueue(db, queue)
+    # 작업 없이 처리 중으로 남은 오래된 명함
+    orphan_card = ObjectId()
+    run(db.business_cards.insert_one({
+        "_id": orphan_card, "processing_status": "processing",
+        "updated_at": datetime.utcnow() - timedelta(hours=1)
+    }))
+    for doc in db.business_cards.docs:
+        doc["updated_at"] = datetime.utcnow() - timedelta(hours=1)
+
+    recovered = run(queue.recover_orphans())
+
+    assert recovered == {"exhausted_jobs": 1, "orphaned_cards": 1}
+    statuses = {doc["_id"]: doc["processing_status"] for doc in db.business_cards.docs}
+    assert statuses[exhausted_card] == "failed"
+    assert statuses[orphan_card] == "failed"
+    assert statuses[active_card] == "processing"
+
+
+def test_stale_worker_does_not_save_result(db, queue):
+    job_id, card_id = _enqueue(db, queue)
+    stale = run(queue.claim("worker-a"))
+    fresh = _reclaim(db, queue, job_id, "worker-b")
+
+    parsed = {"name": "홍길동", "ocr_raw_text": "[\"홍길동\"]"}
+    with pytest.raises(LeaseLostError):
+        run(save_ocr_result(stale, ["홍길동"], parsed, queue))
+    assert run(db.business_cards.find_one({"_id": card_id}))["processing_status"] == "processing"
+
+    run(save_ocr_result(fresh, ["홍길동"], parsed, queue))
+    card = run(db.business_cards.find_one({"_id": card_id}))
+    assert card["processing_status"] == "completed"
+    assert card["name"] == "홍길동"
+
+
+def test_worker_finish_ignores_lost_lease(db, queue):
+    job_id, card_id = _enqueue(db, queue)
+    stale = run(queue.claim("worker-a"))
+    _reclaim(db, queue, job_id, "worker-b")
+    worker = OCRWorker(queue, ocr_processor=object())
+
+    run(worker._finish(stale, RuntimeError("OCR 오류")))
+    run(worker._finish(stale, None))
+
+    job = _job(db, job_id)
+    assert job["status"] == JOB_RUNNING and job["lease_owner"] == "worker-b"
+    assert job["file_id"] in db.files.files
+    assert run(db.business_cards.find_one({"_id": card_id}))["processing_status"] == "processing"
+    assert db.published == []
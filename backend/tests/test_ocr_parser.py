@@ -0,0 +1,28 @@
+"""
+OCR 파서 동등성 테스트
+tests/fixtures/ocr_parser_baseline.json은 규칙 사전 컴파일 이전 파서(baseline)의 parse 결과이며,
+현재 파서와 parse_many(단일 프로세스/프로세스 풀)가 같은 결과를 내는지 확인합니다.
+"""
+
+import json
+import os
+
+import pytest
+
+from ocr_parser import OCRParser, parse_many
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "ocr_parser_baseline.json")
+
+with open(FIXTURE_PATH, encoding="utf-8") as f:
+    FIXTURES = json.load(f)
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda fixture: " ".join(fixture["texts"][:2]) or "empty")
+def test_parse_matches_baseline(fixture):
+    assert OCRParser().parse(fixture["texts"]) == fixture["expected"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_matches_baseline(workers):
+    results = list(parse_many([fixture["texts"] for fixture in FIXTURES], workers=workers, chunk_size=4))
+    assert results == [fixture["expected"] for fixture in FIXTURES]
@@ -0,0 +1,78 @@
+"""
+일괄 재파싱(reparse_cards.py) 테스트
+값이 그대로인 명함의 updated_at 유지와 사용자가 수정한 필드 보호를 확인합니다.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import reparse_cards
+from ocr_parser import PARSER_VERSION, ocr_parser
+
+from conftest import FakeDatabase
+
+TEXTS = ['홍길동', '대리', '주식회사 테스트', 'hong@example.com', '010-1234-5678']
+EARLIER = datetime(2024, 1, 1)
+
+
+def _card(**fields):
+    card = {field: value for field, value in ocr_parser.parse(TEXTS).items()
+            if field in reparse_cards.PARSED_FIELDS}
+    card.update(ocr_raw_text=json.dumps(TEXTS, ensure_ascii=False), updated_at=EARLIER)
+    card.update(fields)
+    return card
+
+
+def _run(monkeypatch, cards, overwrite_edits=False):
+    db = FakeDatabase()
+    for card in cards:
+        asyncio.run(db.business_cards.insert_one(card))
+    monkeypatch.setattr(reparse_cards, "get_database", lambda: db)
+    # 프로세스 풀 대신 스레드 풀로 같은 parse_many 경로를 실행
+    monkeypatch.setattr(reparse_cards, "create_parse_executor",
+                        lambda workers, log_level=None: ThreadPoolExecutor(1))
+    asyncio.run(reparse_cards.reparse_cards({}, None, 8, 100, False, overwrite_edits))
+    return db.business_cards.docs
+
+
+def test_changes_skips_edited_fields():
+    parsed = {'name': '홍길동', 'email': 'hong@example.com'}
+    card = {'name': '홍길순', 'email': None, 'edited_fields': ['name']}
+
+    assert reparse_cards._changes(card, parsed) == {'email': 'hong@example.com'}
+    assert reparse_cards._changes(card, parsed, overwrite_edits=True) == {
+        'name': '홍길동', 'email': 'hong@example.com'
+    }
+
+
+def test_unchanged_card_keeps_updated_at(monkeypatch):
+    [doc] = _run(monkeypatch, [_card()])
+
+    assert doc['parser_version'] == PARSER_VERSION
+    assert doc['updated_at'] == EARLIER
+
+
+def test_changed_card_updates_updated_at(monkeypatch):
+    [doc] = _run(monkeypatch, [_card(email=None)])
+
+    assert doc['email'] == 'hong@example.com'
+    assert doc['updated_at'] > EARLIER
+    assert doc['search_tokens']
+
+
+def test_user_edits_are_kept_by_default(monkeypatch):
+    [doc] = _run(monkeypatch, [_card(name='홍길순', position=None, edited_fields=['name', 'position'])])
+
+    assert doc['name'] == '홍길순'
+    assert doc['position'] is None
+    assert doc['updated_at'] == EARLIER
+    assert doc['parser_version'] == PARSER_VERSION
+
+
+def test_overwrite_edits_replaces_user_edits(monkeypatch):
+    [doc] = _run(monkeypatch, [_card(name='홍길순', edited_fields=['name'])], overwrite_edits=True)
+
+    assert doc['name'] == '홍길동'
+    assert doc['updated_at'] > EARLIER
@@ -0,0 +1,113 @@
+"""
+업로드 수신 테스트
+receive_uploads가 multipart 본문을 스트리밍으로 읽으며 파일별 해시/제한 검사를 하는지,
+PDF 여부를 파일명이 아니라 시그니처로 판단하는지 확인합니다.
+"""
+
+import asyncio
+import hashlib
+import io
+from typing import List
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from PIL import Image
+
+import upload_ingest
+from upload_ingest import ReceivedUpload, UploadRejected, read_upload, receive_uploads
+
+MAX_BYTES = 64 * 1024
+
+
+def _png(width=40, height=20) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(upload_ingest, "UPLOAD_RETAIN_ORIGINALS", False)
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(files: List[ReceivedUpload] = Depends(receive_uploads("files", max_bytes=MAX_BYTES,
+                                                                           max_pixels=10_000))):
+        results = []
+        for file in files:
+            try:
+                ingested = await read_upload(file)
+                results.append({"filename": file.filename, "sha256": ingested.sha256,
+                                "size": [ingested.width, ingested.height]})
+            except UploadRejected as e:
+                results.append({"filename": file.filename, "status": e.status_code})
+        return results
+
+    return TestClient(app)
+
+
+def test_streamed_files_are_hashed_and_probed(client):
+    first, second = _png(), _png(50, 30)
+
+    response = client.post("/upload", data={"note": "메모"}, files=[
+        ("files", ("a.png", first, "image/png")),
+        ("other", ("ignored.png", b"x" * (MAX_BYTES * 2), "image/png")),
+        ("files", ("b.png", second, "image/png")),
+    ])
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"filename": "a.png", "sha256": hashlib.sha256(first).hexdigest(), "size": [40, 20]},
+        {"filename": "b.png", "sha256": hashlib.sha256(second).hexdigest(), "size": [50, 30]},
+    ]
+
+
+def test_each_file_rejected_on_its_own_limit(client):
+    response = client.post("/upload", files=[
+        ("files", ("big.png", b"\x89PNG" + b"x" * MAX_BYTES, "image/png")),
+        ("files", ("huge.png", _png(200, 200), "image/png")),
+        ("files", ("empty.png", b"", "image/png")),
+        ("files", ("ok.png", _png(), "image/png")),
+    ])
+
+    assert [item.get("status") for item in response.json()] == [413, 413, 400, None]
+
+
+def test_fake_pdf_extension_is_still_probed(client):
+    response = client.post("/upload", files=[("files", ("card.pdf", b"not a pdf", "application/pdf"))])
+
+    assert response.json() == [{"filename": "card.pdf", "status": 400}]
+
+
+def test_pdf_detected_by_signature():
+    ingest = upload_ingest._UploadIngest("card.jpg")
+    ingest.feed(b"%PDF-1.7\n...")
+
+    upload = ingest.finish()
+    assert (upload.width, upload.height) == (None, None)
+
+
+def test_non_multipart_request_rejected(client):
+    assert client.post("/upload", json={"files": []}).status_code == 400
+    assert client.post("/upload", data={"note": "파일 없음"}, files=[("other", ("a.txt", b"x"))]).status_code == 422
+
+
+def test_read_upload_from_upload_file(monkeypatch):
+    monkeypatch.setattr(upload_ingest, "UPLOAD_RETAIN_ORIGINALS", False)
+
+    class Upload:
+        filename = "card.pdf"
+
+        def __init__(self, data):
+            self.stream = io.BytesIO(data)
+
+        async def read(self, size):
+            return self.stream.read(size)
+
+    with pytest.raises(UploadRejected) as rejected:
+        asyncio.run(read_upload(Upload(b"GIF89a-broken"), chunk_size=4))
+    assert rejected.value.status_code == 400
+
+    upload = asyncio.run(read_upload(Upload(_png()), chunk_size=16))
+    assert (upload.width, upload.height) == (40, 20)
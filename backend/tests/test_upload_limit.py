@@ -0,0 +1,92 @@
+"""
+UploadLimitMiddleware 테스트
+Content-Length 없이(chunked) 들어오는 multipart 본문도 제한을 넘으면 413으로 거절되는지 확인합니다.
+"""
+
+import asyncio
+import json
+
+from upload_ingest import UploadLimitMiddleware
+
+LIMIT = 1024
+
+
+async def echo_app(scope, receive, send):
+    """본문을 끝까지 읽고 받은 크기를 돌려주는 앱"""
+    size = 0
+    while True:
+        message = await receive()
+        size += len(message.get("body", b""))
+        if not message.get("more_body"):
+            break
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": str(size).encode()})
+
+
+async def parsing_app(scope, receive, send):
+    """FastAPI처럼 본문 파싱 중 오류를 400 응답으로 바꾸는 앱"""
+    try:
+        while (await receive()).get("more_body"):
+            pass
+    except Exception:
+        await send({"type": "http.response.start", "status": 400, "headers": []})
+        await send({"type": "http.response.body", "body": b"bad body"})
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def _request(app, chunks, content_length=None):
+    headers = [(b"content-type", b"multipart/form-data; boundary=x")]
+    if content_length is not None:
+        headers.append((b"content-length", str(content_length).encode()))
+    scope = {"type": "http", "path": "/api/ocr", "headers": headers}
+    messages = [{"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+                for i, chunk in enumerate(chunks)]
+    received = {"count": 0}
+    sent = []
+
+    async def receive():
+        received["count"] += 1
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(UploadLimitMiddleware(app, max_request_bytes=LIMIT)(scope, receive, send))
+    return sent, received["count"]
+
+
+def test_content_length_over_limit_rejected_before_body():
+    sent, reads = _request(echo_app, [b"x" * 10], content_length=LIMIT + 1)
+
+    assert sent[0]["status"] == 413
+    assert reads == 0
+
+
+def test_chunked_body_over_limit_rejected():
+    sent, reads = _request(echo_app, [b"x" * 512] * 10)
+
+    assert sent[0]["status"] == 413
+    assert "업로드 요청이 너무 큽니다" in json.loads(sent[1]["body"])["detail"]
+    # 제한을 넘은 뒤에는 더 읽지 않음
+    assert reads == 3
+
+
+def test_understated_content_length_rejected():
+    sent, _ = _request(echo_app, [b"x" * 512] * 4, content_length=100)
+
+    assert sent[0]["status"] == 413
+
+
+def test_app_error_response_replaced_with_413():
+    sent, _ = _request(parsing_app, [b"x" * 512] * 4)
+
+    assert [m["status"] for m in sent if m["type"] == "http.response.start"] == [413]
+
+
+def test_body_within_limit_passes_through():
+    sent, _ = _request(echo_app, [b"x" * 256] * 4)
+
+    assert sent[0]["status"] == 200
+    assert sent[1]["body"] == b"1024"
@@ -0,0 +1,396 @@
+"""
+업로드 수신
+업로드 파일을 청크 단위로 비동기 읽기하면서 해시를 계산하고, 크기/픽셀 제한을 조기에 검사합니다.
+원본은 uploads/에 복사하지 않고 메모리의 바이트를 그대로 OCR 파이프라인에 전달하며,
+UPLOAD_RETAIN_ORIGINALS가 설정된 경우에만 디스크에 보관합니다.
+
+업로드 엔드포인트는 File(...) 대신 receive_uploads 의존성으로 multipart 본문을 직접 스트리밍 파싱하므로
+Starlette의 임시 파일(SpooledTemporaryFile)에 전체를 옮겨 두지 않고, 파일별 제한도 수신 중에 검사합니다.
+요청 전체 크기는 UploadLimitMiddleware가 Content-Length로 먼저 검사하여 본문을 받기 전에 거절하고,
+chunked 요청은 받은 바이트를 세어 거절합니다.
+"""
+
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Union
+
+from fastapi import HTTPException, Request, UploadFile
+from PIL import Image
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+    from python_multipart.exceptions import FormParserError
+except ImportError:  # python-multipart 0.0.12 이하
+    from multipart.multipart import MultipartParser, parse_options_header
+    from multipart.exceptions import FormParserError
+
+from config import (
+    UPLOAD_FOLDER,
+    UPLOAD_MAX_BYTES,
+    UPLOAD_MAX_PIXELS,
+    UPLOAD_MAX_REQUEST_BYTES,
+    UPLOAD_READ_CHUNK_BYTES,
+    UPLOAD_RETAIN_ORIGINALS
+)
+
+logger = logging.getLogger(__name__)
+
+# 이미지 헤더(크기 정보) 확인에 필요한 최소 바이트 (JPEG는 EXIF 뒤에 SOF가 오는 경우가 있음)
+_HEADER_PROBE_BYTES = 256 * 1024
+
+
+class UploadRejected(ValueError):
+    """업로드가 크기/픽셀 제한을 넘었거나 이미지로 읽을 수 없는 경우"""
+
+    def __init__(self, message: str, status_code: int = 413):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class RequestTooLarge(Exception):
+    """UploadLimitMiddleware가 요청 본문 수신 중 크기 제한 초과를 앱에 알릴 때 사용"""
+
+    def __init__(self, received: int):
+        super().__init__(f"요청 본문이 제한을 넘었습니다: {received} bytes")
+        self.received = received
+
+
+class IngestedUpload:
+    """수신한 업로드 (원본 바이트 + SHA-256)"""
+
+    __slots__ = ("filename", "data", "sha256", "width", "height")
+
+    def __init__(self, filename: Optional[str], data: bytes, sha256: str,
+                 width: Optional[int] = None, height: Optional[int] = None):
+        self.filename = filename
+        self.data = data
+        self.sha256 = sha256
+        self.width = width
+        self.height = height
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+def _is_pdf(head: bytes) -> bool:
+    """PDF 여부는 파일명이 아니라 시그니처로 판단 (OCRProcessor.is_pdf와 같은 기준)"""
+    return head.startswith(b"%PDF-")
+
+
+def _probe_dimensions(head: bytes) -> Optional[tuple]:
+    """헤더만 읽어 이미지 크기 확인 (픽셀 디코딩 없음). 아직 헤더가 부족하면 None"""
+    try:
+        with Image.open(io.BytesIO(head)) as img:
+            return img.size
+    except Image.DecompressionBombError as e:
+        raise UploadRejected(f"이미지 해상도가 너무 큽니다: {e}") from e
+    except Exception:
+        return None
+
+
+def _check_pixels(size: tuple, filename: Optional[str], max_pixels: int):
+    width, height = size
+    if max_pixels and width * height > max_pixels:
+        raise UploadRejected(
+            f"이미지 해상도가 너무 큽니다 ({width}x{height}, 최대 {max_pixels:,}픽셀): {filename}"
+        )
+
+
+class _UploadIngest:
+    """청크를 받을 때마다 해시 계산 + 크기/픽셀 제한 검사 (제한을 넘으면 UploadRejected)"""
+
+    def __init__(self, filename: Optional[str], max_bytes: int = UPLOAD_MAX_BYTES,
+                 max_pixels: int = UPLOAD_MAX_PIXELS):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        self.hasher = hashlib.sha256()
+        self.buffer = bytearray()
+        self.size = None
+        self.probed = False
+
+    def feed(self, chunk: bytes):
+        self.buffer += chunk
+        self.hasher.update(chunk)
+        if self.max_bytes and len(self.buffer) > self.max_bytes:
+            raise UploadRejected(
+                f"파일이 너무 큽니다 (최대 {self.max_bytes // (1024 * 1024)}MB): {self.filename}"
+            )
+        if not self.probed and len(self.buffer) >= _HEADER_PROBE_BYTES:
+            self.probed = True
+            if not _is_pdf(bytes(self.buffer[:8])):
+                self.size = _probe_dimensions(bytes(self.buffer))
+                if self.size:
+                    _check_pixels(self.size, self.filename, self.max_pixels)
+
+    def finish(self) -> IngestedUpload:
+        if not self.buffer:
+            raise UploadRejected(f"빈 파일입니다: {self.filename}", status_code=400)
+
+        data = bytes(self.buffer)
+        self.buffer = bytearray()
+        if self.size is None and not _is_pdf(data[:8]):
+            self.size = _probe_dimensions(data)
+            if self.size is None:
+                raise UploadRejected(f"이미지 파일을 읽을 수 없습니다: {self.filename}", status_code=400)
+            _check_pixels(self.size, self.filename, self.max_pixels)
+        return IngestedUpload(self.filename, data, self.hasher.hexdigest(), *(self.size or (None, None)))
+
+
+class ReceivedUpload:
+    """receive_uploads가 요청 본문을 읽으며 수신한 파일 (수신 결과 또는 거절 사유)"""
+
+    __slots__ = ("filename", "upload", "error")
+
+    def __init__(self, filename: Optional[str], upload: Optional[IngestedUpload] = None,
+                 error: Optional[UploadRejected] = None):
+        self.filename = filename
+        self.upload = upload
+        self.error = error
+
+
+async def read_upload(file: Union[UploadFile, ReceivedUpload], max_bytes: int = UPLOAD_MAX_BYTES,
+                      max_pixels: int = UPLOAD_MAX_PIXELS,
+                      chunk_size: int = UPLOAD_READ_CHUNK_BYTES) -> IngestedUpload:
+    """업로드를 청크 단위로 읽으며 해시 계산 + 크기/픽셀 제한 검사
+
+    크기 제한은 읽는 도중, 픽셀 제한은 이미지 헤더가 들어오는 즉시 검사하여
+    제한을 넘는 파일은 끝까지 읽지 않고 UploadRejected를 발생시킵니다.
+    receive_uploads로 이미 수신한 파일이면 그 결과(또는 거절 사유)를 그대로 사용합니다.
+    """
+    if isinstance(file, ReceivedUpload):
+        if file.error is not None:
+            raise file.error
+        upload = file.upload
+    else:
+        ingest = _UploadIngest(file.filename, max_bytes, max_pixels)
+        while True:
+            chunk = await file.read(chunk_size)
+            if not chunk:
+                break
+            ingest.feed(chunk)
+        upload = ingest.finish()
+
+    if UPLOAD_RETAIN_ORIGINALS:
+        await retain_original(upload)
+    return upload
+
+
+class _MultipartReceiver:
+    """python-multipart 콜백으로 지정한 필드의 파일 파트를 받는 즉시 검사 (임시 파일 없음)"""
+
+    def __init__(self, field: str, max_bytes: int, max_pixels: int):
+        self.field = field
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        self.received: List[ReceivedUpload] = []
+        self._header_field = b""
+        self._header_value = b""
+        self._headers: Dict[bytes, bytes] = {}
+        self._current: Optional[ReceivedUpload] = None
+        self._ingest: Optional[_UploadIngest] = None
+
+    def callbacks(self) -> Dict[str, Any]:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end
+        }
+
+    def on_part_begin(self):
+        self._headers = {}
+        self._current = None
+        self._ingest = None
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def on_header_end(self):
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", errors="replace")
+        if name != self.field or b"filename" not in options:
+            return  # 다른 필드는 읽고 버림
+        filename = options[b"filename"].decode("utf-8", errors="replace")
+        self._current = ReceivedUpload(filename)
+        self._ingest = _UploadIngest(filename, self.max_bytes, self.max_pixels)
+        self.received.append(self._current)
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if self._ingest is None:
+            return
+        try:
+            self._ingest.feed(data[start:end])
+        except UploadRejected as e:
+            # 거절된 파일의 나머지 바이트는 버퍼에 담지 않음
+            self._current.error = e
+            self._ingest = None
+
+    def on_part_end(self):
+        if self._ingest is None:
+            return
+        try:
+            self._current.upload = self._ingest.finish()
+        except UploadRejected as e:
+            self._current.error = e
+        self._ingest = None
+
+
+def receive_uploads(field: str, max_bytes: int = UPLOAD_MAX_BYTES,
+                    max_pixels: int = UPLOAD_MAX_PIXELS):
+    """multipart 본문을 스트리밍으로 읽는 FastAPI 의존성 생성 (File(...) 대신 사용)
+
+    Starlette 폼 파싱은 파일 전체를 SpooledTemporaryFile(1MB 초과 시 디스크)에 먼저 옮기지만,
+    이 의존성은 본문 청크가 들어오는 대로 파일별 해시/크기/픽셀 검사를 하고
+    통과한 파일만 메모리에 한 번 보관합니다. 반환: field 파일 파트별 ReceivedUpload 목록
+    """
+
+    async def dependency(request: Request) -> List[ReceivedUpload]:
+        content_type, options = parse_options_header(request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in options:
+            raise HTTPException(status_code=400, detail="multipart/form-data 요청이 아닙니다.")
+
+        receiver = _MultipartReceiver(field, max_bytes, max_pixels)
+        parser = MultipartParser(options[b"boundary"], receiver.callbacks())
+        async for chunk in request.stream():
+            try:
+                parser.write(chunk)
+            except FormParserError as e:
+                raise HTTPException(status_code=400, detail=f"잘못된 multipart 요청입니다: {e}")
+        try:
+            parser.finalize()
+        except FormParserError as e:
+            raise HTTPException(status_code=400, detail=f"잘못된 multipart 요청입니다: {e}")
+
+        if not receiver.received:
+            raise HTTPException(status_code=422, detail=f"업로드 파일이 없습니다 ({field})")
+        return receiver.received
+
+    return dependency
+
+
+def upload_openapi(field: str, multiple: bool = True) -> Dict[str, Any]:
+    """receive_uploads를 쓰는 엔드포인트의 multipart 요청 스키마 (문서용 openapi_extra)"""
+    binary = {"type": "string", "format": "binary"}
+    return {"requestBody": {"required": True, "content": {"multipart/form-data": {"schema": {
+        "type": "object",
+        "required": [field],
+        "properties": {field: {"type": "array", "items": binary} if multiple else binary}
+    }}}}}
+
+
+async def retain_original(upload: IngestedUpload, folder: str = UPLOAD_FOLDER) -> str:
+    """원본 보관 (내용 해시 기반 파일명이라 같은 파일은 한 번만 기록)"""
+    extension = os.path.splitext(upload.filename or "")[1].lower()
+    path = os.path.join(folder, f"{upload.sha256}{extension}")
+
+    def write():
+        if os.path.exists(path):
+            return
+        os.makedirs(folder, exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(upload.data)
+        os.replace(temp_path, path)
+
+    try:
+        await asyncio.to_thread(write)
+    except OSError as e:
+        logger.warning(f"업로드 원본 보관 실패 {upload.filename}: {e}")
+    return path
+
+
+class UploadLimitMiddleware:
+    """multipart 요청 전체 크기 제한 (초과 시 413 응답)
+
+    Content-Length가 제한을 넘으면 본문을 받기 전에 거절하고, Content-Length가 없거나(chunked)
+    실제 본문이 더 긴 경우에는 receive로 받은 바이트를 세어 제한을 넘는 즉시 읽기를 중단합니다.
+    """
+
+    def __init__(self, app, max_request_bytes: int = UPLOAD_MAX_REQUEST_BYTES):
+        self.app = app
+        self.max_request_bytes = max_request_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.max_request_bytes:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = headers.get(b"content-length")
+        if content_length:
+            try:
+                declared = int(content_length)
+            except ValueError:
+                declared = 0
+            if declared > self.max_request_bytes:
+                logger.warning(f"⚠️ 업로드 요청 크기 초과: {declared} bytes ({scope.get('path')})")
+                await self._reject(send)
+                return
+
+        received = 0
+        too_large = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_request_bytes:
+                    too_large = True
+                    logger.warning(f"⚠️ 업로드 요청 크기 초과: {received} bytes 이상 수신 ({scope.get('path')})")
+                    raise RequestTooLarge(received)
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            # 크기 초과 후 앱이 만든 오류 응답(본문 파싱 실패 400 등)은 버리고 413으로 대체
+            if too_large and not response_started:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not too_large:
+                raise
+        if too_large and not response_started:
+            await self._reject(send)
+
+    async def _reject(self, send):
+        body = json.dumps({
+            "detail": f"업로드 요청이 너무 큽니다 (최대 {self.max_request_bytes // (1024 * 1024)}MB)"
+        }, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close")
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,97 @@
+"""
+인증 사용자 캐시
+토큰 subject(사용자명)별로 조회한 UserInDB를 짧은 TTL 동안 보관하여
+인증이 필요한 요청마다 발생하던 MongoDB 사용자 조회를 줄입니다.
+
+여러 레플리카 간에는 공유되지 않으므로 사용자 정보 변경 시 invalidate()를 호출하고,
+다른 레플리카에는 TTL(USER_CACHE_TTL_SECONDS)이 지나면 반영됩니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from models import UserInDB
+from config import USER_CACHE_MAX_ENTRIES, USER_CACHE_TTL_SECONDS
+
+
+class UserCache:
+    """크기 제한 + TTL 인메모리 사용자 캐시"""
+
+    def __init__(self, max_entries: int = USER_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = USER_CACHE_TTL_SECONDS):
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, UserInDB]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 지표
+        self._hits = 0
+        self._misses = 0
+        self._claim_hits = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, subject: str) -> Optional[UserInDB]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            item = self._entries.get(subject)
+            if item is not None and item[0] > time.monotonic():
+                self._entries.move_to_end(subject)
+                self._hits += 1
+                return item[1]
+            if item is not None:
+                del self._entries[subject]
+            self._misses += 1
+            return None
+
+    def set(self, subject: str, user: UserInDB):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[subject] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(subject)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def record_claim_hit(self):
+        """DB 조회 없이 토큰 클레임으로 사용자를 구성한 경우"""
+        self._claim_hits += 1
+
+    def invalidate(self, subject: str):
+        """사용자 정보가 바뀌었을 때 해당 사용자 항목 제거"""
+        with self._lock:
+            if self._entries.pop(subject, None) is not None:
+                self._invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        """캐시 적중률 지표 (claim_hits: 캐시 미스였지만 토큰 클레임으로 DB 조회를 생략한 수)"""
+        lookups = self._hits + self._misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "claim_hits": self._claim_hits,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "db_free_rate": (self._hits + self._claim_hits) / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations
+        }
+
+
+# 프로세스 전역 사용자 캐시
+user_cache = UserCache()
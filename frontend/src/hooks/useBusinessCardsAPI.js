@@ -7,6 +7,7 @@ import api from '../utils/api';
 let globalCards = [];
 let globalLoading = false;
 let globalProcessingInterval = null;
+let globalEventSource = null;
 let globalIntervalCount = 0;
 let globalLoadPromise = null;
 const globalListeners = new Set();
@@ -52,6 +53,67 @@ const globalLoadCards = async () => {
   globalLoadPromise = null;
 };
 
+// 명함 한 장만 다시 조회하여 전역 목록에 반영 (전체 목록 재조회 대신)
+const refreshGlobalCard = async (cardId) => {
+  try {
+    const { data } = await api.get(`/api/cards/${cardId}`);
+    updateGlobalState(globalCards.map(card => (card.id === data.id ? data : card)), globalLoading);
+  } catch (error) {
+    console.error('명함 상태 갱신 실패:', error);
+  }
+};
+
+// OCR 진행 상황 스트림(SSE) 연결 - 완료/실패 이벤트를 받은 명함만 갱신
+const openProgressStream = (onAllDone) => {
+  const token = localStorage.getItem('access_token');
+  if (!token || typeof EventSource === 'undefined') {
+    return null;
+  }
+
+  // EventSource는 헤더를 지정할 수 없어 토큰을 쿼리 파라미터로 전달
+  const baseURL = import.meta.env.VITE_API_URL || '';
+  const source = new EventSource(`${baseURL}/api/cards/events?token=${encodeURIComponent(token)}`);
+
+  const settle = async (cardIds) => {
+    await Promise.all(cardIds.map(refreshGlobalCard));
+    if (!globalCards.some(card => card.processing_status === 'processing')) {
+      onAllDone();
+    }
+  };
+
+  source.addEventListener('progress', (event) => {
+    const { card_id: cardId, stage } = JSON.parse(event.data);
+    if (stage === 'done' || stage === 'failed') {
+      settle([cardId]);
+    }
+  });
+
+  // (재)연결 시 서버의 처리 중 목록과 비교하여 연결이 끊긴 사이 끝난 명함 반영
+  source.addEventListener('snapshot', (event) => {
+    const processing = new Set(JSON.parse(event.data).processing);
+    const finished = globalCards
+      .filter(card => card.processing_status === 'processing' && !processing.has(card.id))
+      .map(card => card.id);
+    if (finished.length > 0) {
+      settle(finished);
+    }
+  });
+
+  return source;
+};
+
+// 진행 상황 스트림과 폴링 정리
+const stopProgressUpdates = () => {
+  if (globalEventSource) {
+    globalEventSource.close();
+    globalEventSource = null;
+  }
+  if (globalProcessingInterval) {
+    clearInterval(globalProcessingInterval);
+    globalProcessingInterval = null;
+  }
+};
+
 // MongoDB API를 사용하는 명함 데이터 관리 훅
 export function useBusinessCardsAPI() {
   const [cards, setCards] = useState(globalCards);
@@ -60,7 +122,15 @@ export function useBusinessCardsAPI() {
   const navigate = useNavigate();
   const location = useLocation();
 
-  // 처리 중인 명함들을 주기적으로 체크
+  // 모든 OCR 처리 완료 - 상태 초기화 후 OCR 처리 중 페이지에 있다면 홈으로 이동
+  const handleProcessingDone = () => {
+    setIsUploadingCards(false);
+    if (window.location.pathname === '/ocr-processing') {
+      navigate('/');
+    }
+  };
+
+  // 처리 중인 명함들을 주기적으로 체크 (진행 상황 스트림을 쓸 수 없을 때의 대체 경로)
   const checkProcessingCards = async () => {
     if (!isAuthenticated) return;
     
@@ -101,19 +171,29 @@ export function useBusinessCardsAPI() {
   // 처리 중인 카드 개수 계산 (메모이제이션)
   const processingCardCount = cards.filter(card => card.processing_status === 'processing').length;
 
-  // 전역 interval 관리 - 여러 컴포넌트가 사용해도 하나의 interval만 유지
+  // 전역 진행 상황 구독 관리 - 여러 컴포넌트가 사용해도 하나의 스트림(또는 interval)만 유지
   useEffect(() => {
     if (!isAuthenticated) return;
     
-    // 처리 중인 카드가 있고, 아직 전역 interval이 없을 때만 생성
-    if (processingCardCount > 0 && !globalProcessingInterval) {
-      globalProcessingInterval = setInterval(checkProcessingCards, 5000);
+    // 처리 중인 카드가 있고, 아직 구독 중이 아닐 때만 SSE 연결 (불가능하면 폴링)
+    if (processingCardCount > 0 && !globalEventSource && !globalProcessingInterval) {
+      globalEventSource = openProgressStream(handleProcessingDone);
+      if (globalEventSource) {
+        globalEventSource.onerror = () => {
+          // 일시적 끊김은 EventSource가 자동 재연결하고, 연결이 거부되면(CLOSED) 폴링으로 전환
+          if (globalEventSource && globalEventSource.readyState === EventSource.CLOSED) {
+            globalEventSource = null;
+            globalProcessingInterval = setInterval(checkProcessingCards, 5000);
+          }
+        };
+      } else {
+        globalProcessingInterval = setInterval(checkProcessingCards, 5000);
+      }
     }
     
-    // 처리 중인 카드가 없으면 전역 interval 정리
-    if (processingCardCount === 0 && globalProcessingInterval) {
-      clearInterval(globalProcessingInterval);
-      globalProcessingInterval = null;
+    // 처리 중인 카드가 없으면 구독 정리
+    if (processingCardCount === 0) {
+      stopProgressUpdates();
     }
     
     // 컴포넌트가 사용 중임을 표시
@@ -121,10 +201,9 @@ export function useBusinessCardsAPI() {
     
     return () => {
       globalIntervalCount--;
-      // 마지막 컴포넌트가 언마운트될 때 interval 정리
-      if (globalIntervalCount === 0 && globalProcessingInterval) {
-        clearInterval(globalProcessingInterval);
-        globalProcessingInterval = null;
+      // 마지막 컴포넌트가 언마운트될 때 구독 정리
+      if (globalIntervalCount === 0) {
+        stopProgressUpdates();
       }
     };
   }, [isAuthenticated, processingCardCount]);